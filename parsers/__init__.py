@@ -9,7 +9,12 @@ This package contains modules for extracting and parsing data from various sourc
 
 from .file_parser import extract_text_from_file, get_text_preview, get_text_summary
 from .linkedin_parser import parse_linkedin_profile, validate_linkedin_url
-from .github_parser import parse_github_profile, get_user_stats
+from .github_parser import (
+    parse_github_profile,
+    parse_github_profile_async,
+    parse_github_profiles,
+    get_user_stats
+)
 from .ollama_parser import parse_resume_with_ollama, check_ollama_available, get_available_models
 
 __all__ = [
@@ -19,6 +24,8 @@ __all__ = [
     "parse_linkedin_profile",
     "validate_linkedin_url",
     "parse_github_profile",
+    "parse_github_profile_async",
+    "parse_github_profiles",
     "get_user_stats",
     "parse_resume_with_ollama",
     "check_ollama_available",
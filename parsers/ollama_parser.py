@@ -22,13 +22,62 @@ Expected output format:
 }
 """
 
-import subprocess
+import os
+import time
 import json
 import re
-from typing import Dict, Any, Optional
+import orjson
+import requests
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 
-def parse_resume_with_ollama(raw_text: str, model: str = "mistral") -> Dict[str, Any]:
+# Ollama HTTP API (served by `ollama serve`)
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_GENERATE_URL = f"{OLLAMA_BASE_URL}/api/generate"
+OLLAMA_TAGS_URL = f"{OLLAMA_BASE_URL}/api/tags"
+
+# Model used when none is given
+OLLAMA_DEFAULT_MODEL = "mistral"
+
+# Generation timeout in seconds
+OLLAMA_TIMEOUT = 60
+
+# How long Ollama keeps the model loaded after a request
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Seconds the availability and model-list checks are cached
+OLLAMA_STATUS_TTL = 60
+
+# Timeout in seconds for the availability probe
+OLLAMA_PROBE_TIMEOUT = 2
+
+# Constant parts of the parsing prompt; the resume text goes between them
+_PROMPT_PREFIX = """You are an AI resume parser. Extract key details from the following text and return them as valid JSON with these fields: name, email, phone, education, experience, skills, and achievements. 
+
+Return ONLY valid JSON, no additional text.
+
+Resume Text:
+"""
+_PROMPT_SUFFIX = """
+
+JSON Output:"""
+
+# Markdown fences and chatty preambles the model sometimes wraps JSON in
+_JUNK_RE = re.compile(
+    r"```json|```|Here(?:'s| is) the JSON:|The JSON output is:|"
+    r"The resume information in JSON format:|^json\b",
+    re.I
+)
+
+# Outermost {...} span in the cleaned response
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.S)
+
+# Keep-alive session for Ollama API requests
+_SESSION = requests.Session()
+
+
+def parse_resume_with_ollama(raw_text: str, model: str = OLLAMA_DEFAULT_MODEL) -> Dict[str, Any]:
     """
     Parse resume text using Ollama local LLM.
     
@@ -41,39 +90,34 @@ def parse_resume_with_ollama(raw_text: str, model: str = "mistral") -> Dict[str,
               education, experience, skills, achievements
               
     Raises:
-        ValueError: If Ollama is not installed or model unavailable
-        json.JSONDecodeError: If model output is invalid JSON
+        ValueError: If Ollama is not running, the model is unavailable,
+            or the model output is invalid JSON
     """
     
     if not raw_text or not raw_text.strip():
         return _get_empty_structure()
     
     # Construct the prompt
-    prompt = f"""You are an AI resume parser. Extract key details from the following text and return them as valid JSON with these fields: name, email, phone, education, experience, skills, and achievements. 
-
-Return ONLY valid JSON, no additional text.
-
-Resume Text:
-{raw_text}
-
-JSON Output:"""
+    prompt = _PROMPT_PREFIX + raw_text + _PROMPT_SUFFIX
+    
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "format": "json",
+        "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {"temperature": 0}
+    }
     
     try:
-        # Call Ollama via subprocess
-        result = subprocess.run(
-            ["ollama", "run", model],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        # Call the running Ollama server; format=json constrains output to JSON
+        response = _SESSION.post(OLLAMA_GENERATE_URL, json=payload, timeout=OLLAMA_TIMEOUT)
         
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-            raise ValueError(f"Ollama error: {error_msg}")
+        if response.status_code != 200:
+            raise ValueError(f"Ollama error: {_error_message(response)}")
         
-        # Extract and clean the response
-        response_text = result.stdout.strip()
+        # Extract the generated text
+        response_text = orjson.loads(response.content).get("response", "").strip()
         
         # Parse JSON from response
         structured_data = _extract_json_from_response(response_text)
@@ -83,19 +127,35 @@ JSON Output:"""
         
         return validated_data
         
-    except FileNotFoundError:
+    except requests.exceptions.ConnectionError:
         raise ValueError(
-            "Ollama is not installed or not in PATH. "
-            "Please install Ollama from https://ollama.ai"
+            f"Ollama is not running at {OLLAMA_BASE_URL}. "
+            "Install it from https://ollama.ai and start it with `ollama serve`"
         )
-    except subprocess.TimeoutExpired:
-        raise ValueError("Ollama request timed out (60 seconds)")
+    except requests.exceptions.Timeout:
+        raise ValueError(f"Ollama request timed out ({OLLAMA_TIMEOUT} seconds)")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON from Ollama: {str(e)}")
     except Exception as e:
         raise ValueError(f"Error parsing resume with Ollama: {str(e)}")
 
 
+def _error_message(response: requests.Response) -> str:
+    """
+    Extract the error message from a failed Ollama API response.
+    
+    Args:
+        response (requests.Response): Non-200 API response
+        
+    Returns:
+        str: Error message
+    """
+    try:
+        return response.json().get("error") or response.text
+    except ValueError:
+        return response.text or f"HTTP {response.status_code}"
+
+
 def _extract_json_from_response(response: str) -> Dict[str, Any]:
     """
     Extract JSON from Ollama response, handling various formats.
@@ -110,37 +170,15 @@ def _extract_json_from_response(response: str) -> Dict[str, Any]:
         json.JSONDecodeError: If no valid JSON found
     """
     
-    # Remove common prefixes/suffixes
-    cleaned = response.strip()
-    
-    # Remove common phrases like "Here is the JSON:" or "```json"
-    phrases_to_remove = [
-        "Here is the JSON:",
-        "Here's the JSON:",
-        "```json",
-        "```",
-        "json",
-        "The JSON output is:",
-        "The resume information in JSON format:"
-    ]
-    
-    for phrase in phrases_to_remove:
-        cleaned = cleaned.replace(phrase, "")
-    
-    cleaned = cleaned.strip()
+    # Remove code fences and phrases like "Here is the JSON:" in one pass
+    cleaned = _JUNK_RE.sub("", response.strip()).strip()
     
-    # Try to find JSON object in curly braces
-    # Find first { and last }
-    start_idx = cleaned.find('{')
-    end_idx = cleaned.rfind('}')
+    # Take the span from the first { to the last }
+    match = _JSON_OBJ_RE.search(cleaned)
+    json_str = match.group(0) if match else cleaned
     
-    if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-        json_str = cleaned[start_idx:end_idx + 1]
-    else:
-        json_str = cleaned
-    
-    # Parse JSON
-    parsed = json.loads(json_str)
+    # Parse JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+    parsed = orjson.loads(json_str)
     
     if not isinstance(parsed, dict):
         raise json.JSONDecodeError("Response is not a JSON object", json_str, 0)
@@ -148,57 +186,63 @@ def _extract_json_from_response(response: str) -> Dict[str, Any]:
     return parsed
 
 
+def _to_str(value: Any) -> str:
+    """
+    Normalize a value for a string field; lists are joined with spaces.
+    
+    Args:
+        value: Raw field value
+        
+    Returns:
+        str: Normalized string ("" for empty values)
+    """
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    return str(value).strip() if value else ""
+
+
+def _to_list_str(value: Any) -> List[str]:
+    """
+    Normalize a value for a list field; a single string becomes a one-item list.
+    
+    Args:
+        value: Raw field value
+        
+    Returns:
+        list: Non-empty items as strings
+    """
+    if isinstance(value, list):
+        return [str(item) for item in value if item]
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    return []
+
+
+# Expected resume fields and the normalizer for each
+_SCHEMA = (
+    ("name", _to_str),
+    ("email", _to_str),
+    ("phone", _to_str),
+    ("education", _to_list_str),
+    ("experience", _to_list_str),
+    ("skills", _to_list_str),
+    ("achievements", _to_list_str)
+)
+
+
 def _validate_structure(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate and normalize resume structure, filling missing fields.
     
+    Missing or null fields normalize to "" or [].
+    
     Args:
         data (dict): Parsed data from Ollama
         
     Returns:
         dict: Validated structure with all required fields
     """
-    
-    # Define expected fields with default values
-    expected_fields = {
-        "name": "",
-        "email": "",
-        "phone": "",
-        "education": [],
-        "experience": [],
-        "skills": [],
-        "achievements": []
-    }
-    
-    # Ensure all fields exist and are correct type
-    validated = {}
-    
-    for field, default in expected_fields.items():
-        if field in data:
-            value = data[field]
-            
-            # Normalize list fields
-            if isinstance(default, list):
-                if isinstance(value, list):
-                    # Convert all items to strings
-                    validated[field] = [str(item) for item in value if item]
-                elif isinstance(value, str):
-                    # Convert single string to list
-                    validated[field] = [value] if value.strip() else []
-                else:
-                    validated[field] = []
-            else:
-                # String fields
-                if isinstance(value, list):
-                    # Join list into string
-                    validated[field] = " ".join(str(item) for item in value)
-                else:
-                    validated[field] = str(value).strip() if value else ""
-        else:
-            # Use default value for missing fields
-            validated[field] = default
-    
-    return validated
+    return {field: normalize(data.get(field)) for field, normalize in _SCHEMA}
 
 
 def _get_empty_structure() -> Dict[str, Any]:
@@ -208,65 +252,96 @@ def _get_empty_structure() -> Dict[str, Any]:
     Returns:
         dict: Empty structure
     """
-    return {
-        "name": "",
-        "email": "",
-        "phone": "",
-        "education": [],
-        "experience": [],
-        "skills": [],
-        "achievements": []
-    }
+    return {field: normalize(None) for field, normalize in _SCHEMA}
+
+
+def _status_bucket() -> int:
+    """
+    Index of the current OLLAMA_STATUS_TTL window, used as an lru_cache key.
+    
+    Returns:
+        int: Monotonic time bucket
+    """
+    return int(time.monotonic() // OLLAMA_STATUS_TTL)
 
 
 def check_ollama_available() -> bool:
     """
-    Check if Ollama is installed and available.
+    Check if the Ollama server at OLLAMA_BASE_URL is reachable.
+    
+    The result is cached for OLLAMA_STATUS_TTL seconds.
     
     Returns:
         bool: True if Ollama is available, False otherwise
     """
-    try:
-        result = subprocess.run(
-            ["ollama", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return _fetch_models(_status_bucket()) is not None
 
 
 def get_available_models() -> list:
     """
     Get list of available Ollama models.
     
+    The result is cached for OLLAMA_STATUS_TTL seconds.
+    
     Returns:
         list: Available model names
     """
+    return list(_fetch_models(_status_bucket()) or ())
+
+
+@lru_cache(maxsize=1)
+def _fetch_models(bucket: int) -> Optional[Tuple[str, ...]]:
+    """
+    Query GET /api/tags once per time bucket.
+    
+    Uses the same server and keep-alive session as parsing, so a running
+    CLI with a stopped server (or a remote server without a CLI) is
+    reported correctly.
+    
+    Args:
+        bucket (int): Time bucket from _status_bucket
+        
+    Returns:
+        tuple: Available model names, or None if the server is unreachable
+    """
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        response = _SESSION.get(OLLAMA_TAGS_URL, timeout=OLLAMA_PROBE_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        return tuple(
+            model["name"]
+            for model in orjson.loads(response.content).get("models", [])
+            if model.get("name")
         )
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError, AttributeError, TypeError):
+        return None
+
+
+def prewarm_model(model: str = OLLAMA_DEFAULT_MODEL) -> bool:
+    """
+    Load the model into memory with a one-token request.
+    
+    Args:
+        model (str): Ollama model to load
         
-        if result.returncode != 0:
-            return []
-        
-        # Parse output (format: "NAME     ID     SIZE     MODIFIED")
-        models = []
-        lines = result.stdout.strip().split('\n')[1:]  # Skip header
-        
-        for line in lines:
-            if line.strip():
-                parts = line.split()
-                if parts:
-                    models.append(parts[0])
-        
-        return models
-        
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return []
+    Returns:
+        bool: True if the model responded, False otherwise
+    """
+    payload = {
+        "model": model,
+        "prompt": "ok",
+        "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {"num_predict": 1}
+    }
+    
+    try:
+        response = _SESSION.post(OLLAMA_GENERATE_URL, json=payload, timeout=OLLAMA_TIMEOUT)
+        return response.status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+# Optionally load the model at import so the first parse skips the cold start
+if os.getenv("OLLAMA_PREWARM") == "1":
+    prewarm_model()
@@ -2,15 +2,15 @@
 """
 Example: Using the Resume Export Service
 Demonstrates how to export resumes to PDF, DOCX, and text formats
+
+Run from anywhere with `python unified_backend/example_export_usage.py`;
+the script's own directory is already first on sys.path, so the
+services package resolves without modifying the import path.
 """
 
-import sys
 from pathlib import Path
 from io import BytesIO
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from services.export_service import (
     export_resume_to_pdf,
     export_resume_to_docx,
@@ -21,6 +21,10 @@ from services.export_service import (
 )
 
 
+# Output directory shared by all examples (created once in main)
+EXPORT_DIR = Path("data/exports")
+
+
 # ============================================================================
 # SAMPLE RESUME DATA
 # ============================================================================
@@ -122,8 +126,7 @@ def example_export_to_pdf():
         print(f"   File size: {len(pdf_bytes)} bytes ({len(pdf_bytes)/1024:.2f} KB)")
         
         # Save to file
-        output_path = Path("data/exports") / "jane_smith_resume.pdf"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = EXPORT_DIR / "jane_smith_resume.pdf"
         with open(output_path, 'wb') as f:
             f.write(pdf_bytes)
         print(f"   Saved to: {output_path}")
@@ -148,8 +151,7 @@ def example_export_to_docx():
         print(f"   File size: {len(docx_bytes)} bytes ({len(docx_bytes)/1024:.2f} KB)")
         
         # Save to file
-        output_path = Path("data/exports") / "jane_smith_resume.docx"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = EXPORT_DIR / "jane_smith_resume.docx"
         with open(output_path, 'wb') as f:
             f.write(docx_bytes)
         print(f"   Saved to: {output_path}")
@@ -178,10 +180,9 @@ def example_export_to_text():
         print("-" * 70)
         
         # Save to file
-        output_path = Path("data/exports") / "jane_smith_resume.txt"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(text_content)
+        output_path = EXPORT_DIR / "jane_smith_resume.txt"
+        with open(output_path, 'wb') as f:
+            f.write(text_content.encode('utf-8'))
         print(f"   Saved to: {output_path}")
         
     except Exception as e:
@@ -199,7 +200,7 @@ def example_export_all():
     print("="*70)
     
     try:
-        result = export_resume(SAMPLE_RESUME, export_format="all", output_dir="data/exports")
+        result = export_resume(SAMPLE_RESUME, export_format="all", output_dir=str(EXPORT_DIR))
         
         print(f"✅ All formats exported successfully!")
         print(f"   Timestamp: {result['timestamp']}")
@@ -255,7 +256,7 @@ def example_minimal_resume():
     }
     
     try:
-        result = export_resume(minimal_resume, export_format="all", output_dir="data/exports")
+        result = export_resume(minimal_resume, export_format="all", output_dir=str(EXPORT_DIR))
         print(f"✅ Minimal resume exported successfully!")
         print(f"   Total formats generated: {len([f for f in result['formats'].values() if f.get('generated')])}")
         
@@ -281,7 +282,7 @@ def example_with_ats_scoring():
     
     try:
         # Export all formats
-        result = export_resume(resume_with_score, export_format="all", output_dir="data/exports")
+        result = export_resume(resume_with_score, export_format="all", output_dir=str(EXPORT_DIR))
         
         print(f"✅ Resume with ATS scoring exported!")
         print(f"   ATS Score: {resume_with_score['ats_score']}/100")
@@ -303,7 +304,7 @@ def main():
     print("█"*70)
     
     # Create exports directory
-    export_dir = create_export_dir("data/exports")
+    export_dir = create_export_dir(str(EXPORT_DIR))
     print(f"\n📁 Export directory: {export_dir}")
     
     # Run all examples
@@ -1,8 +1,22 @@
 # Unified Backend - Main FastAPI Application
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.routing import Route
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import anyio.to_thread
+import asyncio
+import contextlib
+import functools
+import atexit
 import logging
+import logging.handlers
+import orjson
+import queue
 import sys
 from pathlib import Path
 
@@ -11,20 +25,205 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import routers
 from routers import resume, optimize, interview, audio
+from services.resume_parser import check_ollama_available
+from services.interview_generator import evaluate_answers_batch
+from services.audio_processor import get_audio_handler, preload_whisper, transcribe_audio_batch
+from utils.batching import MicroBatcher
+from utils.cache import init_cache
+from utils.rate_limit import exempt, install_rate_limiting
+from utils.response_cache import ResponseCacheMiddleware
 from utils.config import (
     API_TITLE,
     API_VERSION,
     API_DESCRIPTION,
+    APP_ENV,
+    PORT,
+    LOG_LEVEL,
+    WEB_CONCURRENCY,
+    IO_POOL_WORKERS,
+    EVAL_BATCH_SIZE,
+    EVAL_BATCH_WAIT_MS,
+    TRANSCRIBE_BATCH_SIZE,
+    TRANSCRIBE_BATCH_WAIT_MS,
+    AUDIO_CLEANUP_INTERVAL,
+    AUDIO_MAX_AGE,
     CORS_ORIGINS,
     CORS_ALLOW_CREDENTIALS,
     CORS_ALLOW_METHODS,
     CORS_ALLOW_HEADERS,
+    CORS_MAX_AGE,
+    RESPONSE_CACHE_POLICIES,
+    COMPRESSION_MIN_SIZE,
+    GZIP_LEVEL,
+    BROTLI_QUALITY,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # gzip only
+    BrotliMiddleware = None
+
+# Configure logging: handlers only enqueue records, and a background
+# listener thread does the formatting and I/O off the event loop
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=LOG_LEVEL, handlers=[logging.handlers.QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Start draining the log queue in the current process.
+    
+    Threads don't survive fork, so a listener started at import would only
+    run in a preloading master; each worker starts its own from lifespan
+    instead.
+    """
+    listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
+# ============================================================================
+# Startup & Shutdown (Lifespan)
+# ============================================================================
+
+# Blocking initializers run once at startup so the first request doesn't pay
+# for them; each entry is (name, callable)
+WARMUP_TASKS = [
+    ("Ollama status", check_ollama_available),
+    ("Whisper models", preload_whisper),
+]
+
+
+async def warm_caches() -> None:
+    """
+    Run WARMUP_TASKS concurrently in the default executor.
+    
+    Failures are logged and never abort startup.
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, task) for _, task in WARMUP_TASKS),
+        return_exceptions=True,
+    )
+    for (name, _), result in zip(WARMUP_TASKS, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Warm-up failed for {name}: {result}")
+
+
+async def periodic_audio_cleanup(interval: int, max_age: int) -> None:
+    """
+    Delete stored audio older than max_age every interval seconds.
+    
+    The directory scan runs in the default executor; errors are logged and
+    the loop keeps going until the task is cancelled.
+    """
+    handler = get_audio_handler()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            deleted = await asyncio.to_thread(handler.cleanup_old_files, max_age)
+        except Exception as e:
+            logger.warning(f"Audio cleanup failed: {e}")
+            continue
+        if deleted:
+            logger.info(f"Audio cleanup removed {deleted} files")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create shared resources on startup and release them on shutdown.
+    """
+    log_listener = start_log_listener()
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info("=" * 70)
+        logger.info(f"🚀 Starting {API_TITLE}")
+        logger.info(f"   Version: {API_VERSION}")
+        logger.info("=" * 70)
+    
+    # Executor for blocking work; it becomes the loop's default executor, so
+    # asyncio.to_thread and run_in_executor(None) use it
+    app.state.io_pool = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix="io")
+    asyncio.get_running_loop().set_default_executor(app.state.io_pool)
+    # Sync endpoints and dependencies run on anyio's worker threads; size that
+    # pool to match
+    anyio.to_thread.current_default_thread_limiter().total_tokens = IO_POOL_WORKERS
+    cache_backend = init_cache()
+    await warm_caches()
+    
+    # Concurrent answer evaluations share one batched LLM call
+    app.state.evaluation_batcher = MicroBatcher(
+        evaluate_answers_batch,
+        max_batch=EVAL_BATCH_SIZE,
+        max_wait_ms=EVAL_BATCH_WAIT_MS,
+        executor=app.state.io_pool,
+    )
+    app.state.evaluation_batcher.start()
+    
+    # Concurrent uploads share one batched Whisper decode
+    app.state.transcription_batcher = MicroBatcher(
+        transcribe_audio_batch,
+        max_batch=TRANSCRIBE_BATCH_SIZE,
+        max_wait_ms=TRANSCRIBE_BATCH_WAIT_MS,
+        executor=app.state.io_pool,
+    )
+    app.state.transcription_batcher.start()
+    
+    # Metrics-only analysis tolerates a smaller, int8 model
+    app.state.fast_transcription_batcher = MicroBatcher(
+        functools.partial(transcribe_audio_batch, precision="int8"),
+        max_batch=TRANSCRIBE_BATCH_SIZE,
+        max_wait_ms=TRANSCRIBE_BATCH_WAIT_MS,
+        executor=app.state.io_pool,
+    )
+    app.state.fast_transcription_batcher.start()
+    
+    # Expired uploads are swept in the background, never on a request path
+    cleanup_task = None
+    if AUDIO_CLEANUP_INTERVAL > 0:
+        cleanup_task = asyncio.create_task(
+            periodic_audio_cleanup(AUDIO_CLEANUP_INTERVAL, AUDIO_MAX_AGE)
+        )
+    
+    if verbose:
+        logger.info(f"✓ Response cache initialized ({cache_backend})")
+        logger.info(f"✓ Executor pool initialized ({IO_POOL_WORKERS} threads)")
+        logger.info(f"✓ Warm-up complete ({len(WARMUP_TASKS)} tasks)")
+        logger.info(f"✓ Answer evaluation batching (up to {EVAL_BATCH_SIZE} per {EVAL_BATCH_WAIT_MS} ms)")
+        logger.info(f"✓ Transcription batching (up to {TRANSCRIBE_BATCH_SIZE} per {TRANSCRIBE_BATCH_WAIT_MS} ms)")
+        if cleanup_task is not None:
+            logger.info(f"✓ Audio cleanup every {AUDIO_CLEANUP_INTERVAL} s (max age {AUDIO_MAX_AGE} s)")
+        logger.info("✓ CORS middleware initialized")
+        logger.info("✓ Resume router loaded")
+        logger.info("✓ Optimize router loaded")
+        logger.info("✓ Interview router loaded")
+        logger.info("✓ Audio router loaded")
+        logger.info("=" * 70)
+        logger.info("📖 API Documentation: http://localhost:8000/docs")
+        logger.info("=" * 70)
+    
+    try:
+        yield
+    finally:
+        if cleanup_task is not None:
+            cleanup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await cleanup_task
+        await app.state.fast_transcription_batcher.stop()
+        await app.state.transcription_batcher.stop()
+        await app.state.evaluation_batcher.stop()
+        app.state.io_pool.shutdown(wait=False, cancel_futures=True)
+        
+        if verbose:
+            logger.info("=" * 70)
+            logger.info(f"🛑 Shutting down {API_TITLE}")
+            logger.info("=" * 70)
+        
+        # Flushes the records still queued
+        log_listener.stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=API_TITLE,
@@ -32,8 +231,19 @@ app = FastAPI(
     description=API_DESCRIPTION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Serve cached/stale responses for upstream-backed endpoints; registered
+# before CORS so CORS headers are still applied to cached responses
+app.add_middleware(ResponseCacheMiddleware, policies=RESPONSE_CACHE_POLICIES)
+
+# Reject clients over their rate limit before any other work is done;
+# registered before CORS so 429s carry CORS headers and preflights, which
+# CORS answers itself, never count against the limit
+install_rate_limiting(app)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -41,49 +251,110 @@ app.add_middleware(
     allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=CORS_ALLOW_METHODS,
     allow_headers=CORS_ALLOW_HEADERS,
+    max_age=CORS_MAX_AGE,
 )
 
+# Compress large responses (falls back to gzip for clients without br)
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=BROTLI_QUALITY, minimum_size=COMPRESSION_MIN_SIZE)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
 
 # ============================================================================
 # Health Check & Info Endpoints
 # ============================================================================
 
+# The payloads below depend only on module-level constants, so they are
+# serialized once at import instead of on every request
+_ROOT_BYTES = orjson.dumps({
+    "status": "healthy",
+    "api_name": API_TITLE,
+    "version": API_VERSION,
+    "description": API_DESCRIPTION,
+    "services": {
+        "resume": "Resume parsing, LinkedIn & GitHub extraction",
+        "optimize": "Resume optimization and ATS scoring",
+        "interview": "Interview question generation and answer evaluation",
+        "audio": "Audio transcription, analysis, and scoring"
+    },
+    "documentation": "/docs",
+    "openapi_schema": "/openapi.json"
+})
+
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "version": API_VERSION,
+    "services": {
+        "resume": "✓ running",
+        "optimize": "✓ running",
+        "interview": "✓ running",
+        "audio": "✓ running"
+    }
+})
+
+_INFO_BYTES = orjson.dumps({
+    "api": API_TITLE,
+    "version": API_VERSION,
+    "description": API_DESCRIPTION,
+    "base_url": "/",
+    "docs": "/docs",
+    "endpoints": {
+        "resume": {
+            "upload": "POST /resume/upload",
+            "linkedin": "POST /resume/linkedin",
+            "github": "POST /resume/github"
+        },
+        "optimize": {
+            "ats_score": "POST /optimize/ats-score",
+            "rewrite": "POST /optimize/rewrite"
+        },
+        "interview": {
+            "questions": "POST /interview/questions",
+            "evaluate_answer": "POST /interview/evaluate-answer"
+        },
+        "audio": {
+            "upload_and_transcribe": "POST /audio/upload-and-transcribe",
+            "analyze": "POST /audio/analyze",
+            "score_answer": "POST /audio/score-answer"
+        }
+    }
+})
+
+
 @app.get("/")
 async def root():
     """
     Root endpoint - API information and available services.
     """
-    return {
-        "status": "healthy",
-        "api_name": API_TITLE,
-        "version": API_VERSION,
-        "description": API_DESCRIPTION,
-        "services": {
-            "resume": "Resume parsing, LinkedIn & GitHub extraction",
-            "optimize": "Resume optimization and ATS scoring",
-            "interview": "Interview question generation and answer evaluation",
-            "audio": "Audio transcription, analysis, and scoring"
-        },
-        "documentation": "/docs",
-        "openapi_schema": "/openapi.json"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
-@app.get("/health")
-async def health_check():
+class HealthCheckApp:
     """
     Health check endpoint for monitoring.
+    
+    A raw ASGI app (no request parsing, dependency resolution or response
+    model), since probes hit it far more often than any other route.
     """
-    return {
-        "status": "healthy",
-        "version": API_VERSION,
-        "services": {
-            "resume": "✓ running",
-            "optimize": "✓ running",
-            "interview": "✓ running",
-            "audio": "✓ running"
-        }
-    }
+    
+    __name__ = "health_check"  # route name used by the rate limiter
+    
+    _headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BYTES)).encode()),
+    ]
+    
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": self._headers})
+        await send({"type": "http.response.body", "body": _HEALTH_BYTES})
+
+
+# First in the route table, so it matches before any other route is tried;
+# monitoring probes are never rate limited
+health_app = HealthCheckApp()
+exempt(health_app)
+app.router.routes.insert(0, Route("/health", endpoint=health_app, methods=["GET"]))
 
 
 @app.get("/info")
@@ -91,133 +362,98 @@ async def api_info():
     """
     Get detailed API information.
     """
-    return {
-        "api": API_TITLE,
-        "version": API_VERSION,
-        "description": API_DESCRIPTION,
-        "base_url": "/",
-        "docs": "/docs",
-        "endpoints": {
-            "resume": {
-                "upload": "POST /resume/upload",
-                "linkedin": "POST /resume/linkedin",
-                "github": "POST /resume/github"
-            },
-            "optimize": {
-                "ats_score": "POST /optimize/ats-score",
-                "rewrite": "POST /optimize/rewrite"
-            },
-            "interview": {
-                "questions": "POST /interview/questions",
-                "evaluate_answer": "POST /interview/evaluate-answer"
-            },
-            "audio": {
-                "upload_and_transcribe": "POST /audio/upload-and-transcribe",
-                "analyze": "POST /audio/analyze",
-                "score_answer": "POST /audio/score-answer"
-            }
-        }
-    }
+    return Response(content=_INFO_BYTES, media_type="application/json")
 
 
 # ============================================================================
 # Include Routers
 # ============================================================================
 
-app.include_router(
-    resume.router,
-    prefix="/resume",
-    tags=["Resume Parsing"],
-    responses={404: {"description": "Not found"}},
-)
-
-app.include_router(
-    optimize.router,
-    prefix="/optimize",
-    tags=["Resume Optimization"],
-    responses={404: {"description": "Not found"}},
-)
-
-app.include_router(
-    interview.router,
-    prefix="/interview",
-    tags=["Interview"],
-    responses={404: {"description": "Not found"}},
-)
-
-app.include_router(
-    audio.router,
-    prefix="/audio",
-    tags=["Audio Processing"],
-    responses={404: {"description": "Not found"}},
-)
+# All feature routers are mounted through one parent router, most-hit first
+api = APIRouter(responses={404: {"description": "Not found"}})
+api.include_router(audio.router, prefix="/audio", tags=["Audio Processing"])
+api.include_router(interview.router, prefix="/interview", tags=["Interview"])
+api.include_router(optimize.router, prefix="/optimize", tags=["Resume Optimization"])
+api.include_router(resume.router, prefix="/resume", tags=["Resume Parsing"])
+app.include_router(api)
 
 
 # ============================================================================
 # Error Handlers
 # ============================================================================
 
+_INTERNAL_ERROR_BYTES = orjson.dumps({
+    "status": "error",
+    "message": "Internal server error",
+    "error_code": "INTERNAL_ERROR"
+})
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc):
+    """
+    Request validation errors (same 422 body as FastAPI's default handler).
+    """
+    return ORJSONResponse(status_code=422, content={"detail": jsonable_encoder(exc.errors())})
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled exceptions.
     """
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "status": "error",
-            "message": "Internal server error",
-            "error_code": "INTERNAL_ERROR"
-        }
+    # Traceback formatting is slow; do it off the event loop
+    asyncio.get_running_loop().run_in_executor(
+        None,
+        functools.partial(logger.error, f"Unhandled exception: {str(exc)}", exc_info=exc),
     )
+    return Response(content=_INTERNAL_ERROR_BYTES, status_code=500, media_type="application/json")
 
 
 # ============================================================================
-# Startup & Shutdown Events
+# Entry Point for Running Locally
 # ============================================================================
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Actions to perform on server startup.
-    """
-    logger.info("=" * 70)
-    logger.info(f"🚀 Starting {API_TITLE}")
-    logger.info(f"   Version: {API_VERSION}")
-    logger.info("=" * 70)
-    logger.info("✓ CORS middleware initialized")
-    logger.info("✓ Resume router loaded")
-    logger.info("✓ Optimize router loaded")
-    logger.info("✓ Interview router loaded")
-    logger.info("✓ Audio router loaded")
-    logger.info("=" * 70)
-    logger.info("📖 API Documentation: http://localhost:8000/docs")
-    logger.info("=" * 70)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
+def _fastest_available(module: str, fallback: str) -> str:
     """
-    Actions to perform on server shutdown.
+    Return the uvicorn loop/http implementation name if installed, else fallback.
     """
-    logger.info("=" * 70)
-    logger.info(f"🛑 Shutting down {API_TITLE}")
-    logger.info("=" * 70)
+    try:
+        __import__(module)
+        return module
+    except ImportError:
+        return fallback
 
 
-# ============================================================================
-# Entry Point for Running Locally
-# ============================================================================
-
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info("Starting Uvicorn server...")
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    # The launcher process logs too, outside any lifespan
+    atexit.register(start_log_listener().stop)
+    
+    server_options = {
+        "host": "0.0.0.0",
+        "port": PORT,
+        # libuv event loop and C HTTP parser when available
+        "loop": _fastest_available("uvloop", "asyncio"),
+        "http": _fastest_available("httptools", "h11"),
+    }
+    
+    if APP_ENV == "production":
+        # WEB_CONCURRENCY worker processes (default 1; see utils/config.py)
+        logger.info(f"Starting Uvicorn server with {WEB_CONCURRENCY} workers...")
+        uvicorn.run(
+            "main:app",
+            workers=WEB_CONCURRENCY,
+            log_level=LOG_LEVEL.lower(),
+            access_log=False,
+            **server_options
+        )
+    else:
+        logger.info("Starting Uvicorn server in development mode...")
+        uvicorn.run(
+            "main:app",
+            reload=True,
+            log_level=LOG_LEVEL.lower(),
+            **server_options
+        )
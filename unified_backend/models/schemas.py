@@ -1,34 +1,57 @@
 # Pydantic Models for Request/Response Schemas
-from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Literal, Optional, List, Dict, Any, Tuple, Union
 from enum import Enum
 
+# ============================================================================
+# Constrained Types
+# ============================================================================
+
+# Cheap regex checks instead of full URL parsing on every request
+LinkedInUrl = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    min_length=10,
+    max_length=512,
+    pattern=r"^https?://([\w-]+\.)*linkedin\.com/(in|company|jobs)/[^/?#\s]+/?([?#]\S*)?$",
+)]
+
+GitHubUsername = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    pattern=r"^[A-Za-z0-9-]{1,39}$",
+)]
+
+# Immutable, closed models for response items built many times per request
+FROZEN_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
+
 # ============================================================================
 # Resume Parsing Models
 # ============================================================================
 
 class LinkedInScrapeRequest(BaseModel):
     """LinkedIn profile scraping request"""
-    profile_url: HttpUrl = Field(..., description="LinkedIn profile URL")
+    profile_url: LinkedInUrl = Field(..., description="LinkedIn profile URL")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "profile_url": "https://linkedin.com/in/john-doe"
             }
         }
+    )
 
 
 class GitHubParseRequest(BaseModel):
     """GitHub profile parsing request"""
-    github_username: str = Field(..., min_length=1, description="GitHub username")
+    github_username: GitHubUsername = Field(..., description="GitHub username")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "github_username": "torvalds"
             }
         }
+    )
 
 
 class ResumeTextSummary(BaseModel):
@@ -73,17 +96,20 @@ class ATSScoringRequest(BaseModel):
     resume_text: str = Field(..., description="Resume content text")
     job_description: str = Field(..., description="Job description text")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "resume_text": "Senior Software Engineer with 5+ years...",
                 "job_description": "We are looking for a software engineer..."
             }
         }
+    )
 
 
 class ATSScoringResponse(BaseModel):
     """ATS scoring response"""
+    model_config = FROZEN_MODEL_CONFIG
+    
     score: float = Field(..., ge=0, le=100, description="ATS score 0-100")
     match_percentage: float = Field(..., ge=0, le=100)
     missing_keywords: List[str] = []
@@ -98,14 +124,15 @@ class ResumeRewriteRequest(BaseModel):
     company_industry: Optional[str] = None
     tone: str = Field(default="professional", description="professional, casual, formal")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "resume_text": "I worked at Google for 3 years...",
                 "job_title": "Product Manager",
                 "tone": "professional"
             }
         }
+    )
 
 
 class ResumeRewriteResponse(BaseModel):
@@ -121,13 +148,45 @@ class ResumeRewriteResponse(BaseModel):
 # Resume Export Models
 # ============================================================================
 
+class Experience(BaseModel):
+    """Work experience entry"""
+    title: str
+    company: str
+    duration: Optional[str] = None
+    description: Union[str, List[str], None] = None
+
+
+class Education(BaseModel):
+    """Education entry"""
+    degree: str
+    school: str
+    field: Optional[str] = None
+    year: Optional[int] = None
+
+
+class ResumeData(BaseModel):
+    """Resume content to export"""
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    summary: Optional[str] = None
+    ats_score: Optional[float] = None
+    match_percentage: Optional[float] = None
+    skills: List[str] = []
+    experience: List[Experience] = []
+    education: List[Education] = []
+    achievements: List[str] = []
+
+
 class ResumeExportRequest(BaseModel):
     """Request for resume export"""
-    resume_data: Dict[str, Any] = Field(..., description="Complete resume data to export")
+    resume_data: ResumeData = Field(..., description="Complete resume data to export")
     export_format: str = Field(default="all", description="pdf, docx, text, or all")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=False,
+        json_schema_extra={
             "example": {
                 "resume_data": {
                     "name": "John Doe",
@@ -155,11 +214,14 @@ class ResumeExportRequest(BaseModel):
                 "export_format": "all"
             }
         }
+    )
 
 
 class ExportFormatInfo(BaseModel):
     """Information about an exported format"""
-    size_bytes: int
+    model_config = FROZEN_MODEL_CONFIG
+    
+    size_bytes: int = 0
     generated: bool
     filepath: Optional[str] = None
     error: Optional[str] = None
@@ -167,8 +229,10 @@ class ExportFormatInfo(BaseModel):
 
 class ResumeExportResponse(BaseModel):
     """Response after exporting resume"""
+    model_config = ConfigDict(defer_build=False)
+    
     status: str
-    formats: Dict[str, Any] = Field(..., description="Export results by format")
+    formats: Dict[str, ExportFormatInfo] = Field(..., description="Export results by format")
     timestamp: str
 
 
@@ -181,24 +245,27 @@ class InterviewQuestionRequest(BaseModel):
     job_title: str = Field(..., description="Job title for questions")
     experience_level: str = Field(default="mid", description="junior, mid, senior")
     num_questions: int = Field(default=5, ge=1, le=20)
-    focus_areas: Optional[List[str]] = None
+    focus_areas: Optional[Tuple[str, ...]] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "job_title": "Senior Software Engineer",
                 "experience_level": "senior",
                 "num_questions": 5
             }
         }
+    )
 
 
 class InterviewQuestion(BaseModel):
     """Single interview question"""
+    model_config = FROZEN_MODEL_CONFIG
+    
     id: int
     question: str
-    category: str  # technical, behavioral, situational
-    difficulty: str  # easy, medium, hard
+    category: Literal["technical", "behavioral", "situational"]
+    difficulty: Literal["easy", "medium", "hard"]
     suggested_points: List[str] = []
 
 
@@ -213,15 +280,16 @@ class AnswerEvaluationRequest(BaseModel):
     """Request for answer evaluation"""
     question: str = Field(..., description="Interview question")
     candidate_answer: str = Field(..., description="Candidate's answer")
-    ideal_points: Optional[List[str]] = None
+    ideal_points: Optional[Tuple[str, ...]] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "question": "Describe a challenging project you worked on",
                 "candidate_answer": "I led a team to build a real-time analytics platform..."
             }
         }
+    )
 
 
 class AnswerEvaluationResponse(BaseModel):
@@ -243,16 +311,19 @@ class AudioProcessingRequest(BaseModel):
     session_id: Optional[str] = None
     process_type: str = Field(..., description="transcription, analysis, scoring")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "process_type": "transcription"
             }
         }
+    )
 
 
 class AudioTranscriptionResponse(BaseModel):
     """Audio transcription response"""
+    model_config = FROZEN_MODEL_CONFIG
+    
     status: str
     session_id: str
     transcription: str
@@ -262,16 +333,20 @@ class AudioTranscriptionResponse(BaseModel):
 
 class AudioAnalysisResponse(BaseModel):
     """Audio analysis response"""
+    model_config = FROZEN_MODEL_CONFIG
+    
     status: str
     session_id: str
     transcript: str
     key_points: List[str]
-    sentiment: str  # positive, neutral, negative
+    sentiment: Literal["positive", "neutral", "negative"]
     clarity_score: float
 
 
 class AudioScoringResponse(BaseModel):
     """Audio scoring response"""
+    model_config = FROZEN_MODEL_CONFIG
+    
     status: str
     session_id: str
     score: float
@@ -0,0 +1,175 @@
+# Shared ingest path for the audio endpoints
+from dataclasses import dataclass
+from typing import Optional
+import asyncio
+import os
+
+import orjson
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import Response
+
+from services.audio_processor import Precision, get_audio_handler
+from utils.batching import MicroBatcher
+from utils.cache import get_cached, set_cached
+from utils.config import (
+    ALLOWED_AUDIO_EXTENSIONS,
+    ALLOWED_AUDIO_EXTENSIONS_TEXT,
+    MAX_CONCURRENT_TRANSCRIBE,
+    SMALL_AUDIO_INLINE,
+    TRANSCRIPTION_CACHE_TTL,
+)
+from utils.errors import error_body, error_response
+
+# Formats ffmpeg can decode from a pipe; m4a may keep its index at the end
+# of the file and needs a seekable input
+_PIPEABLE_FORMATS = frozenset({".wav", ".mp3", ".ogg"})
+
+_ERR_NO_FILENAME = error_body("Filename is missing")
+
+# The handler holds no per-request state, so bind it once
+_AUDIO_HANDLER = get_audio_handler()
+
+# Admission control in front of the transcription batcher
+_transcribe_slots = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIBE)
+_transcribe_waiting = 0
+
+
+@dataclass(slots=True)
+class IngestResult:
+    """A saved upload and, when requested, its transcription."""
+    file_id: str
+    path: str
+    size: int
+    hash: str
+    format: str
+    mime_type: str
+    filename: str
+    transcription: str = ""
+    duration: float = 0.0
+    confidence: float = 0.0
+    queue_depth: int = 0
+
+
+async def _transcribe_cached(
+    batcher: MicroBatcher,
+    path: str,
+    content_hash: str,
+    content: Optional[bytearray] = None,
+    precision: str = "fp16"
+) -> tuple:
+    """
+    Transcribe a saved upload, reusing the result for identical audio bytes.
+    
+    Returns:
+        Tuple of (transcription result, requests that were already waiting
+        for a transcription slot on arrival)
+    """
+    global _transcribe_waiting
+    
+    # Results differ by model, so each precision tier has its own entries
+    cache_key = content_hash if precision == "fp16" else f"{content_hash}:{precision}"
+    cached = await get_cached("transcription", cache_key)
+    if cached is not None:
+        return orjson.loads(cached), 0
+    
+    queue_depth = _transcribe_waiting
+    _transcribe_waiting += 1
+    try:
+        await _transcribe_slots.acquire()
+    finally:
+        _transcribe_waiting -= 1
+    
+    try:
+        # Decode from memory when the upload was kept, skipping the disk read-back
+        result = await batcher.submit(path if content is None else (path, content))
+    finally:
+        _transcribe_slots.release()
+    
+    # Fallback results depend on Whisper being unavailable, so don't keep them
+    if result.get("source") == "whisper":
+        await set_cached("transcription", cache_key, orjson.dumps(result), TRANSCRIPTION_CACHE_TTL)
+    return result, queue_depth
+
+
+def check_upload(file: UploadFile) -> Optional[Response]:
+    """
+    Cheap up-front validation of an upload's filename.
+    
+    Args:
+        file: Uploaded audio file
+        
+    Returns:
+        A 400 response to return as-is, or None if the upload may proceed
+    """
+    if file.filename is None:
+        return error_response(_ERR_NO_FILENAME)
+    
+    file_extension = os.path.splitext(file.filename)[1].lower()
+    if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
+        return error_response(error_body(
+            f"Unsupported format: {file_extension}. Allowed: {ALLOWED_AUDIO_EXTENSIONS_TEXT}"
+        ))
+    
+    return None
+
+
+async def ingest_and_transcribe(
+    file: UploadFile,
+    batcher: Optional[MicroBatcher] = None,
+    *,
+    need_transcript: bool = True,
+    precision: Precision = "fp16",
+    response: Optional[Response] = None
+) -> IngestResult:
+    """
+    Validate, stream to disk, hash and (optionally) transcribe an upload.
+    
+    Args:
+        file: Uploaded audio file
+        batcher: Transcription micro-batcher (required if need_transcript)
+        need_transcript: Whether to transcribe after saving
+        precision: Precision tier of the batcher, used to key the cache
+        response: If given, receives an X-Queue-Depth header with the number
+                  of transcriptions that were waiting for admission
+        
+    Returns:
+        IngestResult for the saved file
+        
+    Raises:
+        HTTPException: 400 if the filename is missing or the file is rejected
+    """
+    if file.filename is None:
+        raise HTTPException(status_code=400, detail="Filename is missing")
+    
+    # Stream to disk, validating format and size on the way
+    keep_in_memory = 0
+    if need_transcript and os.path.splitext(file.filename)[1].lower() in _PIPEABLE_FORMATS:
+        keep_in_memory = SMALL_AUDIO_INLINE
+    try:
+        file_info = await _AUDIO_HANDLER.save_audio_stream(
+            file, file.filename, keep_in_memory=keep_in_memory
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    result = IngestResult(
+        file_id=file_info["file_id"],
+        path=file_info["path"],
+        size=file_info["size_bytes"],
+        hash=file_info["content_hash"],
+        format=file_info["format"],
+        mime_type=file_info["mime_type"],
+        filename=file_info["filename"],
+    )
+    
+    if need_transcript:
+        transcription_result, result.queue_depth = await _transcribe_cached(
+            batcher, result.path, result.hash, file_info["content"], precision
+        )
+        if response is not None:
+            response.headers["X-Queue-Depth"] = str(result.queue_depth)
+        result.transcription = transcription_result.get("transcription", "")
+        result.duration = transcription_result.get("duration", 0.0)
+        result.confidence = transcription_result.get("confidence", 0.0)
+    
+    return result
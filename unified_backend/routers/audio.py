@@ -1,7 +1,10 @@
 # Audio Processing Router - Handles audio upload, transcription, and spoken answer scoring
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Form, Response
 from typing import Optional
-import uuid
+import asyncio
+import orjson
+import re
+import secrets
 
 from models.schemas import (
     AudioTranscriptionResponse,
@@ -10,19 +13,121 @@ from models.schemas import (
 )
 
 from services.audio_processor import (
-    get_audio_handler,
-    transcribe_audio,
-    score_spoken_answer,
+    assess_delivery,
+    combine_spoken_score,
+    score_fallback,
     generate_audio_report,
     assess_clarity,
     assess_pacing,
+    assess_audio_only,
     extract_key_phrases,
 )
 
-from utils.config import ALLOWED_AUDIO_EXTENSIONS
+from utils.batching import MicroBatcher
+from utils.cache import body_key, cache_stats, get_cached, set_cached
+from utils.config import AUDIO_SCORE_CACHE_TTL
+from utils.dependencies import (
+    get_evaluation_batcher,
+    get_fast_transcription_batcher,
+    get_transcription_batcher,
+)
+from utils.errors import error_body, error_response
+
+from ._audio_common import check_upload, ingest_and_transcribe
 
 router = APIRouter()
 
+_ERR_NO_QUESTION = error_body("Question is required")
+_ERR_NO_ROLE = error_body("Role is required")
+_ERR_BAD_LEVEL = error_body("Invalid experience_level")
+_ERR_NO_TRANSCRIPT = error_body("Could not transcribe audio")
+
+# Runs of punctuation and whitespace, collapsed when normalizing transcripts
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _normalize_transcript(transcription: str) -> str:
+    """Lowercase words only, so casing and punctuation variants share a key."""
+    return _NON_WORD_RE.sub(" ", transcription).strip().lower()
+
+
+async def _evaluate_cached(
+    evaluator: MicroBatcher,
+    transcription: str,
+    question: str,
+    role: str,
+    experience_level: str
+) -> dict:
+    """
+    LLM content evaluation, reused across recordings with the same answer.
+    
+    Keyed on the normalized transcript rather than the audio, so a retake
+    whose transcript differs only in casing or punctuation skips the LLM.
+    Heuristic stand-ins for a failed LLM call are returned but not cached.
+    """
+    key = body_key(question, _normalize_transcript(transcription), role, experience_level)
+    cached = await get_cached("answer_eval", key)
+    if cached is not None:
+        return orjson.loads(cached)
+    
+    evaluation = await evaluator.submit({
+        "question": question,
+        "answer": transcription,
+        "role": role,
+        "experience_level": experience_level
+    })
+    if not evaluation.get("is_fallback"):
+        await set_cached("answer_eval", key, orjson.dumps(evaluation), AUDIO_SCORE_CACHE_TTL)
+    return evaluation
+
+
+async def _score_cached(
+    key: str,
+    evaluator: MicroBatcher,
+    transcription: str,
+    question: str,
+    duration_seconds: float,
+    role: str = "Software Engineer",
+    experience_level: str = "mid"
+) -> dict:
+    """
+    Score a spoken answer, reusing the result for identical inputs.
+    
+    The LLM content evaluation goes through the shared evaluation batcher
+    (and its own transcript-keyed cache) while the delivery metrics are
+    computed in a worker thread.
+    """
+    cached = await get_cached("audio_score", key)
+    if cached is not None:
+        return orjson.loads(cached)
+    
+    base_evaluation, delivery = await asyncio.gather(
+        _evaluate_cached(evaluator, transcription, question, role, experience_level),
+        asyncio.to_thread(assess_delivery, transcription, duration_seconds),
+        return_exceptions=True
+    )
+    if isinstance(base_evaluation, Exception) or isinstance(delivery, Exception):
+        # LLM unavailable: keyword scoring over the delivery metrics already
+        # computed (re-derived only if they failed), which isn't worth caching
+        if isinstance(delivery, Exception):
+            delivery = None
+        return await asyncio.to_thread(
+            score_fallback, transcription, question, delivery, duration_seconds
+        )
+    
+    result = combine_spoken_score(
+        transcription,
+        base_evaluation,
+        delivery,
+        experience_level=experience_level,
+        duration_seconds=duration_seconds
+    )
+    
+    # A score built on a heuristic evaluation would pin it for the whole TTL
+    if not base_evaluation.get("is_fallback"):
+        await set_cached("audio_score", key, orjson.dumps(result), AUDIO_SCORE_CACHE_TTL)
+    return result
+
 
 @router.post("/upload")
 async def upload_audio(file: UploadFile = File(...)) -> dict:
@@ -56,42 +161,19 @@ async def upload_audio(file: UploadFile = File(...)) -> dict:
     ```
     """
     try:
-        # Validate file
-        if file.filename is None:
-            raise HTTPException(status_code=400, detail="Filename is missing")
-        
-        # Check extension
-        from pathlib import Path
-        file_extension = Path(file.filename).suffix.lower()
-        
-        if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported format: {file_extension}. Allowed: {', '.join(ALLOWED_AUDIO_EXTENSIONS)}"
-            )
-        
-        # Read file content
-        content = await file.read()
-        
-        # Validate file size
-        audio_handler = get_audio_handler()
-        is_valid, error_msg = audio_handler.validate_audio_file(file.filename, len(content))
-        
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Save file
-        file_info = audio_handler.save_audio_file(content, file.filename)
+        if (rejected := check_upload(file)) is not None:
+            return rejected
+        upload = await ingest_and_transcribe(file, need_transcript=False)
         
         return {
             "status": "success",
             "message": "Audio uploaded successfully",
             "data": {
-                "file_id": file_info["file_id"],
-                "filename": file_info["filename"],
-                "size_bytes": file_info["size_bytes"],
-                "format": file_info["format"],
-                "mime_type": file_info["mime_type"]
+                "file_id": upload.file_id,
+                "filename": upload.filename,
+                "size_bytes": upload.size,
+                "format": upload.format,
+                "mime_type": upload.mime_type
             }
         }
     
@@ -102,7 +184,11 @@ async def upload_audio(file: UploadFile = File(...)) -> dict:
 
 
 @router.post("/transcribe", response_model=AudioTranscriptionResponse)
-async def transcribe_audio_endpoint(file: UploadFile = File(...)) -> AudioTranscriptionResponse:
+async def transcribe_audio_endpoint(
+    response: Response,
+    file: UploadFile = File(...),
+    batcher: MicroBatcher = Depends(get_transcription_batcher)
+) -> AudioTranscriptionResponse:
     """
     Transcribe audio file using Whisper speech-to-text.
     
@@ -132,35 +218,20 @@ async def transcribe_audio_endpoint(file: UploadFile = File(...)) -> AudioTransc
     ```
     """
     try:
-        # Upload and save file
-        if file.filename is None:
-            raise HTTPException(status_code=400, detail="Filename is missing")
-        
-        content = await file.read()
-        
-        # Validate
-        audio_handler = get_audio_handler()
-        is_valid, error_msg = audio_handler.validate_audio_file(file.filename, len(content))
-        
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Save file
-        file_info = audio_handler.save_audio_file(content, file.filename)
-        file_path = file_info["path"]
-        
-        # Transcribe
-        transcription_result = transcribe_audio(file_path)
+        if (rejected := check_upload(file)) is not None:
+            return rejected
+        upload = await ingest_and_transcribe(file, batcher, response=response)
         
         # Generate session ID
-        session_id = f"sess_{uuid.uuid4().hex[:12]}"
+        session_id = f"sess_{secrets.token_hex(6)}"
         
-        return AudioTranscriptionResponse(
+        # Values come from our own pipeline; skip re-validation
+        return AudioTranscriptionResponse.model_construct(
             status="success",
             session_id=session_id,
-            transcription=transcription_result.get("transcription", ""),
-            duration=transcription_result.get("duration", 0.0),
-            confidence=transcription_result.get("confidence", 0.0)
+            transcription=upload.transcription,
+            duration=upload.duration,
+            confidence=upload.confidence
         )
     
     except HTTPException:
@@ -171,8 +242,11 @@ async def transcribe_audio_endpoint(file: UploadFile = File(...)) -> AudioTransc
 
 @router.post("/score", response_model=AudioScoringResponse)
 async def score_spoken_answer_endpoint(
+    response: Response,
     question: str = Form(...),
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    batcher: MicroBatcher = Depends(get_transcription_batcher),
+    evaluator: MicroBatcher = Depends(get_evaluation_batcher)
 ) -> AudioScoringResponse:
     """
     Score a spoken answer to an interview question.
@@ -213,34 +287,22 @@ async def score_spoken_answer_endpoint(
     try:
         # Validate inputs
         if not question:
-            raise HTTPException(status_code=400, detail="Question is required")
-        
-        if file.filename is None:
-            raise HTTPException(status_code=400, detail="Audio file is required")
+            return error_response(_ERR_NO_QUESTION)
         
         # Upload and transcribe
-        content = await file.read()
-        
-        audio_handler = get_audio_handler()
-        is_valid, error_msg = audio_handler.validate_audio_file(file.filename, len(content))
-        
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Save file
-        file_info = audio_handler.save_audio_file(content, file.filename)
-        file_path = file_info["path"]
-        
-        # Transcribe audio
-        transcription_result = transcribe_audio(file_path)
-        transcription = transcription_result.get("transcription", "")
-        duration = transcription_result.get("duration", 0.0)
+        if (rejected := check_upload(file)) is not None:
+            return rejected
+        upload = await ingest_and_transcribe(file, batcher, response=response)
+        transcription = upload.transcription
+        duration = upload.duration
         
         if not transcription:
-            raise HTTPException(status_code=400, detail="Could not transcribe audio")
+            return error_response(_ERR_NO_TRANSCRIPT)
         
         # Score the answer
-        score_result = score_spoken_answer(
+        score_result = await _score_cached(
+            body_key(upload.hash, question),
+            evaluator,
             transcription=transcription,
             question=question,
             duration_seconds=duration
@@ -257,9 +319,10 @@ async def score_spoken_answer_endpoint(
         engagement_score = int(delivery_score)  # Delivery quality = engagement
         
         # Generate session ID
-        session_id = f"sess_{uuid.uuid4().hex[:12]}"
+        session_id = f"sess_{secrets.token_hex(6)}"
         
-        return AudioScoringResponse(
+        # Values come from our own pipeline; skip re-validation
+        return AudioScoringResponse.model_construct(
             status="success",
             session_id=session_id,
             score=overall_score,
@@ -278,13 +341,20 @@ async def score_spoken_answer_endpoint(
 
 @router.post("/analyze")
 async def analyze_audio_endpoint(
-    file: UploadFile = File(...)
+    response: Response,
+    file: UploadFile = File(...),
+    include_transcription: bool = Form(default=True),
+    batcher: MicroBatcher = Depends(get_fast_transcription_batcher)
 ) -> dict:
     """
     Analyze audio for communication quality, clarity, and pacing.
     
     **Parameters:**
     - file: Audio file (.wav, .mp3, .m4a, .ogg)
+    - include_transcription: Transcribe for word-level metrics and key
+      phrases (form, default: true). When false, pacing and clarity are
+      estimated from the waveform alone, much faster; non-WAV input then
+      needs soundfile installed.
     
     **Returns:**
     - status: success/error
@@ -298,31 +368,46 @@ async def analyze_audio_endpoint(
     ```
     """
     try:
-        # Upload and transcribe
-        if file.filename is None:
-            raise HTTPException(status_code=400, detail="Filename is missing")
-        
-        content = await file.read()
-        
-        audio_handler = get_audio_handler()
-        is_valid, error_msg = audio_handler.validate_audio_file(file.filename, len(content))
-        
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Save file
-        file_info = audio_handler.save_audio_file(content, file.filename)
-        file_path = file_info["path"]
-        
-        # Transcribe
-        transcription_result = transcribe_audio(file_path)
-        transcription = transcription_result.get("transcription", "")
-        duration = transcription_result.get("duration", 0.0)
+        if (rejected := check_upload(file)) is not None:
+            return rejected
+        
+        if not include_transcription:
+            upload = await ingest_and_transcribe(file, need_transcript=False)
+            try:
+                metrics = await asyncio.to_thread(assess_audio_only, upload.path)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            return {
+                "status": "success",
+                "message": "Audio analysis complete (waveform only)",
+                "data": {
+                    "clarity_score": metrics["clarity"]["clarity_score"],
+                    "clarity_assessment": metrics["clarity"]["assessment"],
+                    "word_count": metrics["estimated_word_count"],
+                    "pacing_score": metrics["pacing"]["pacing_score"],
+                    "pacing_assessment": metrics["pacing"]["assessment"],
+                    "words_per_minute": metrics["pacing"]["words_per_minute"],
+                    "pause_count": metrics["pause_count"],
+                    "speech_ratio": metrics["speech_ratio"],
+                    "key_phrases": [],
+                    "transcription": None,
+                    "duration_seconds": metrics["duration_seconds"]
+                }
+            }
         
-        # Analyze
-        clarity_metrics = assess_clarity(transcription)
-        pacing_metrics = assess_pacing(transcription, duration)
-        key_phrases = extract_key_phrases(transcription)
+        # Upload and transcribe; word-level metrics only, so the smaller
+        # int8 model is enough
+        upload = await ingest_and_transcribe(file, batcher, precision="int8", response=response)
+        transcription = upload.transcription
+        duration = upload.duration
+        
+        # Analyze (off the event loop)
+        clarity_metrics, pacing_metrics, key_phrases = await asyncio.gather(
+            asyncio.to_thread(assess_clarity, transcription),
+            asyncio.to_thread(assess_pacing, transcription, duration),
+            asyncio.to_thread(extract_key_phrases, transcription),
+        )
         
         return {
             "status": "success",
@@ -349,10 +434,13 @@ async def analyze_audio_endpoint(
 
 @router.post("/interview")
 async def full_interview_endpoint(
+    response: Response,
     question: str = Form(...),
     role: str = Form(default="Software Engineer"),
     experience_level: str = Form(default="mid"),
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    batcher: MicroBatcher = Depends(get_transcription_batcher),
+    evaluator: MicroBatcher = Depends(get_evaluation_batcher)
 ) -> dict:
     """
     Complete voice interview flow: Upload → Transcribe → Score → Report.
@@ -380,39 +468,28 @@ async def full_interview_endpoint(
     try:
         # Validate inputs
         if not question:
-            raise HTTPException(status_code=400, detail="Question is required")
+            return error_response(_ERR_NO_QUESTION)
         
         if not role:
-            raise HTTPException(status_code=400, detail="Role is required")
+            return error_response(_ERR_NO_ROLE)
         
         if experience_level not in ["junior", "mid", "senior"]:
-            raise HTTPException(status_code=400, detail="Invalid experience_level")
-        
-        if file.filename is None:
-            raise HTTPException(status_code=400, detail="Audio file is required")
-        
-        # Process audio
-        content = await file.read()
-        
-        audio_handler = get_audio_handler()
-        is_valid, error_msg = audio_handler.validate_audio_file(file.filename, len(content))
+            return error_response(_ERR_BAD_LEVEL)
         
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Save and transcribe
-        file_info = audio_handler.save_audio_file(content, file.filename)
-        file_path = file_info["path"]
-        
-        transcription_result = transcribe_audio(file_path)
-        transcription = transcription_result.get("transcription", "")
-        duration = transcription_result.get("duration", 0.0)
+        # Upload and transcribe
+        if (rejected := check_upload(file)) is not None:
+            return rejected
+        upload = await ingest_and_transcribe(file, batcher, response=response)
+        transcription = upload.transcription
+        duration = upload.duration
         
         if not transcription:
-            raise HTTPException(status_code=400, detail="Could not transcribe audio")
+            return error_response(_ERR_NO_TRANSCRIPT)
         
         # Score answer
-        score_result = score_spoken_answer(
+        score_result = await _score_cached(
+            body_key(upload.hash, question, role, experience_level),
+            evaluator,
             transcription=transcription,
             question=question,
             role=role,
@@ -421,10 +498,10 @@ async def full_interview_endpoint(
         )
         
         # Generate report
-        report = generate_audio_report(score_result, candidate_name=None)
+        report = await asyncio.to_thread(generate_audio_report, score_result, candidate_name=None)
         
         # Generate session ID
-        session_id = f"sess_{uuid.uuid4().hex[:12]}"
+        session_id = f"sess_{secrets.token_hex(6)}"
         
         return {
             "status": "success",
@@ -436,7 +513,7 @@ async def full_interview_endpoint(
                 "experience_level": experience_level,
                 "report": report,
                 "transcription": transcription,
-                "file_id": file_info["file_id"]
+                "file_id": upload.file_id
             }
         }
     
@@ -444,3 +521,20 @@ async def full_interview_endpoint(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Interview processing failed: {str(e)}")
+
+
+@router.get("/cache/stats")
+async def audio_cache_stats() -> dict:
+    """
+    Hit rates of the transcription and scoring caches.
+    
+    Counters are kept per worker process and reset on restart.
+    
+    **Returns:**
+    - status: success
+    - data: {transcription: {hits, misses, hit_rate}, audio_score: {...}, answer_eval: {...}}
+    """
+    return {
+        "status": "success",
+        "data": cache_stats("transcription", "audio_score", "answer_eval")
+    }
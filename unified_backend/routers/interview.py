@@ -1,6 +1,9 @@
 # Interview Router - Handles interview question generation and answer evaluation
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional, List
+import asyncio
+import re
 import uuid
 
 from models.schemas import (
@@ -13,19 +16,46 @@ from models.schemas import (
 
 from services.interview_generator import (
     generate_questions,
+    generate_questions_with_status,
     generate_default_questions,
     generate_mock_interview_session,
-    evaluate_answer,
     generate_recommendation,
     create_session,
-    save_session,
-    add_question,
+    add_questions_bulk,
     add_answer,
     get_session_progress,
 )
+from utils.batching import MicroBatcher
+from utils.cache import body_key, get_cached, set_cached
+from utils.config import QUESTIONS_CACHE_TTL
+from utils.dependencies import get_evaluation_batcher
+from utils.errors import error_body, error_response
 
 router = APIRouter()
 
+# Question categorization keywords (substring matches, as in "systems"),
+# one alternation so each question is scanned once
+_CATEGORY_RE = re.compile(
+    r"(?P<technical>design|architecture|system)|(?P<behavioral>describe|tell|situation|challenge)",
+    re.IGNORECASE,
+)
+
+
+def _categorize(question_text: str) -> str:
+    """Categorize a question by keywords; technical keywords win ties."""
+    category = "technical"
+    for match in _CATEGORY_RE.finditer(question_text):
+        if match.lastgroup == "technical":
+            return "technical"
+        category = "behavioral"
+    return category
+
+_ERR_BAD_LEVEL = error_body("experience_level must be 'junior', 'mid', or 'senior'")
+_ERR_MISSING_ANSWER = error_body("question and candidate_answer are required")
+_ERR_SHORT_ANSWER = error_body("Answer must be at least 10 characters long")
+_ERR_NO_ROLE = error_body("role is required")
+_ERR_NUM_QUESTIONS = error_body("num_questions must be between 1 and 100")
+
 
 @router.post("/questions", response_model=InterviewQuestionResponse)
 async def generate_interview_questions(request: InterviewQuestionRequest):
@@ -75,13 +105,22 @@ async def generate_interview_questions(request: InterviewQuestionRequest):
     try:
         # Validate experience level
         if request.experience_level not in ["junior", "mid", "senior"]:
-            raise HTTPException(
-                status_code=400,
-                detail="experience_level must be 'junior', 'mid', or 'senior'"
-            )
+            return error_response(_ERR_BAD_LEVEL)
+        
+        # Identical requests are served from the cache
+        cache_key = body_key(
+            request.job_title,
+            request.experience_level,
+            str(request.num_questions),
+            "|".join(request.focus_areas or ()),
+        )
+        cached = await get_cached("questions", cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
         
         # Generate questions using LLM service
-        questions_text: List[str] = generate_questions(
+        questions_text, is_fallback = await asyncio.to_thread(
+            generate_questions_with_status,
             role=request.job_title,
             experience_level=request.experience_level,
             skills=request.focus_areas,
@@ -89,37 +128,35 @@ async def generate_interview_questions(request: InterviewQuestionRequest):
         )
         
         # Convert to InterviewQuestion objects
-        questions_list: List[InterviewQuestion] = []
-        for idx, question_text in enumerate(questions_text, 1):
-            # Categorize question based on keywords
-            category = "technical"
-            if any(word in question_text.lower() for word in ["describe", "tell", "situation", "challenge"]):
-                category = "behavioral"
-            if any(word in question_text.lower() for word in ["design", "architecture", "system"]):
-                category = "technical"
-            
-            # Determine difficulty
-            difficulty = "medium"
-            if request.experience_level == "junior":
-                difficulty = "easy" if idx <= len(questions_text) // 2 else "medium"
-            elif request.experience_level == "senior":
-                difficulty = "hard" if idx > len(questions_text) // 2 else "medium"
-            
-            questions_list.append(
-                InterviewQuestion(
-                    id=idx,
-                    question=question_text,
-                    category=category,
-                    difficulty=difficulty,
-                    suggested_points=[]
-                )
+        mid = len(questions_text) // 2
+        # Difficulty for the first and second half of the list
+        early_difficulty, late_difficulty = {
+            "junior": ("easy", "medium"),
+            "senior": ("medium", "hard"),
+        }.get(request.experience_level, ("medium", "medium"))
+        
+        questions_list: List[InterviewQuestion] = [
+            InterviewQuestion.model_construct(
+                id=idx,
+                question=question_text,
+                category=_categorize(question_text),
+                difficulty=early_difficulty if idx <= mid else late_difficulty,
+                suggested_points=[]
             )
+            for idx, question_text in enumerate(questions_text, 1)
+        ]
         
-        return InterviewQuestionResponse(
+        # Built from validated request fields and our own categorization, so
+        # validation is skipped both here and for the response_model
+        body = InterviewQuestionResponse.model_construct(
             status="success",
             job_title=request.job_title,
             questions=questions_list
-        )
+        ).model_dump_json().encode()
+        # Template questions from a failed LLM call would be pinned for the TTL
+        if not is_fallback:
+            await set_cached("questions", cache_key, body, QUESTIONS_CACHE_TTL)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -130,7 +167,10 @@ async def generate_interview_questions(request: InterviewQuestionRequest):
 
 
 @router.post("/evaluate-answer", response_model=AnswerEvaluationResponse)
-async def evaluate_candidate_answer(request: AnswerEvaluationRequest):
+async def evaluate_candidate_answer(
+    request: AnswerEvaluationRequest,
+    batcher: MicroBatcher = Depends(get_evaluation_batcher)
+):
     """
     Evaluate a candidate's answer to an interview question.
     
@@ -172,34 +212,28 @@ async def evaluate_candidate_answer(request: AnswerEvaluationRequest):
     try:
         # Validate input
         if not request.question or not request.candidate_answer:
-            raise HTTPException(
-                status_code=400,
-                detail="question and candidate_answer are required"
-            )
+            return error_response(_ERR_MISSING_ANSWER)
         
         if len(request.candidate_answer.strip()) < 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Answer must be at least 10 characters long"
-            )
+            return error_response(_ERR_SHORT_ANSWER)
         
-        # Evaluate using LLM service
-        evaluation_result: dict = evaluate_answer(
-            question=request.question,
-            answer=request.candidate_answer,
-            role="Software Engineer",
-            experience_level="mid"
-        )
+        # Evaluate using LLM service, batched with concurrent requests
+        evaluation_result: dict = await batcher.submit({
+            "question": request.question,
+            "answer": request.candidate_answer,
+            "role": "Software Engineer",
+            "experience_level": "mid",
+        })
         
         # Extract and structure response
-        return AnswerEvaluationResponse(
+        return ORJSONResponse(content=AnswerEvaluationResponse(
             status="success",
             score=float(evaluation_result.get("score", 0)),
             feedback=evaluation_result.get("feedback", "No feedback available"),
             strengths=evaluation_result.get("strengths", []),
             areas_for_improvement=evaluation_result.get("weaknesses", []),
             suggestions=evaluation_result.get("suggestions", [])
-        )
+        ).model_dump(mode="json"))
     except HTTPException:
         raise
     except Exception as e:
@@ -252,45 +286,37 @@ async def create_mock_interview_session(
     try:
         # Validate inputs
         if not role:
-            raise HTTPException(status_code=400, detail="role is required")
+            return error_response(_ERR_NO_ROLE)
         
         if experience_level not in ["junior", "mid", "senior"]:
-            raise HTTPException(
-                status_code=400,
-                detail="experience_level must be 'junior', 'mid', or 'senior'"
-            )
+            return error_response(_ERR_BAD_LEVEL)
         
         if num_questions < 1 or num_questions > 100:
-            raise HTTPException(
-                status_code=400,
-                detail="num_questions must be between 1 and 100"
-            )
+            return error_response(_ERR_NUM_QUESTIONS)
         
         # Generate mock session
-        session_id = str(uuid.uuid4())
-        
-        # Create session in store
-        session_data = create_session(
-            session_id=session_id,
-            role=role,
-            experience_level=experience_level,
-            skills=skills
-        )
+        session_id = uuid.uuid4().hex
         
-        # Generate questions
-        questions = generate_questions(
-            role=role,
-            experience_level=experience_level,
-            skills=skills,
-            num_questions=num_questions
+        # Create session in store while the questions are generated
+        _, questions = await asyncio.gather(
+            asyncio.to_thread(
+                create_session,
+                session_id=session_id,
+                role=role,
+                experience_level=experience_level,
+                skills=skills
+            ),
+            asyncio.to_thread(
+                generate_questions,
+                role=role,
+                experience_level=experience_level,
+                skills=skills,
+                num_questions=num_questions
+            )
         )
         
-        # Add questions to session
-        for question in questions:
-            add_question(session_id, question)
-        
-        # Save session
-        save_session(session_id, session_data)
+        # Add questions to session in one write
+        await asyncio.to_thread(add_questions_bulk, session_id, questions)
         
         return {
             "status": "success",
@@ -1,10 +1,10 @@
 # Optimize Router - Handles resume optimization and ATS scoring
-from fastapi import APIRouter, HTTPException
-from pathlib import Path
-import sys
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from itertools import islice
+import re
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import orjson
 
 from models.schemas import (
     ATSScoringRequest,
@@ -16,9 +16,18 @@ from services.resume_optimizer import (
     perform_complete_resume_analysis,
     calculate_keyword_match_score,
 )
+from utils.cache import body_key, get_cached, set_cached
+from utils.config import ATS_CACHE_TTL, RATE_LIMIT_LLM
+from utils.rate_limit import limiter
 
 router = APIRouter()
 
+# Scanned in place so large resumes aren't lowered or split into a list
+_IMPROVED_RE = re.compile(r"improved", re.IGNORECASE)
+_WORD_RE = re.compile(r"\S+")
+# Resumes with fewer words than this get a "more detail" suggestion
+MIN_RESUME_WORDS = 50
+
 
 @router.post("/ats-score", response_model=ATSScoringResponse)
 async def calculate_ats(request: ATSScoringRequest):
@@ -49,6 +58,12 @@ async def calculate_ats(request: ATSScoringRequest):
     }
     ```
     """
+    # Identical (resume, job description) pairs are served from the cache
+    cache_key = body_key(request.resume_text, request.job_description)
+    cached = await get_cached("ats", cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     try:
         # Calculate keyword match score
         keyword_result = calculate_keyword_match_score(
@@ -70,7 +85,7 @@ async def calculate_ats(request: ATSScoringRequest):
         recommendations.append("Include quantified achievements")
         recommendations.append("Match job requirements structure")
         
-        return ATSScoringResponse(
+        response = ATSScoringResponse(
             score=int(keyword_result.get('keyword_match_score', 0)),
             match_percentage=float(keyword_result.get('match_percentage', 0)),
             missing_keywords=keyword_result.get('missing_keywords', []),
@@ -84,10 +99,15 @@ async def calculate_ats(request: ATSScoringRequest):
         raise HTTPException(status_code=400, detail=f"Missing GROQ_API_KEY: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"ATS scoring error: {str(e)}")
+    
+    body = response.model_dump_json().encode()
+    await set_cached("ats", cache_key, body, ATS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/rewrite", response_model=ResumeRewriteResponse)
-async def rewrite_resume_endpoint(request: ResumeRewriteRequest):
+@limiter.limit(RATE_LIMIT_LLM)
+async def rewrite_resume_endpoint(request: Request, response: Response, payload: ResumeRewriteRequest):
     """
     Rewrite resume to optimize for specific job or industry.
     
@@ -120,34 +140,33 @@ async def rewrite_resume_endpoint(request: ResumeRewriteRequest):
     ```
     """
     try:
-        original_length = len(request.resume_text)
+        # No transformation is applied, so both lengths are the same
+        rewritten = payload.resume_text
+        original_length = rewritten_length = len(rewritten)
         improvements = []
         
         # Add improvements based on target
-        if request.job_title:
-            improvements.append(f"Aligned with {request.job_title} requirements")
+        if payload.job_title:
+            improvements.append(f"Aligned with {payload.job_title} requirements")
         
-        if request.company_industry:
-            improvements.append(f"Optimized for {request.company_industry} industry")
-        
-        # Basic rewriting improvements
-        rewritten = request.resume_text
+        if payload.company_industry:
+            improvements.append(f"Optimized for {payload.company_industry} industry")
         
         # Check for improvements
-        if "improved" not in rewritten.lower():
+        if not _IMPROVED_RE.search(rewritten):
             improvements.append("Restructured experience section")
         
-        if len(rewritten.split()) < 50:
+        # Stop counting once the threshold is reached
+        word_count = sum(1 for _ in islice(_WORD_RE.finditer(rewritten), MIN_RESUME_WORDS))
+        if word_count < MIN_RESUME_WORDS:
             improvements.append("Expanded bullet points with more detail")
         
         improvements.extend([
             "Enhanced action verbs",
             "Emphasized quantified achievements",
-            f"Applied {request.tone} tone"
+            f"Applied {payload.tone} tone"
         ])
         
-        rewritten_length = len(rewritten)
-        
         return ResumeRewriteResponse(
             status="success",
             original_length=original_length,
@@ -192,9 +211,8 @@ async def analyze_resume(request: ATSScoringRequest):
     try:
         # Try to parse resume_text as JSON (resume data structure)
         try:
-            import json
-            resume_data = json.loads(request.resume_text)
-        except:
+            resume_data = orjson.loads(request.resume_text)
+        except orjson.JSONDecodeError:
             # If not JSON, treat as plain text
             resume_data = {
                 "text": request.resume_text,
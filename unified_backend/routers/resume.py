@@ -1,13 +1,13 @@
 # Resume Router - Handles resume parsing, upload, and analysis
-from fastapi import APIRouter, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import APIRouter, File, UploadFile, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+import asyncio
 import os
-import shutil
 from pathlib import Path
-import sys
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import aiofiles
 
 # Import parser functions from services
 from services.resume_parser import (
@@ -15,7 +15,7 @@ from services.resume_parser import (
     get_text_preview,
     get_text_summary,
     parse_linkedin_profile,
-    parse_github_profile,
+    parse_github_profile_async,
     parse_resume_with_ollama,
     check_ollama_available
 )
@@ -25,12 +25,14 @@ from services.export_service import (
     export_resume_to_pdf,
     export_resume_to_docx,
     export_resume_to_text,
-    export_resume,
+    write_resume_docx,
+    export_resume_async,
     create_export_dir,
     generate_filename
 )
 
-from utils.config import SAMPLES_DIR, ALLOWED_RESUME_EXTENSIONS
+from utils.config import SAMPLES_DIR, ALLOWED_RESUME_EXTENSIONS, MAX_RESUME_SIZE, RATE_LIMIT_UPLOAD
+from utils.rate_limit import limiter
 from models.schemas import (
     FileUploadResponse,
     LinkedInScrapeRequest,
@@ -42,14 +44,38 @@ from models.schemas import (
 
 router = APIRouter()
 
+# Read size when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Exports up to this size are spooled in memory before spilling to a temp file
+EXPORT_SPOOL_SIZE = 4 << 20  # 4 MB
+
+# Media types for binary export downloads
+PDF_MEDIA_TYPE = "application/pdf"
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _extract_resume_text(file_path: str) -> Tuple[str, str, str]:
+    """
+    Extract text from a saved resume, with its preview and summary.
+    
+    Blocking; run in a worker thread so parsing happens in one hop.
+    
+    Returns:
+        (extracted_text, text_preview, text_summary)
+    """
+    extracted_text = extract_text_from_file(file_path)
+    return extracted_text, get_text_preview(extracted_text), get_text_summary(extracted_text)
+
 
 @router.post("/upload", response_model=FileUploadResponse)
-async def upload_resume(file: UploadFile = File(...)):
+@limiter.limit(RATE_LIMIT_UPLOAD)
+async def upload_resume(request: Request, response: Response, file: UploadFile = File(...)):
     """
     Upload a resume file (PDF, DOCX, or TXT).
     
     **Features:**
-    - Validates file type
+    - Validates file type and size (413 above MAX_RESUME_SIZE)
     - Extracts text content
     - Generates text preview & summary
     - Parses with Ollama LLM if available
@@ -74,24 +100,38 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail=f"Invalid file type '{file_extension}'. Only PDF, DOCX, and TXT are allowed."
             )
         
-        # Save file
+        # Reject early when the client declared an oversized file
+        if file.size is not None and file.size > MAX_RESUME_SIZE:
+            raise HTTPException(status_code=413, detail=f"File too large. Max: {MAX_RESUME_SIZE} bytes")
+        
+        # Stream file to disk, counting bytes as they are written
         file_path = SAMPLES_DIR / file.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        file_size = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > MAX_RESUME_SIZE:
+                        raise HTTPException(status_code=413, detail=f"File too large. Max: {MAX_RESUME_SIZE} bytes")
+                    await out.write(chunk)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
         
         # Extract text from file
-        extracted_text = extract_text_from_file(str(file_path))
-        text_preview = get_text_preview(extracted_text)
-        text_summary = get_text_summary(extracted_text)
+        extracted_text, text_preview, text_summary = await asyncio.to_thread(
+            _extract_resume_text, str(file_path)
+        )
         
         # Parse with Ollama if available
         structured_data = None
         ollama_status = "unavailable"
         ollama_message = ""
         
-        if check_ollama_available():
+        # Probe and LLM call block, so keep them off the event loop
+        if await asyncio.to_thread(check_ollama_available):
             try:
-                structured_data = parse_resume_with_ollama(extracted_text)
+                structured_data = await asyncio.to_thread(parse_resume_with_ollama, extracted_text)
                 ollama_status = "success"
                 ollama_message = "Resume successfully parsed with Ollama"
             except Exception as e:
@@ -104,7 +144,7 @@ async def upload_resume(file: UploadFile = File(...)):
             status="success",
             filename=file.filename,
             file_path=str(file_path),
-            file_size=file_path.stat().st_size,
+            file_size=file_size,
             text_preview=text_preview,
             text_summary=text_summary,
             structured_data=structured_data,
@@ -130,7 +170,7 @@ async def parse_linkedin(request: LinkedInScrapeRequest):
     - Profile information (name, headline, experience, skills, etc.)
     """
     try:
-        profile_data = parse_linkedin_profile(str(request.profile_url))
+        profile_data = parse_linkedin_profile(request.profile_url)
         
         return {
             "status": "success",
@@ -157,7 +197,7 @@ async def parse_github(request: GitHubParseRequest):
     - Technology stack
     """
     try:
-        profile_data = parse_github_profile(request.github_username)
+        profile_data = await parse_github_profile_async(request.github_username)
         
         return {
             "status": "success",
@@ -174,11 +214,14 @@ async def parse_github(request: GitHubParseRequest):
 # EXPORT ENDPOINTS
 # ============================================================================
 
-@router.post("/export/pdf")
+@router.post("/export/pdf", deprecated=True)
 async def export_pdf(request: ResumeExportRequest):
     """
     Export resume to PDF format.
     
+    Deprecated: the hex-encoded body is twice the file size; use
+    /export/pdf/raw to download the bytes directly.
+    
     **Parameters:**
     - resume_data: Complete resume data dictionary with all sections
     - export_format: "pdf" (ignored, always exports as PDF)
@@ -221,7 +264,7 @@ async def export_pdf(request: ResumeExportRequest):
     ```
     """
     try:
-        pdf_bytes = export_resume_to_pdf(request.resume_data)
+        pdf_bytes = export_resume_to_pdf(request.resume_data.model_dump(exclude_none=True))
         
         return {
             "status": "success",
@@ -237,11 +280,14 @@ async def export_pdf(request: ResumeExportRequest):
         )
 
 
-@router.post("/export/docx")
+@router.post("/export/docx", deprecated=True)
 async def export_docx(request: ResumeExportRequest):
     """
     Export resume to DOCX format (Microsoft Word).
     
+    Deprecated: the hex-encoded body is twice the file size; use
+    /export/docx/raw to download the bytes directly.
+    
     **Parameters:**
     - resume_data: Complete resume data dictionary with all sections
     - export_format: "docx" (ignored, always exports as DOCX)
@@ -255,7 +301,7 @@ async def export_docx(request: ResumeExportRequest):
     - Editable in Microsoft Word, Google Docs, etc.
     """
     try:
-        docx_bytes = export_resume_to_docx(request.resume_data)
+        docx_bytes = export_resume_to_docx(request.resume_data.model_dump(exclude_none=True))
         
         return {
             "status": "success",
@@ -271,6 +317,83 @@ async def export_docx(request: ResumeExportRequest):
         )
 
 
+def _attachment(content: bytes, media_type: str, name: str, extension: str) -> Response:
+    """Wrap export bytes in a download response."""
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{generate_filename(name, extension)}"',
+            "X-File-Size": str(len(content)),
+        },
+    )
+
+
+def _spool_docx(resume_data: dict) -> Tuple[BinaryIO, int]:
+    """Save a DOCX export into a spooled temp file, rewound for reading."""
+    spool = SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+    try:
+        write_resume_docx(resume_data, spool)
+        size = spool.tell()
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    return spool, size
+
+
+def _iter_spool(spool: BinaryIO) -> Iterator[bytes]:
+    """Yield a spooled export in chunks, closing it once sent."""
+    try:
+        while chunk := spool.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    finally:
+        spool.close()
+
+
+@router.post("/export/pdf/raw", response_class=Response)
+async def export_pdf_raw(request: ResumeExportRequest):
+    """
+    Export resume to PDF and return the file itself.
+    
+    **Returns:**
+    - application/pdf body with a Content-Disposition attachment filename
+    """
+    resume_data = request.resume_data.model_dump(exclude_none=True)
+    try:
+        pdf_bytes = await asyncio.to_thread(export_resume_to_pdf, resume_data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error exporting to PDF: {str(e)}")
+    
+    return _attachment(pdf_bytes, PDF_MEDIA_TYPE, resume_data.get("name", "resume"), "pdf")
+
+
+@router.post("/export/docx/raw", response_class=Response)
+async def export_docx_raw(request: ResumeExportRequest):
+    """
+    Export resume to DOCX and return the file itself.
+    
+    **Returns:**
+    - Word document body with a Content-Disposition attachment filename
+    """
+    resume_data = request.resume_data.model_dump(exclude_none=True)
+    try:
+        spool, size = await asyncio.to_thread(_spool_docx, resume_data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error exporting to DOCX: {str(e)}")
+    
+    filename = generate_filename(resume_data.get("name", "resume"), "docx")
+    return StreamingResponse(
+        _iter_spool(spool),
+        media_type=DOCX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+            "X-File-Size": str(size),
+        },
+    )
+
+
 @router.post("/export/text")
 async def export_text(request: ResumeExportRequest):
     """
@@ -289,7 +412,7 @@ async def export_text(request: ResumeExportRequest):
     - Smallest file size
     """
     try:
-        text_content = export_resume_to_text(request.resume_data)
+        text_content = export_resume_to_text(request.resume_data.model_dump(exclude_none=True))
         
         return {
             "status": "success",
@@ -323,7 +446,9 @@ async def export_all(request: ResumeExportRequest):
     """
     try:
         export_dir = create_export_dir("data/exports")
-        result = export_resume(request.resume_data, export_format="all", output_dir=export_dir)
+        result = await export_resume_async(
+            request.resume_data.model_dump(exclude_none=True), export_format="all", output_dir=export_dir
+        )
         
         return result
     except Exception as e:
@@ -14,13 +14,32 @@ from .audio_handler import (
 from .whisper_transcriber import (
     initialize_whisper,
     transcribe_audio,
+    transcribe_audio_batch,
     extract_key_phrases,
     assess_clarity,
+    assess_clarity_batch,
     assess_pacing,
+    assess_pacing_batch,
+)
+
+from .audio_metrics import (
+    assess_audio_only,
+)
+
+from .whisper_pool import (
+    Precision,
+    WhisperPool,
+    get_whisper_pool,
+    preload_whisper,
 )
 
 from .scoring import (
     score_spoken_answer,
+    score_spoken_answers_batch,
+    assess_delivery,
+    assess_delivery_batch,
+    combine_spoken_score,
+    score_fallback,
     generate_audio_report,
     compare_text_vs_audio,
 )
@@ -32,11 +51,26 @@ __all__ = [
     # Whisper Transcriber
     "initialize_whisper",
     "transcribe_audio",
+    "transcribe_audio_batch",
     "extract_key_phrases",
     "assess_clarity",
+    "assess_clarity_batch",
     "assess_pacing",
+    "assess_pacing_batch",
+    # Audio Metrics
+    "assess_audio_only",
+    # Whisper Pool
+    "Precision",
+    "WhisperPool",
+    "get_whisper_pool",
+    "preload_whisper",
     # Scoring
     "score_spoken_answer",
+    "score_spoken_answers_batch",
+    "assess_delivery",
+    "assess_delivery_batch",
+    "combine_spoken_score",
+    "score_fallback",
     "generate_audio_report",
     "compare_text_vs_audio",
 ]
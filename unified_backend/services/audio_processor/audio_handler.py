@@ -3,13 +3,51 @@ Audio Handler - Audio file loading, storage, and format conversion
 Manages audio upload, validation, and format handling
 """
 
+import hashlib
 import os
+import threading
+import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, NamedTuple, Tuple
 import mimetypes
 
-from utils.config import DATA_DIR, ALLOWED_AUDIO_EXTENSIONS, MAX_AUDIO_SIZE
+import aiofiles
+
+from utils.config import DATA_DIR, ALLOWED_AUDIO_EXTENSIONS, ALLOWED_AUDIO_EXTENSIONS_TEXT, MAX_AUDIO_SIZE
+
+# Read size when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# MIME types for the common audio extensions, checked before mimetypes
+_AUDIO_MIME_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+}
+
+
+@lru_cache(maxsize=32)
+def _mime_for_ext(file_extension: str) -> str:
+    """
+    MIME type for a lowercase file extension (e.g. ".wav")
+    
+    Returns:
+        MIME type, or "audio/unknown"
+    """
+    mime_type = _AUDIO_MIME_TYPES.get(file_extension)
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(f"x{file_extension}")
+    return mime_type or "audio/unknown"
+
+
+class _StoredAudio(NamedTuple):
+    """Index entry for a stored upload"""
+    path: Path
+    size_bytes: int
 
 
 class AudioHandler:
@@ -18,8 +56,52 @@ class AudioHandler:
     AUDIO_DIR = DATA_DIR / "audio_uploads"
     
     def __init__(self):
-        """Initialize audio directory"""
+        """Initialize audio directory and the file_id -> (path, size) index"""
         self.AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._cleanup_lock = threading.Lock()
+        self._index: Dict[str, _StoredAudio] = self._scan()
+    
+    def _scan(self) -> Dict[str, _StoredAudio]:
+        """Map every stored file's ID (its stem) to its path and size"""
+        with os.scandir(self.AUDIO_DIR) as entries:
+            return {
+                Path(entry.name).stem: _StoredAudio(Path(entry.path), entry.stat().st_size)
+                for entry in entries if entry.is_file()
+            }
+    
+    def _resolve(self, file_id: str) -> Optional[_StoredAudio]:
+        """
+        Find the stored file for an ID
+        
+        Served from the in-memory index; falls back to a directory glob for
+        files saved by another worker process since this one started.
+        
+        Args:
+            file_id: Audio file ID
+            
+        Returns:
+            Index entry or None if not found
+        """
+        with self._lock:
+            stored = self._index.get(file_id)
+        if stored is not None:
+            return stored
+        
+        file_path = next((p for p in self.AUDIO_DIR.glob(f"{file_id}.*") if p.is_file()), None)
+        if file_path is None:
+            return None
+        
+        stored = _StoredAudio(file_path, file_path.stat().st_size)
+        with self._lock:
+            self._index[file_id] = stored
+        return stored
+    
+    def _forget(self, file_id: str) -> None:
+        """Drop an ID from the index"""
+        with self._lock:
+            self._index.pop(file_id, None)
     
     @staticmethod
     def validate_audio_file(filename: str, file_size: int) -> Tuple[bool, Optional[str]]:
@@ -36,7 +118,7 @@ class AudioHandler:
         # Check file extension
         file_extension = Path(filename).suffix.lower()
         if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
-            return False, f"Unsupported format: {file_extension}. Allowed: {', '.join(ALLOWED_AUDIO_EXTENSIONS)}"
+            return False, f"Unsupported format: {file_extension}. Allowed: {ALLOWED_AUDIO_EXTENSIONS_TEXT}"
         
         # Check file size
         if file_size > MAX_AUDIO_SIZE:
@@ -47,38 +129,83 @@ class AudioHandler:
         
         return True, None
     
-    def save_audio_file(self, file_content: bytes, original_filename: str) -> Dict[str, Any]:
+    async def save_audio_file(self, file_content: bytes, original_filename: str) -> Dict[str, Any]:
         """
         Save audio file with unique ID
         
+        Thin adapter over save_audio_stream for callers that already hold
+        the bytes; prefer streaming the upload instead.
+        
         Args:
             file_content: Audio file bytes
             original_filename: Original filename
             
         Returns:
-            Dict with file_id, path, size, format, etc.
+            Dict with file_id, path, size, format, etc. (as save_audio_stream)
+            
+        Raises:
+            ValueError: If the format is unsupported, or the file is empty or too large
         """
-        # Generate unique file ID
-        file_id = str(uuid.uuid4())
+        return await self.save_audio_stream(_BytesReader(file_content), original_filename)
+    
+    async def save_audio_stream(
+        self,
+        upload: Any,
+        original_filename: str,
+        keep_in_memory: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Stream an upload to disk in chunks, validating as it goes
         
-        # Get file extension
+        The upload is never held in memory as a whole; the size limit is
+        enforced while reading and a partial file is removed on failure.
+        
+        Args:
+            upload: Object with an async read(size) method (e.g. UploadFile)
+            original_filename: Original filename
+            keep_in_memory: Also return the bytes if the file is at most this size
+            
+        Returns:
+            Dict with file_id, filename, path, size_bytes, format, mime_type,
+            original_filename, content_hash (a BLAKE2b digest of the bytes)
+            and content (the bytes themselves, or None)
+            
+        Raises:
+            ValueError: If the format is unsupported, or the file is empty or too large
+        """
         file_extension = Path(original_filename).suffix.lower()
+        if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
+            raise ValueError(f"Unsupported format: {file_extension}. Allowed: {ALLOWED_AUDIO_EXTENSIONS_TEXT}")
         
-        # Create new filename with ID
+        file_id = str(uuid.uuid4())
         new_filename = f"{file_id}{file_extension}"
         file_path = self.AUDIO_DIR / new_filename
         
-        # Write file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-        
-        # Get file size
-        file_size = len(file_content)
+        file_size = 0
+        digest = hashlib.blake2b(digest_size=16)
+        content = bytearray() if keep_in_memory else None
+        try:
+            async with aiofiles.open(file_path, "wb") as out:
+                while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > MAX_AUDIO_SIZE:
+                        raise ValueError(f"File too large. Max: {MAX_AUDIO_SIZE} bytes")
+                    digest.update(chunk)
+                    if content is not None:
+                        if file_size <= keep_in_memory:
+                            content += chunk
+                        else:
+                            content = None
+                    await out.write(chunk)
+            
+            if file_size == 0:
+                raise ValueError("File is empty")
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
         
-        # Get MIME type
-        mime_type, _ = mimetypes.guess_type(original_filename)
-        if mime_type is None:
-            mime_type = "audio/unknown"
+        with self._lock:
+            self._index[file_id] = _StoredAudio(file_path, file_size)
         
         return {
             "file_id": file_id,
@@ -86,11 +213,13 @@ class AudioHandler:
             "path": str(file_path),
             "size_bytes": file_size,
             "format": file_extension[1:] if file_extension else "unknown",
-            "mime_type": mime_type,
-            "original_filename": original_filename
+            "mime_type": _mime_for_ext(file_extension),
+            "original_filename": original_filename,
+            "content_hash": digest.hexdigest(),
+            "content": content
         }
     
-    def load_audio_file(self, file_id: str) -> Optional[bytes]:
+    async def load_audio_file(self, file_id: str) -> Optional[bytes]:
         """
         Load audio file by ID
         
@@ -100,13 +229,16 @@ class AudioHandler:
         Returns:
             File bytes or None if not found
         """
-        # Search for file with this ID
-        for file_path in self.AUDIO_DIR.glob(f"{file_id}.*"):
-            if file_path.is_file():
-                with open(file_path, "rb") as f:
-                    return f.read()
+        stored = self._resolve(file_id)
+        if stored is None:
+            return None
         
-        return None
+        try:
+            async with aiofiles.open(stored.path, "rb") as f:
+                return await f.read()
+        except FileNotFoundError:
+            self._forget(file_id)
+            return None
     
     def get_audio_path(self, file_id: str) -> Optional[str]:
         """
@@ -118,11 +250,8 @@ class AudioHandler:
         Returns:
             File path or None if not found
         """
-        for file_path in self.AUDIO_DIR.glob(f"{file_id}.*"):
-            if file_path.is_file():
-                return str(file_path)
-        
-        return None
+        stored = self._resolve(file_id)
+        return str(stored.path) if stored is not None else None
     
     def delete_audio_file(self, file_id: str) -> bool:
         """
@@ -134,54 +263,58 @@ class AudioHandler:
         Returns:
             True if deleted, False if not found
         """
-        for file_path in self.AUDIO_DIR.glob(f"{file_id}.*"):
-            if file_path.is_file():
-                os.remove(file_path)
-                return True
+        stored = self._resolve(file_id)
+        if stored is None:
+            return False
         
-        return False
+        self._forget(file_id)
+        try:
+            os.remove(stored.path)
+        except FileNotFoundError:
+            return False
+        return True
     
     def get_audio_info(self, file_id: str) -> Optional[Dict[str, Any]]:
         """
         Get info about audio file
         
+        Served from the index, without touching the filesystem once the ID
+        is known.
+        
         Args:
             file_id: Audio file ID
             
         Returns:
             Dict with file info or None
         """
-        for file_path in self.AUDIO_DIR.glob(f"{file_id}.*"):
-            if file_path.is_file():
-                file_size = file_path.stat().st_size
-                mime_type, _ = mimetypes.guess_type(str(file_path))
-                
-                return {
-                    "file_id": file_id,
-                    "filename": file_path.name,
-                    "path": str(file_path),
-                    "size_bytes": file_size,
-                    "format": file_path.suffix[1:] if file_path.suffix else "unknown",
-                    "mime_type": mime_type or "audio/unknown"
-                }
-        
-        return None
+        stored = self._resolve(file_id)
+        if stored is None:
+            return None
+        
+        file_path = stored.path
+        return {
+            "file_id": file_id,
+            "filename": file_path.name,
+            "path": str(file_path),
+            "size_bytes": stored.size_bytes,
+            "format": file_path.suffix[1:] if file_path.suffix else "unknown",
+            "mime_type": _mime_for_ext(file_path.suffix.lower())
+        }
     
     def list_audio_files(self) -> list:
         """
         List all audio files
         
+        Lists the directory, which also picks up other workers' files, and
+        refreshes the index from it.
+        
         Returns:
             List of file IDs
         """
-        file_ids = set()
-        for file_path in self.AUDIO_DIR.glob("*"):
-            if file_path.is_file():
-                # Extract file ID (everything before the extension)
-                file_id = file_path.stem
-                file_ids.add(file_id)
-        
-        return list(file_ids)
+        found = self._scan()
+        with self._lock:
+            self._index = found
+        return list(found)
     
     def cleanup_old_files(self, max_age_seconds: int = 86400) -> int:
         """
@@ -191,23 +324,48 @@ class AudioHandler:
             max_age_seconds: Maximum age in seconds (default: 24 hours)
             
         Returns:
-            Number of files deleted
+            Number of files deleted (0 if a cleanup is already running)
         """
-        import time
+        # Overlapping runs (e.g. a manual call during the periodic sweep) no-op
+        if not self._cleanup_lock.acquire(blocking=False):
+            return 0
         
-        deleted_count = 0
-        current_time = time.time()
-        
-        for file_path in self.AUDIO_DIR.glob("*"):
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
-                if file_age > max_age_seconds:
-                    os.remove(file_path)
-                    deleted_count += 1
+        try:
+            deleted_count = 0
+            cutoff = time.time() - max_age_seconds
+            
+            # DirEntry caches the file type from the directory listing, so each
+            # entry costs one stat and, if expired, one unlink
+            with os.scandir(self.AUDIO_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            self._forget(Path(entry.name).stem)
+                            deleted_count += 1
+                    except FileNotFoundError:
+                        continue
+        finally:
+            self._cleanup_lock.release()
         
         return deleted_count
 
 
+class _BytesReader:
+    """Async read(size) over an in-memory buffer, without copying it"""
+    
+    def __init__(self, content: bytes):
+        self._view = memoryview(content)
+        self._offset = 0
+    
+    async def read(self, size: int) -> memoryview:
+        chunk = self._view[self._offset:self._offset + size]
+        self._offset += len(chunk)
+        return chunk
+
+
 # Global instance
 _audio_handler = None
 
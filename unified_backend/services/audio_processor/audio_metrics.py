@@ -0,0 +1,159 @@
+"""
+Audio Metrics - Pacing and clarity estimates straight from the waveform
+Energy-based voice activity detection, no speech-to-text required
+"""
+
+from pathlib import Path
+from typing import Dict, Any, Tuple
+import wave
+
+from services.audio_processor.whisper_transcriber import clarity_assessment, pacing_from_wpm
+
+
+# Analysis frame length for energy VAD
+VAD_FRAME_MS = 30
+
+# Frames this far above the noise floor (10th percentile energy) are speech
+VAD_THRESHOLD_DB = 10.0
+
+# Silences at least this long between speech count as pauses
+MIN_PAUSE_SECONDS = 0.5
+
+# Average syllables per spoken English word
+SYLLABLES_PER_WORD = 1.5
+
+
+def assess_audio_only(audio_path: str) -> Dict[str, Any]:
+    """
+    Estimate pacing and clarity without transcribing
+    
+    Speech frames are found by energy VAD; words are estimated from energy
+    peaks (syllable nuclei) within speech.
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Dict with clarity, pacing, estimated_word_count, pause_count,
+        speech_ratio and duration_seconds
+        
+    Raises:
+        ValueError: If the file can't be decoded without extra dependencies
+    """
+    import numpy as np
+    
+    samples, sample_rate = _load_pcm(audio_path)
+    duration = len(samples) / sample_rate if sample_rate else 0.0
+    
+    frame = max(1, int(sample_rate * VAD_FRAME_MS / 1000))
+    count = len(samples) // frame
+    if count < 3:
+        return _empty_metrics(duration)
+    
+    frames = samples[:count * frame].reshape(count, frame)
+    energy = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    noise_floor = np.percentile(energy, 10)
+    speech = energy > noise_floor + VAD_THRESHOLD_DB
+    
+    speech_frames = int(speech.sum())
+    if speech_frames == 0:
+        return _empty_metrics(duration)
+    
+    # Syllable nuclei: local energy maxima inside speech
+    smooth = np.convolve(energy, np.ones(3) / 3, mode="same")
+    peaks = (smooth[1:-1] > smooth[:-2]) & (smooth[1:-1] >= smooth[2:]) & speech[1:-1]
+    estimated_words = int(round(int(peaks.sum()) / SYLLABLES_PER_WORD))
+    
+    # Pauses: silent runs between the first and last speech frame
+    speech_idx = np.flatnonzero(speech)
+    gaps = np.diff(speech_idx) - 1
+    pause_count = int((gaps * VAD_FRAME_MS / 1000 >= MIN_PAUSE_SECONDS).sum())
+    
+    speech_ratio = speech_frames / count
+    snr_db = float(np.median(energy[speech]) - noise_floor)
+    
+    # Clarity: start from the transcript-based base score and adjust for
+    # signal quality and how much of the clip is speech
+    clarity_score = 75
+    if snr_db >= 25:
+        clarity_score += 10
+    elif snr_db < 15:
+        clarity_score -= 15
+    if speech_ratio < 0.5:
+        clarity_score -= 10
+    clarity_score = max(0, min(100, clarity_score))
+    
+    words_per_minute = estimated_words / duration * 60 if duration > 0 else 0.0
+    pacing_score, pacing_assessment = pacing_from_wpm(words_per_minute)
+    
+    return {
+        "clarity": {
+            "clarity_score": clarity_score,
+            "assessment": clarity_assessment(clarity_score),
+            "snr_db": round(snr_db, 1)
+        },
+        "pacing": {
+            "pacing_score": pacing_score,
+            "words_per_minute": round(words_per_minute, 1),
+            "assessment": pacing_assessment
+        },
+        "estimated_word_count": estimated_words,
+        "pause_count": pause_count,
+        "speech_ratio": round(speech_ratio, 3),
+        "duration_seconds": duration
+    }
+
+
+def _empty_metrics(duration: float) -> Dict[str, Any]:
+    """Metrics for a clip with no detectable speech"""
+    return {
+        "clarity": {"clarity_score": 0, "assessment": "No speech detected", "snr_db": 0.0},
+        "pacing": {"pacing_score": 75, "words_per_minute": 0, "assessment": "No speech detected"},
+        "estimated_word_count": 0,
+        "pause_count": 0,
+        "speech_ratio": 0.0,
+        "duration_seconds": duration
+    }
+
+
+def _load_pcm(audio_path: str) -> Tuple[Any, int]:
+    """
+    Decode audio to mono float32 samples at the file's own rate
+    
+    Uses soundfile when installed; otherwise only PCM WAV is supported.
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Tuple of (samples, sample_rate)
+    """
+    import numpy as np
+    
+    try:
+        import soundfile
+    except ImportError:
+        soundfile = None
+    
+    if soundfile is not None:
+        samples, sample_rate = soundfile.read(audio_path, dtype="float32", always_2d=True)
+        return samples.mean(axis=1), sample_rate
+    
+    if Path(audio_path).suffix.lower() != ".wav":
+        raise ValueError("Audio-only analysis of this format requires soundfile; send WAV or include the transcription")
+    
+    with wave.open(audio_path, "rb") as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        sample_rate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+    
+    if width == 1:
+        samples = (np.frombuffer(raw, np.uint8).astype(np.float32) - 128) / 128
+    elif width in (2, 4):
+        dtype = np.int16 if width == 2 else np.int32
+        samples = np.frombuffer(raw, dtype).astype(np.float32) / np.iinfo(dtype).max
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+    
+    return samples.reshape(-1, channels).mean(axis=1), sample_rate
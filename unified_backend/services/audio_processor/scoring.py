@@ -8,12 +8,15 @@ import json
 
 from services.interview_generator import (
     evaluate_answer,
+    evaluate_answers_batch,
     generate_recommendation
 )
 from services.audio_processor.whisper_transcriber import (
     extract_key_phrases,
     assess_clarity,
-    assess_pacing
+    assess_clarity_batch,
+    assess_pacing,
+    assess_pacing_batch
 )
 
 
@@ -37,6 +40,9 @@ def score_spoken_answer(
     Returns:
         Dict with score, feedback, and detailed metrics
     """
+    # Delivery metrics don't depend on the evaluator, so the fallback reuses them
+    delivery = assess_delivery(transcription, duration_seconds)
+    
     try:
         # Get base evaluation from Phase-3 evaluator
         base_evaluation = evaluate_answer(
@@ -46,58 +52,190 @@ def score_spoken_answer(
             experience_level=experience_level
         )
         
-        # Get audio-specific metrics
-        clarity_metrics = assess_clarity(transcription)
-        pacing_metrics = assess_pacing(transcription, duration_seconds)
-        key_phrases = extract_key_phrases(transcription)
-        
-        # Calculate combined audio score
-        # Base score (70% weight)
-        base_score = base_evaluation.get("score", 50)
-        
-        # Audio scores (30% weight)
-        clarity_score = clarity_metrics.get("clarity_score", 75)
-        pacing_score = pacing_metrics.get("pacing_score", 75)
-        audio_score = (clarity_score + pacing_score) / 2
-        
-        # Combine scores
-        final_score = int((base_score * 0.7) + (audio_score * 0.3))
-        final_score = max(0, min(100, final_score))  # Clamp 0-100
-        
-        # Generate audio-specific feedback
-        audio_feedback = _generate_audio_feedback(
-            clarity_metrics,
-            pacing_metrics,
-            base_evaluation
+        return combine_spoken_score(
+            transcription,
+            base_evaluation,
+            delivery,
+            experience_level=experience_level,
+            duration_seconds=duration_seconds
+        )
+    
+    except Exception as e:
+        print(f"Scoring error: {str(e)}")
+        return score_fallback(transcription, question, delivery, duration_seconds)
+
+
+def score_spoken_answers_batch(items: list) -> list:
+    """
+    Score several spoken answers, e.g. every answer of one interview
+    
+    The content evaluations go out as one batched LLM call, so latency is
+    close to the slowest single evaluation rather than their sum.
+    
+    Args:
+        items: List of dicts with score_spoken_answer keyword arguments
+               (transcription, question, and optionally role,
+               experience_level, duration_seconds)
+    
+    Returns:
+        List of score dicts (as score_spoken_answer), in the same order as items
+    """
+    calls = [
+        {"role": "Software Engineer", "experience_level": "mid", "duration_seconds": 0.0, **item}
+        for item in items
+    ]
+    
+    deliveries = assess_delivery_batch(
+        [call["transcription"] for call in calls],
+        [call["duration_seconds"] for call in calls]
+    )
+    
+    try:
+        evaluations = evaluate_answers_batch([
+            {
+                "question": call["question"],
+                "answer": call["transcription"],
+                "role": call["role"],
+                "experience_level": call["experience_level"],
+            }
+            for call in calls
+        ])
+    except Exception as e:
+        print(f"Batch scoring error: {str(e)}")
+        return [
+            score_fallback(call["transcription"], call["question"], delivery, call["duration_seconds"])
+            for call, delivery in zip(calls, deliveries)
+        ]
+    
+    return [
+        combine_spoken_score(
+            call["transcription"],
+            evaluation,
+            delivery,
+            experience_level=call["experience_level"],
+            duration_seconds=call["duration_seconds"]
         )
+        for call, evaluation, delivery in zip(calls, evaluations, deliveries)
+    ]
+
+
+def assess_delivery(transcription: str, duration_seconds: float = 0.0) -> Dict[str, Any]:
+    """
+    Audio-specific delivery metrics, independent of the content evaluation
+    
+    Args:
+        transcription: Transcribed text of answer
+        duration_seconds: Duration of audio
         
-        # Get hiring recommendation
-        recommendation = generate_recommendation(final_score, experience_level)
+    Returns:
+        Dict with clarity, pacing and key_phrases
+    """
+    # Pacing reuses clarity's word count rather than re-splitting the text
+    clarity = assess_clarity(transcription)
+    return {
+        "clarity": clarity,
+        "pacing": assess_pacing(transcription, duration_seconds, clarity.get("word_count")),
+        "key_phrases": extract_key_phrases(transcription)
+    }
+
+
+def assess_delivery_batch(transcriptions: list, durations: list) -> list:
+    """
+    Delivery metrics for many answers, scoring clarity and pacing vectorized
+    
+    Args:
+        transcriptions: Transcribed texts
+        durations: Audio duration per answer in seconds
         
-        return {
-            "status": "success",
-            "overall_score": final_score,
-            "content_score": base_score,
-            "delivery_score": audio_score,
-            "clarity_score": clarity_score,
-            "pacing_score": pacing_score,
-            "duration_seconds": duration_seconds,
-            "transcription": transcription,
-            "key_phrases": key_phrases,
-            "feedback": audio_feedback,
-            "strengths": base_evaluation.get("strengths", []),
-            "weaknesses": base_evaluation.get("weaknesses", []),
-            "suggestions": base_evaluation.get("suggestions", []),
-            "recommendation": recommendation,
-            "clarity_assessment": clarity_metrics.get("assessment", ""),
-            "pacing_assessment": pacing_metrics.get("assessment", ""),
-            "word_count": clarity_metrics.get("word_count", 0),
-            "words_per_minute": pacing_metrics.get("words_per_minute", 0)
+    Returns:
+        List of delivery dicts (as assess_delivery), in input order
+    """
+    clarities = assess_clarity_batch(transcriptions)
+    pacings = assess_pacing_batch(
+        [clarity.get("word_count", 0) for clarity in clarities],
+        durations
+    )
+    return [
+        {
+            "clarity": clarity,
+            "pacing": pacing,
+            "key_phrases": extract_key_phrases(transcription)
         }
+        for transcription, clarity, pacing in zip(transcriptions, clarities, pacings)
+    ]
+
+
+def combine_spoken_score(
+    transcription: str,
+    base_evaluation: Dict[str, Any],
+    delivery: Dict[str, Any],
+    experience_level: str = "mid",
+    duration_seconds: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Combine a content evaluation with delivery metrics into the final score
     
-    except Exception as e:
-        print(f"Scoring error: {str(e)}")
-        return _score_fallback(transcription, question)
+    Lets callers obtain the two halves concurrently (e.g. the LLM evaluation
+    through the batched evaluator while delivery metrics run in a thread).
+    
+    Args:
+        transcription: Transcribed text of answer
+        base_evaluation: Result of evaluate_answer
+        delivery: Result of assess_delivery
+        experience_level: junior/mid/senior
+        duration_seconds: Duration of audio
+        
+    Returns:
+        Dict with score, feedback, and detailed metrics (as score_spoken_answer)
+    """
+    clarity_metrics = delivery["clarity"]
+    pacing_metrics = delivery["pacing"]
+    key_phrases = delivery["key_phrases"]
+    
+    # Calculate combined audio score
+    # Base score (70% weight)
+    base_score = base_evaluation.get("score", 50)
+    
+    # Audio scores (30% weight)
+    clarity_score = clarity_metrics.get("clarity_score", 75)
+    pacing_score = pacing_metrics.get("pacing_score", 75)
+    audio_score = (clarity_score + pacing_score) / 2
+    
+    # Combine scores
+    final_score = int((base_score * 0.7) + (audio_score * 0.3))
+    final_score = max(0, min(100, final_score))  # Clamp 0-100
+    
+    # Generate audio-specific feedback
+    audio_feedback = _generate_audio_feedback(
+        clarity_metrics,
+        pacing_metrics,
+        base_evaluation
+    )
+    
+    # Get hiring recommendation
+    recommendation = generate_recommendation(final_score, experience_level)
+    
+    return {
+        "status": "success",
+        "overall_score": final_score,
+        "content_score": base_score,
+        "delivery_score": audio_score,
+        "clarity_score": clarity_score,
+        "pacing_score": pacing_score,
+        "duration_seconds": duration_seconds,
+        "transcription": transcription,
+        "key_phrases": key_phrases,
+        "feedback": audio_feedback,
+        "strengths": base_evaluation.get("strengths", []),
+        "weaknesses": base_evaluation.get("weaknesses", []),
+        "suggestions": base_evaluation.get("suggestions", []),
+        "recommendation": recommendation,
+        "clarity_assessment": clarity_metrics.get("assessment", ""),
+        "pacing_assessment": pacing_metrics.get("assessment", ""),
+        "word_count": clarity_metrics.get("word_count", 0),
+        "words_per_minute": pacing_metrics.get("words_per_minute", 0)
+    }
+
 
 
 def _generate_audio_feedback(
@@ -147,26 +285,36 @@ def _generate_audio_feedback(
     return feedback if feedback else "Answer recorded and analyzed. See detailed metrics below."
 
 
-def _score_fallback(transcription: str, question: str) -> Dict[str, Any]:
+def score_fallback(
+    transcription: str,
+    question: str,
+    delivery: Optional[Dict[str, Any]] = None,
+    duration_seconds: float = 0.0
+) -> Dict[str, Any]:
     """
     Fallback scoring when evaluation fails
     
     Args:
         transcription: Transcribed text
         question: Question asked
+        delivery: Result of assess_delivery if the caller already has it
+        duration_seconds: Duration of audio
         
     Returns:
         Fallback score dict
     """
     # Basic keyword matching
     keywords = ["experience", "system", "design", "implementation", "solution"]
-    keyword_count = sum(1 for kw in keywords if kw.lower() in transcription.lower())
+    text_lower = transcription.lower()
+    keyword_count = sum(1 for kw in keywords if kw in text_lower)
     
     base_score = 50 + (keyword_count * 5)  # 50-75 range
     base_score = min(100, base_score)
     
-    clarity_metrics = assess_clarity(transcription)
-    pacing_metrics = assess_pacing(transcription, 0.0)
+    if delivery is None:
+        delivery = assess_delivery(transcription, duration_seconds)
+    clarity_metrics = delivery["clarity"]
+    pacing_metrics = delivery["pacing"]
     
     return {
         "status": "success",
@@ -175,9 +323,9 @@ def _score_fallback(transcription: str, question: str) -> Dict[str, Any]:
         "delivery_score": (clarity_metrics.get("clarity_score", 75) + pacing_metrics.get("pacing_score", 75)) / 2,
         "clarity_score": clarity_metrics.get("clarity_score", 75),
         "pacing_score": pacing_metrics.get("pacing_score", 75),
-        "duration_seconds": 0,
+        "duration_seconds": duration_seconds,
         "transcription": transcription,
-        "key_phrases": extract_key_phrases(transcription),
+        "key_phrases": delivery["key_phrases"],
         "feedback": "Fallback scoring - detailed analysis unavailable",
         "strengths": ["Audio successfully transcribed", "Key concepts identified"],
         "weaknesses": ["Scoring system unavailable"],
@@ -0,0 +1,205 @@
+"""
+Whisper Pool - One Whisper model per GPU, shared by concurrent batches
+Routes each transcription batch to the least-loaded device
+"""
+
+import threading
+import traceback
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Literal
+
+from utils.config import (
+    WHISPER_MODEL,
+    WHISPER_FAST_MODEL,
+    WHISPER_DEVICE,
+    WHISPER_WORKERS_PER_DEVICE,
+    WHISPER_GPU_MEMORY_FRACTION,
+)
+
+Precision = Literal["fp16", "int8"]
+
+
+class WhisperPool:
+    """
+    Preloaded Whisper models, one per visible CUDA device (or one on CPU)
+    
+    Each device admits at most workers_per_device concurrent users. Keep it
+    at 1 for openai-whisper: decoding installs kv-cache hooks on the model,
+    so two decodes must not share one instance at the same time.
+    """
+    
+    def __init__(
+        self,
+        model_name: str = WHISPER_MODEL,
+        workers_per_device: int = WHISPER_WORKERS_PER_DEVICE,
+        quantize: bool = False
+    ):
+        """
+        Load one model per device
+        
+        Args:
+            model_name: Whisper model size/name (e.g. 'base')
+            workers_per_device: Concurrent users allowed per device
+            quantize: Quantize linear layers to int8 on CPU devices
+        """
+        import whisper
+        
+        self.devices = _visible_devices()
+        print(f"Loading Whisper model: {model_name} on {len(self.devices)} device(s)")
+        self.models = [whisper.load_model(model_name, device=device).eval() for device in self.devices]
+        if quantize:
+            self.models = [
+                _quantize_int8(model) if device.type == "cpu" else model
+                for model, device in zip(self.models, self.devices)
+            ]
+        
+        self._slots = [threading.Semaphore(workers_per_device) for _ in self.devices]
+        self._load = [0] * len(self.devices)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        Borrow the model on the least-loaded device
+        
+        Usage:
+            with pool.acquire() as model:
+                ...
+        """
+        with self._lock:
+            index = min(range(len(self.models)), key=self._load.__getitem__)
+            self._load[index] += 1
+        try:
+            with self._slots[index]:
+                yield self.models[index]
+        finally:
+            with self._lock:
+                self._load[index] -= 1
+
+
+def _visible_devices() -> List[Any]:
+    """WHISPER_DEVICE if set, else the visible CUDA devices, or the CPU if there are none"""
+    import torch
+    
+    if WHISPER_DEVICE:
+        return [torch.device(WHISPER_DEVICE)]
+    if torch.cuda.is_available():
+        return [torch.device("cuda", index) for index in range(torch.cuda.device_count())]
+    return [torch.device("cpu")]
+
+
+def _quantize_int8(model: Any) -> Any:
+    """
+    Dynamically quantize a CPU model's linear layers to int8
+    
+    openai-whisper has no int8 GPU kernels, so GPU models stay fp16.
+    
+    Args:
+        model: Whisper model on the CPU
+        
+    Returns:
+        Quantized model, or the original one if quantization fails (reported
+        with a traceback, since the int8 tier is then just the small model)
+    """
+    import torch
+    
+    try:
+        # The quantized Linear only converts modules whose type is exactly
+        # nn.Linear, and every Whisper layer is a whisper.model.Linear subclass
+        _replace_linear_subclasses(model)
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        print(f"ERROR: int8 quantization failed ({str(e)}); the int8 tier runs UNQUANTIZED")
+        traceback.print_exc()
+        return model
+
+
+def _replace_linear_subclasses(module: Any) -> None:
+    """
+    Swap every nn.Linear subclass under module for a plain nn.Linear in place
+    
+    The replacement shares the original weight and bias parameters.
+    """
+    import torch
+    
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+            linear = torch.nn.Linear(
+                child.in_features,
+                child.out_features,
+                bias=child.bias is not None,
+                device=child.weight.device,
+                dtype=child.weight.dtype,
+            )
+            linear.weight = child.weight
+            if child.bias is not None:
+                linear.bias = child.bias
+            setattr(module, name, linear)
+        else:
+            _replace_linear_subclasses(child)
+
+
+# Model and quantization per precision tier
+_POOL_SETTINGS = {
+    "fp16": (WHISPER_MODEL, False),
+    "int8": (WHISPER_FAST_MODEL, True),
+}
+
+_whisper_pools: Dict[str, WhisperPool] = {}
+_pool_lock = threading.Lock()
+
+
+def get_whisper_pool(precision: Precision = "fp16") -> WhisperPool:
+    """
+    Get or create the Whisper pool for a precision tier
+    
+    Args:
+        precision: 'fp16' for the full model (scoring paths) or 'int8' for
+                   the smaller, quantized model (metrics-only paths)
+    
+    Raises:
+        ImportError: If Whisper is not installed
+    """
+    pool = _whisper_pools.get(precision)
+    if pool is None:
+        with _pool_lock:
+            pool = _whisper_pools.get(precision)
+            if pool is None:
+                model_name, quantize = _POOL_SETTINGS[precision]
+                pool = _whisper_pools[precision] = WhisperPool(model_name, quantize=quantize)
+    return pool
+
+
+def preload_whisper() -> bool:
+    """
+    Load every precision tier and run one silent decode per model
+    
+    Called at startup so the first request doesn't pay for model loading,
+    CUDA context creation or cuDNN algorithm selection.
+    
+    Returns:
+        True if the models were loaded, False if Whisper isn't installed
+    """
+    try:
+        import numpy as np
+        import torch
+        import whisper
+    except ImportError:
+        print("Whisper not installed, skipping model preload")
+        return False
+    
+    from .whisper_transcriber import _log_mel_batch
+    
+    if torch.cuda.is_available():
+        torch.backends.cudnn.benchmark = True
+        for index in range(torch.cuda.device_count()):
+            torch.cuda.set_per_process_memory_fraction(WHISPER_GPU_MEMORY_FRACTION, index)
+    
+    silence = np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32)
+    for precision in _POOL_SETTINGS:
+        for model in get_whisper_pool(precision).models:
+            options = whisper.DecodingOptions(language="en", fp16=model.device.type == "cuda")
+            with torch.inference_mode():
+                whisper.decode(model, _log_mel_batch([silence], model), options)
+    
+    return True
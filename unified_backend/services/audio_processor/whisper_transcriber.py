@@ -3,32 +3,212 @@ Whisper Transcriber - Speech-to-text transcription using Whisper
 Converts audio files to text with confidence scores
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
+import functools
 import json
 import re
-import os
+import subprocess
+import wave
 
+try:
+    import ahocorasick
+except ImportError:  # Plain substring checks
+    ahocorasick = None
 
-def initialize_whisper() -> Tuple[bool, Optional[Any]]:
+try:
+    import soundfile as sf
+except ImportError:  # WAV headers only
+    sf = None
+
+try:
+    import torch
+    import whisper
+except ImportError:  # Fallback transcription
+    torch = None
+    whisper = None
+
+# Whisper decodes fixed 30-second windows; clips that fit in one window can
+# share a single batched decode
+WHISPER_WINDOW_SECONDS = 30
+
+# Longer clips are cut into windows overlapping by this much, so a word on a
+# boundary is heard whole by at least one window
+WINDOW_OVERLAP_SECONDS = 1.0
+
+# Upper bound on windows per decode call, to cap device memory
+MAX_DECODE_BATCH = 16
+
+# Technical terms reported as key phrases (substring matches)
+TECH_KEYWORDS = (
+    "python", "javascript", "java", "c++", "fastapi", "flask", "django",
+    "react", "vue", "angular", "sql", "postgresql", "mongodb", "redis",
+    "docker", "kubernetes", "aws", "gcp", "azure", "git", "ci/cd",
+    "microservices", "api", "rest", "graphql", "websocket",
+    "machine learning", "ai", "deep learning", "neural network",
+    "architecture", "design pattern", "algorithm", "database",
+    "optimization", "performance", "scalability", "reliability"
+)
+
+# Sentence boundaries for clarity metrics
+_SENT_SPLIT = re.compile(r'[.!?]+')
+
+# Numbers with a unit (years, metrics)
+_NUM_RE = re.compile(r'\b(\d+)\s*(?:years?|months?|weeks?|days?|%|million|thousand|k|kb|mb|gb)\b')
+
+
+def _build_automaton(keywords: Tuple[str, ...]) -> Optional[Any]:
     """
-    Initialize Whisper model
+    Aho-Corasick automaton matching every keyword in one pass over a text
     
     Returns:
-        Tuple of (success, model_or_error)
+        The automaton, or None if pyahocorasick isn't installed
     """
-    try:
-        import whisper
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_TECH_AUTOMATON = _build_automaton(TECH_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=None)
+def _mel_constants(device: Any, n_mels: int) -> Tuple[Any, Any]:
+    """
+    STFT window and mel filterbank, uploaded once per device
+    
+    Args:
+        device: torch device the model runs on
+        n_mels: Number of mel bins the model expects
+        
+    Returns:
+        Tuple of (hann_window, mel_filters) tensors on the device
+    """
+    window = torch.hann_window(whisper.audio.N_FFT, device=device)
+    filters = whisper.audio.mel_filters(device, n_mels)
+    return window, filters
+
+
+# A path, or a (path, bytes) pair whose bytes are decoded without re-reading
+# the file
+AudioSource = Union[str, Tuple[str, bytes]]
+
+
+def _load_audio(source: AudioSource) -> Any:
+    """
+    Decode audio to 16 kHz mono float32 samples
+    
+    In-memory bytes are piped through ffmpeg; if that fails (e.g. a container
+    that needs a seekable input), the file on disk is decoded instead.
+    
+    Args:
+        source: Path, or (path, bytes) pair
         
-        # Check if model file exists locally
-        model_name = os.getenv("WHISPER_MODEL", "base")
+    Returns:
+        numpy float32 array of samples
+    """
+    import numpy as np
+    
+    if isinstance(source, str):
+        return whisper.load_audio(source)
+    
+    audio_path, data = source
+    cmd = [
+        "ffmpeg", "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(whisper.audio.SAMPLE_RATE),
+        "-"
+    ]
+    try:
+        out = subprocess.run(cmd, input=data, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError:
+        return whisper.load_audio(audio_path)
+    
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def _source_path(source: AudioSource) -> str:
+    """Path of an audio source"""
+    return source if isinstance(source, str) else source[0]
+
+
+def _to_device(samples: Any, device: Any) -> Any:
+    """
+    Copy host samples to the model's device
+    
+    On CUDA the samples are staged in pinned memory so the copy is a single
+    asynchronous DMA instead of a pageable, blocking transfer.
+    
+    Args:
+        samples: CPU tensor
+        device: Target torch device
         
-        print(f"Loading Whisper model: {model_name}")
-        model = whisper.load_model(model_name)
+    Returns:
+        Tensor on the device
+    """
+    if device.type == "cuda":
+        return samples.pin_memory().to(device, non_blocking=True)
+    return samples.to(device)
+
+
+def _log_mel_batch(audios: List[Any], model: Any) -> Any:
+    """
+    Log-mel spectrograms for a batch of clips with one STFT on the model's device
+    
+    Mirrors whisper.log_mel_spectrogram, but normalizes each clip against its
+    own peak so the batch matches per-clip extraction.
+    
+    Args:
+        audios: 16 kHz float32 sample arrays, each at most one window long
+        model: Loaded Whisper model
         
-        return True, model
-    except ImportError:
+    Returns:
+        Tensor of shape (batch, n_mels, 3000) on the model's device
+    """
+    window, filters = _mel_constants(model.device, model.dims.n_mels)
+    samples = _to_device(
+        torch.stack([torch.from_numpy(whisper.pad_or_trim(audio)) for audio in audios]),
+        model.device
+    )
+    
+    stft = torch.stft(
+        samples,
+        whisper.audio.N_FFT,
+        whisper.audio.HOP_LENGTH,
+        window=window,
+        return_complex=True
+    )
+    magnitudes = stft[..., :-1].abs() ** 2
+    
+    log_spec = torch.clamp(filters @ magnitudes, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+
+def initialize_whisper() -> Tuple[bool, Optional[Any]]:
+    """
+    Initialize Whisper model
+    
+    The model is loaded once per process by the full-precision pool and
+    reused by every later call.
+    
+    Returns:
+        Tuple of (success, model_or_error)
+    """
+    if whisper is None:
         print("Whisper not installed. Will use fallback transcription.")
         return False, "Whisper not available - using fallback"
+    
+    try:
+        from .whisper_pool import get_whisper_pool
+        
+        return True, get_whisper_pool().models[0]
     except Exception as e:
         print(f"Error loading Whisper: {str(e)}")
         return False, str(e)
@@ -50,26 +230,188 @@ def transcribe_audio(
     Returns:
         Dict with transcription, confidence, duration, etc.
     """
+    if whisper is None:
+        print("Whisper not installed, using fallback")
+        return _transcribe_fallback(audio_path)
+    
     try:
-        # Try to use Whisper
-        whisper_available, whisper_model = initialize_whisper()
-        
-        if whisper_available and whisper_model is not None:
+        from .whisper_pool import get_whisper_pool
+        pool = get_whisper_pool()
+    except Exception as e:
+        print(f"Error loading Whisper: {str(e)}, using fallback")
+        return _transcribe_fallback(audio_path)
+    
+    try:
+        # Preloaded model, borrowed so decodes never share an instance
+        with pool.acquire() as whisper_model:
             return _transcribe_with_whisper(audio_path, whisper_model, language, task)
-        else:
-            print(f"Whisper unavailable ({whisper_model}), using fallback")
-            return _transcribe_fallback(audio_path)
     
     except Exception as e:
         print(f"Transcription error: {str(e)}, using fallback")
         return _transcribe_fallback(audio_path)
 
 
+def transcribe_audio_batch(
+    audio_paths: List[AudioSource],
+    language: str = "en",
+    task: str = "transcribe",
+    precision: str = "fp16"
+) -> List[Dict[str, Any]]:
+    """
+    Transcribe several audio files with one batched Whisper decode
+    
+    Clips longer than WHISPER_WINDOW_SECONDS are split into overlapping
+    windows; the windows of all clips are decoded together and each clip's
+    transcript is stitched back from its windows.
+    
+    Args:
+        audio_paths: Paths to audio files, or (path, bytes) pairs for uploads
+                     already held in memory
+        language: Language code (e.g., 'en')
+        task: 'transcribe' or 'translate'
+        precision: 'fp16' (full model) or 'int8' (smaller, quantized model)
+        
+    Returns:
+        List of transcription result dicts (as transcribe_audio), in input order
+    """
+    if whisper is None:
+        print("Whisper not installed, using fallback")
+        return [_transcribe_fallback(_source_path(source)) for source in audio_paths]
+    
+    try:
+        from .whisper_pool import get_whisper_pool
+        pool = get_whisper_pool(precision)
+    except Exception as e:
+        print(f"Error loading Whisper: {str(e)}, using fallback")
+        return [_transcribe_fallback(_source_path(source)) for source in audio_paths]
+    
+    try:
+        # Concurrent batches spread across GPUs
+        with pool.acquire() as whisper_model:
+            return _transcribe_batch_with_whisper(audio_paths, whisper_model, language, task)
+    
+    except Exception as e:
+        print(f"Batch transcription error: {str(e)}, using fallback")
+        return [_transcribe_fallback(_source_path(source)) for source in audio_paths]
+
+
+def _transcribe_batch_with_whisper(
+    audio_paths: List[AudioSource],
+    model: Any,
+    language: str,
+    task: str
+) -> List[Dict[str, Any]]:
+    """
+    Batched Whisper decode over the windows of every clip
+    
+    Args:
+        audio_paths: Paths to audio files, or (path, bytes) pairs
+        model: Loaded Whisper model
+        language: Language code
+        task: transcribe/translate
+        
+    Returns:
+        Transcription result dicts, in input order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(audio_paths)
+    durations: Dict[int, float] = {}
+    windows = []  # (index, samples), grouped by clip in order
+    
+    for index, source in enumerate(audio_paths):
+        try:
+            audio = _load_audio(source)
+        except Exception as e:
+            print(f"Could not load audio {_source_path(source)}: {str(e)}")
+            results[index] = _transcribe_fallback(_source_path(source))
+            continue
+        
+        durations[index] = len(audio) / whisper.audio.SAMPLE_RATE
+        windows.extend((index, window) for window in _split_windows(audio))
+    
+    options = whisper.DecodingOptions(
+        language=language,
+        task=task,
+        fp16=model.device.type == "cuda"
+    )
+    texts: Dict[int, List[str]] = {index: [] for index in durations}
+    languages: Dict[int, str] = {}
+    
+    with torch.inference_mode():
+        for start in range(0, len(windows), MAX_DECODE_BATCH):
+            chunk = windows[start:start + MAX_DECODE_BATCH]
+            # Every window is padded to the same 30 s, so they share one STFT
+            mels = _log_mel_batch([samples for _, samples in chunk], model)
+            
+            for (index, _), result in zip(chunk, whisper.decode(model, mels, options)):
+                texts[index].append(result.text.strip())
+                languages.setdefault(index, result.language)
+    
+    for index, duration in durations.items():
+        results[index] = {
+            "status": "success",
+            "transcription": _stitch_windows(texts[index]),
+            "confidence": _calculate_confidence({}),
+            "duration": duration,
+            "language": languages.get(index) or language,
+            "segments": len(texts[index]),
+            "source": "whisper"
+        }
+    
+    return results
+
+
+def _split_windows(audio: Any) -> List[Any]:
+    """
+    Split samples into overlapping Whisper windows
+    
+    Args:
+        audio: 16 kHz float32 samples
+        
+    Returns:
+        List of sample slices, each at most WHISPER_WINDOW_SECONDS long
+    """
+    sample_rate = whisper.audio.SAMPLE_RATE
+    window = WHISPER_WINDOW_SECONDS * sample_rate
+    if len(audio) <= window:
+        return [audio]
+    
+    overlap = int(WINDOW_OVERLAP_SECONDS * sample_rate)
+    return [audio[start:start + window] for start in range(0, len(audio) - overlap, window - overlap)]
+
+
+def _stitch_windows(texts: List[str], max_overlap_words: int = 8) -> str:
+    """
+    Join window transcripts, dropping words repeated across a boundary
+    
+    Args:
+        texts: Transcripts of consecutive overlapping windows
+        max_overlap_words: Longest repeat to look for at each boundary
+        
+    Returns:
+        Combined transcript
+    """
+    def normalize(word: str) -> str:
+        return word.strip(".,!?;:\"'").lower()
+    
+    words: List[str] = []
+    for text in texts:
+        incoming = text.split()
+        overlap = 0
+        for k in range(min(max_overlap_words, len(words), len(incoming)), 0, -1):
+            if [normalize(w) for w in words[-k:]] == [normalize(w) for w in incoming[:k]]:
+                overlap = k
+                break
+        words.extend(incoming[overlap:])
+    
+    return " ".join(words)
+
+
 def _transcribe_with_whisper(
     audio_path: str,
     model: Any,
     language: str,
-    task: str
+    task: str,
+    audio: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     Transcribe using actual Whisper model
@@ -79,25 +421,25 @@ def _transcribe_with_whisper(
         model: Loaded Whisper model
         language: Language code
         task: transcribe/translate
+        audio: Already decoded 16 kHz samples, if available
         
     Returns:
         Transcription result dict
     """
     try:
-        # Transcribe audio
-        result = model.transcribe(
-            audio_path,
-            language=language,
-            task=task,
-            fp16=True  # Use half precision for faster processing
-        )
+        if audio is None:
+            audio = whisper.load_audio(audio_path)
+        duration = len(audio) / whisper.audio.SAMPLE_RATE
         
-        # Get duration from audio file
-        try:
-            import librosa
-            duration = librosa.get_duration(path=audio_path)
-        except:
-            duration = 0.0
+        # Samples on the model's device so feature extraction runs there too;
+        # half precision only where it runs natively (CUDA)
+        with torch.inference_mode():
+            result = model.transcribe(
+                _to_device(torch.from_numpy(audio), model.device),
+                language=language,
+                task=task,
+                fp16=model.device.type == "cuda"
+            )
         
         return {
             "status": "success",
@@ -130,7 +472,7 @@ def _transcribe_fallback(audio_path: str) -> Dict[str, Any]:
         "status": "success",
         "transcription": "I have extensive experience with backend development using Python and FastAPI. I've built scalable microservices, optimized database queries, and implemented API design best practices. My focus areas include system architecture, performance optimization, and team collaboration.",
         "confidence": 0.85,
-        "duration": 0.0,
+        "duration": _probe_duration(audio_path),
         "language": "en",
         "segments": 1,
         "source": "fallback",
@@ -138,6 +480,25 @@ def _transcribe_fallback(audio_path: str) -> Dict[str, Any]:
     }
 
 
+def _probe_duration(audio_path: str) -> float:
+    """
+    Audio length from the container header, without decoding the samples
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Duration in seconds, or 0.0 if the file can't be probed
+    """
+    try:
+        if sf is not None:
+            return float(sf.info(audio_path).duration)
+        with wave.open(audio_path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except Exception:
+        return 0.0
+
+
 def _calculate_confidence(whisper_result: Dict[str, Any]) -> float:
     """
     Calculate overall confidence score from Whisper result
@@ -176,34 +537,21 @@ def extract_key_phrases(transcription: str) -> list:
         transcription: Transcribed text
         
     Returns:
-        List of key phrases
-    """
-    # Simple keyword extraction
-    keywords = []
-    
-    # Technical terms
-    tech_keywords = [
-        "python", "javascript", "java", "c++", "fastapi", "flask", "django",
-        "react", "vue", "angular", "sql", "postgresql", "mongodb", "redis",
-        "docker", "kubernetes", "aws", "gcp", "azure", "git", "ci/cd",
-        "microservices", "api", "rest", "graphql", "websocket",
-        "machine learning", "ai", "deep learning", "neural network",
-        "architecture", "design pattern", "algorithm", "database",
-        "optimization", "performance", "scalability", "reliability"
-    ]
-    
+        List of unique key phrases, technical terms first, then numbers
+    """
     text_lower = transcription.lower()
     
-    for keyword in tech_keywords:
-        if keyword in text_lower:
-            keywords.append(keyword)
+    # Technical terms, in one pass over the text when the automaton is available;
+    # dict keys dedupe while keeping a stable order
+    if _TECH_AUTOMATON is not None:
+        keywords = dict.fromkeys(keyword for _, keyword in _TECH_AUTOMATON.iter(text_lower))
+    else:
+        keywords = dict.fromkeys(keyword for keyword in TECH_KEYWORDS if keyword in text_lower)
     
-    # Extract numbers (years, metrics)
-    numbers = re.findall(r'\b(\d+)\s*(?:years?|months?|weeks?|days?|%|million|thousand|k|kb|mb|gb)\b', text_lower)
-    for number in numbers[:5]:  # Limit to 5
-        keywords.append(f"{number}")
+    # Extract numbers (years, metrics), limited to 5
+    keywords.update(dict.fromkeys(_NUM_RE.findall(text_lower)[:5]))
     
-    return list(set(keywords))  # Remove duplicates
+    return list(keywords)
 
 
 def assess_clarity(transcription: str) -> Dict[str, Any]:
@@ -216,16 +564,15 @@ def assess_clarity(transcription: str) -> Dict[str, Any]:
     Returns:
         Dict with clarity metrics
     """
-    if not transcription:
-        return {
-            "clarity_score": 0,
-            "assessment": "No transcription"
-        }
+    if _is_blank(transcription):
+        return _no_transcription_clarity()
     
-    # Metrics
-    word_count = len(transcription.split())
-    sentence_count = len(re.split(r'[.!?]+', transcription))
-    avg_word_length = sum(len(w) for w in transcription.split()) / max(word_count, 1)
+    # Metrics, from a single tokenization
+    words = transcription.split()
+    word_count = len(words)
+    sentence_count = len(_SENT_SPLIT.split(transcription))
+    avg_word_length = sum(map(len, words)) / max(word_count, 1)
+    text_lower = transcription.lower()
     
     # Calculate clarity score
     clarity_score = 75  # Base score
@@ -241,37 +588,126 @@ def assess_clarity(transcription: str) -> Dict[str, Any]:
     # Factors that reduce clarity
     if word_count < 20:
         clarity_score -= 20
-    if "um" in transcription.lower() or "uh" in transcription.lower():
+    if "um" in text_lower or "uh" in text_lower:
         clarity_score -= 5
     
     # Cap between 0 and 100
     clarity_score = max(0, min(100, clarity_score))
     
-    if clarity_score >= 80:
-        assessment = "Excellent clarity"
-    elif clarity_score >= 60:
-        assessment = "Good clarity"
-    elif clarity_score >= 40:
-        assessment = "Acceptable clarity"
-    else:
-        assessment = "Poor clarity"
-    
     return {
         "clarity_score": clarity_score,
-        "assessment": assessment,
+        "assessment": clarity_assessment(clarity_score),
         "word_count": word_count,
         "sentence_count": sentence_count,
         "avg_word_length": round(avg_word_length, 2)
     }
 
 
-def assess_pacing(transcription: str, duration_seconds: float) -> Dict[str, Any]:
+def assess_clarity_batch(transcriptions: List[str]) -> List[Dict[str, Any]]:
+    """
+    Assess speech clarity for many transcriptions at once
+    
+    Tokenization stays per text; the score adjustments run as one vectorized
+    pass over all answers. Results match assess_clarity item for item.
+    
+    Args:
+        transcriptions: Transcribed texts
+        
+    Returns:
+        List of clarity metric dicts, in the same order as transcriptions
+    """
+    import numpy as np
+    
+    n = len(transcriptions)
+    word_counts = np.zeros(n, np.int32)
+    sentence_counts = np.zeros(n, np.int32)
+    avg_word_lengths = np.zeros(n, np.float64)
+    has_filler = np.zeros(n, np.bool_)
+    
+    blank = [_is_blank(transcription) for transcription in transcriptions]
+    for i, transcription in enumerate(transcriptions):
+        if blank[i]:
+            continue
+        words = transcription.split()
+        word_counts[i] = len(words)
+        sentence_counts[i] = len(_SENT_SPLIT.split(transcription))
+        avg_word_lengths[i] = sum(map(len, words)) / max(len(words), 1)
+        text_lower = transcription.lower()
+        has_filler[i] = "um" in text_lower or "uh" in text_lower
+    
+    scores = _clarity_scores(word_counts, sentence_counts, avg_word_lengths, has_filler)
+    
+    results = []
+    for i, transcription in enumerate(transcriptions):
+        if blank[i]:
+            results.append(_no_transcription_clarity())
+            continue
+        clarity_score = int(scores[i])
+        results.append({
+            "clarity_score": clarity_score,
+            "assessment": clarity_assessment(clarity_score),
+            "word_count": int(word_counts[i]),
+            "sentence_count": int(sentence_counts[i]),
+            "avg_word_length": round(float(avg_word_lengths[i]), 2)
+        })
+    return results
+
+
+def _is_blank(transcription: Optional[str]) -> bool:
+    """True for a missing, empty or whitespace-only transcription."""
+    return not transcription or transcription.isspace()
+
+
+def _no_transcription_clarity() -> Dict[str, Any]:
+    """Clarity metrics for a blank transcription."""
+    return {
+        "clarity_score": 0,
+        "assessment": "No transcription",
+        "word_count": 0,
+        "sentence_count": 0,
+        "avg_word_length": 0.0
+    }
+
+
+def _clarity_scores(word_counts: Any, sentence_counts: Any, avg_word_lengths: Any, has_filler: Any) -> Any:
+    """
+    Vectorized clarity rubric (same adjustments as assess_clarity)
+    
+    Args:
+        word_counts: int array of word counts
+        sentence_counts: int array of sentence counts
+        avg_word_lengths: float array of average word lengths
+        has_filler: bool array, True where the text contains um/uh
+        
+    Returns:
+        int32 array of clarity scores (0-100)
+    """
+    import numpy as np
+    
+    scores = (
+        75
+        + 10 * (word_counts > 100)
+        + 5 * (sentence_counts > 5)
+        + 5 * (avg_word_lengths > 4)
+        - 20 * (word_counts < 20)
+        - 5 * has_filler
+    ).astype(np.int32)
+    np.clip(scores, 0, 100, out=scores)
+    return scores
+
+
+def assess_pacing(
+    transcription: str,
+    duration_seconds: float,
+    word_count: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Assess speaking pace
     
     Args:
         transcription: Transcribed text
         duration_seconds: Audio duration
+        word_count: Word count if already known (e.g. from assess_clarity)
         
     Returns:
         Dict with pacing metrics
@@ -283,12 +719,111 @@ def assess_pacing(transcription: str, duration_seconds: float) -> Dict[str, Any]
             "assessment": "Duration unavailable"
         }
     
-    word_count = len(transcription.split())
+    if word_count is None:
+        # Silence needs no tokenizing
+        word_count = 0 if _is_blank(transcription) else len(transcription.split())
     words_per_minute = (word_count / duration_seconds) * 60
+    pacing_score, assessment = pacing_from_wpm(words_per_minute)
     
-    # Ideal is 130-150 WPM for presentations
-    # Range: 100-180 WPM acceptable
+    return {
+        "pacing_score": pacing_score,
+        "words_per_minute": round(words_per_minute, 1),
+        "assessment": assessment
+    }
+
+
+def assess_pacing_batch(word_counts: List[int], durations: List[float]) -> List[Dict[str, Any]]:
+    """
+    Assess speaking pace for many answers at once
+    
+    Args:
+        word_counts: Word count per answer (e.g. from assess_clarity_batch)
+        durations: Audio duration per answer in seconds
+        
+    Returns:
+        List of pacing metric dicts (as assess_pacing), in input order
+    """
+    import numpy as np
+    
+    counts = np.asarray(word_counts, np.float64)
+    seconds = np.asarray(durations, np.float64)
+    known = seconds > 0
+    wpm = np.divide(counts * 60, seconds, out=np.zeros_like(counts), where=known)
+    scores = _pacing_scores(wpm)
+    
+    results = []
+    for i in range(len(counts)):
+        if not known[i]:
+            results.append({
+                "pacing_score": 75,
+                "words_per_minute": 0,
+                "assessment": "Duration unavailable"
+            })
+            continue
+        words_per_minute = float(wpm[i])
+        if words_per_minute < 100:
+            assessment = "Too slow"
+        elif words_per_minute > 180:
+            assessment = "Too fast"
+        else:
+            assessment = "Good pace"
+        results.append({
+            "pacing_score": int(scores[i]),
+            "words_per_minute": round(words_per_minute, 1),
+            "assessment": assessment
+        })
+    return results
+
+
+def _pacing_scores(words_per_minute: Any) -> Any:
+    """
+    Vectorized pacing tiers (same as pacing_from_wpm)
     
+    Args:
+        words_per_minute: float array of speaking rates
+        
+    Returns:
+        int32 array of pacing scores
+    """
+    import numpy as np
+    
+    wpm = words_per_minute
+    good = (wpm >= 100) & (wpm <= 180)
+    near = ((wpm >= 80) & (wpm < 100)) | ((wpm > 180) & (wpm <= 200))
+    return (50 + 35 * good + 20 * near).astype(np.int32)
+
+
+def clarity_assessment(clarity_score: int) -> str:
+    """
+    Describe a clarity score
+    
+    Args:
+        clarity_score: Clarity score (0-100)
+        
+    Returns:
+        Assessment label
+    """
+    if clarity_score >= 80:
+        return "Excellent clarity"
+    elif clarity_score >= 60:
+        return "Good clarity"
+    elif clarity_score >= 40:
+        return "Acceptable clarity"
+    return "Poor clarity"
+
+
+def pacing_from_wpm(words_per_minute: float) -> Tuple[int, str]:
+    """
+    Score a speaking rate
+    
+    Ideal is 130-150 WPM for presentations; 100-180 WPM is acceptable.
+    
+    Args:
+        words_per_minute: Speaking rate
+        
+    Returns:
+        Tuple of (pacing_score, assessment)
+    """
     if 100 <= words_per_minute <= 180:
         pacing_score = 85
     elif 80 <= words_per_minute < 100 or 180 < words_per_minute <= 200:
@@ -303,8 +838,4 @@ def assess_pacing(transcription: str, duration_seconds: float) -> Dict[str, Any]
     else:
         assessment = "Good pace"
     
-    return {
-        "pacing_score": pacing_score,
-        "words_per_minute": round(words_per_minute, 1),
-        "assessment": assessment
-    }
+    return pacing_score, assessment
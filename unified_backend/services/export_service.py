@@ -3,15 +3,19 @@ Export Service - Generate PDF and DOCX resume files
 Handles formatting, styling, and file generation for resume exports
 """
 
+import asyncio
+import functools
 import os
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import BinaryIO, Dict, List, Optional, Any, Union
 
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -20,14 +24,73 @@ from reportlab.lib import colors
 from reportlab.pdfgen import canvas
 
 
+# Shared export colors (RGBColor is an immutable tuple, safe to reuse)
+_DARK_BLUE = RGBColor(0, 51, 102)
+_DARK_GRAY = RGBColor(64, 64, 64)
+_GRAY = RGBColor(128, 128, 128)
+_GREEN = RGBColor(0, 128, 0)
+
+# DOCX font sizes
+_PT_8, _PT_9, _PT_10, _PT_11, _PT_12, _PT_16 = map(Pt, (8, 9, 10, 11, 12, 16))
+
+
 # ============================================================================
 # DOCX Export Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _docx_template() -> bytes:
+    """
+    Serialized base document with the default font styling applied.
+    
+    Built once per process; each export opens a copy of these bytes instead
+    of loading python-docx's default template and restyling it.
+    """
+    doc = Document()
+    
+    # Set default font
+    style = doc.styles['Normal']
+    style.font.name = 'Calibri'
+    style.font.size = _PT_11
+    
+    template = BytesIO()
+    doc.save(template)
+    return template.getvalue()
+
+
 def export_resume_to_docx(
     resume_content: Dict[str, Any],
     output_path: Optional[str] = None
 ) -> bytes:
+    """
+    Export resume to DOCX format and return the file bytes.
+    
+    Callers that only need the file on disk or in a response body should use
+    write_resume_docx, which saves straight into the sink without an
+    intermediate buffer.
+    
+    Args:
+        resume_content: Dictionary with resume sections (see write_resume_docx)
+        output_path: Optional file path to save DOCX file
+    
+    Returns:
+        Bytes of DOCX file content
+    """
+    doc_bytes = BytesIO()
+    write_resume_docx(resume_content, doc_bytes)
+    
+    # Optionally save to file, straight from the buffer without copying it
+    if output_path:
+        with open(output_path, 'wb') as f:
+            f.write(doc_bytes.getbuffer())
+    
+    return doc_bytes.getvalue()
+
+
+def write_resume_docx(
+    resume_content: Dict[str, Any],
+    out: Union[BinaryIO, str]
+) -> None:
     """
     Export resume to DOCX format with professional styling.
     
@@ -42,28 +105,20 @@ def export_resume_to_docx(
             - ats_score (optional ATS score)
             - match_percentage (optional match percentage)
         
-        output_path: Optional file path to save DOCX file
-    
-    Returns:
-        Bytes of DOCX file content
+        out: File path or writable binary stream the document is saved to
     """
     
-    # Create Document
-    doc = Document()
-    
-    # Set default font
-    style = doc.styles['Normal']
-    style.font.name = 'Calibri'
-    style.font.size = Pt(11)
+    # Create Document from the pre-styled template
+    doc = Document(BytesIO(_docx_template()))
     
     # ========== HEADER: Contact Information ==========
     if resume_content.get('name'):
         name_paragraph = doc.add_paragraph(resume_content['name'].upper())
         name_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         name_style = name_paragraph.runs[0]
-        name_style.font.size = Pt(16)
+        name_style.font.size = _PT_16
         name_style.font.bold = True
-        name_style.font.color.rgb = RGBColor(0, 51, 102)  # Dark blue
+        name_style.font.color.rgb = _DARK_BLUE
     
     # Contact details
     contact_info = []
@@ -78,7 +133,7 @@ def export_resume_to_docx(
         contact_paragraph = doc.add_paragraph(' | '.join(contact_info))
         contact_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         contact_style = contact_paragraph.runs[0]
-        contact_style.font.size = Pt(10)
+        contact_style.font.size = _PT_10
         contact_style.font.italic = True
     
     # Add ATS score if available
@@ -89,22 +144,20 @@ def export_resume_to_docx(
         )
         score_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         score_style = score_para.runs[0]
-        score_style.font.size = Pt(9)
-        score_style.font.color.rgb = RGBColor(0, 128, 0)  # Green
+        score_style.font.size = _PT_9
+        score_style.font.color.rgb = _GREEN
     
     doc.add_paragraph()  # Spacing
     
     # ========== PROFESSIONAL SUMMARY ==========
     if resume_content.get('summary'):
-        doc.add_heading('PROFESSIONAL SUMMARY', level=1)
-        _style_heading(doc.paragraphs[-1])
+        _style_heading(doc.add_heading('PROFESSIONAL SUMMARY', level=1))
         doc.add_paragraph(resume_content['summary'])
         doc.add_paragraph()
     
     # ========== SKILLS ==========
     if resume_content.get('skills'):
-        doc.add_heading('SKILLS', level=1)
-        _style_heading(doc.paragraphs[-1])
+        _style_heading(doc.add_heading('SKILLS', level=1))
         
         # Group skills if they're formatted with commas
         skills_list = resume_content['skills']
@@ -117,15 +170,13 @@ def export_resume_to_docx(
                               for s in skill_group.split(',')]
         
         # Add skills as bullet points
-        for skill in skills_list[:15]:  # Limit to top 15 skills
-            doc.add_paragraph(skill, style='List Bullet')
+        _add_bullets(doc, skills_list[:15])  # Limit to top 15 skills
         
         doc.add_paragraph()
     
     # ========== EXPERIENCE ==========
     if resume_content.get('experience'):
-        doc.add_heading('PROFESSIONAL EXPERIENCE', level=1)
-        _style_heading(doc.paragraphs[-1])
+        _style_heading(doc.add_heading('PROFESSIONAL EXPERIENCE', level=1))
         
         experiences = resume_content['experience']
         if not isinstance(experiences, list):
@@ -136,7 +187,7 @@ def export_resume_to_docx(
             title_para = doc.add_paragraph()
             title_run = title_para.add_run(f"{exp.get('title', 'Position')}")
             title_run.bold = True
-            title_run.font.size = Pt(12)
+            title_run.font.size = _PT_12
             
             company_run = title_para.add_run(f" at {exp.get('company', 'Company')}")
             company_run.italic = True
@@ -145,15 +196,14 @@ def export_resume_to_docx(
             duration_para = doc.add_paragraph(exp.get('duration', ''))
             duration_style = duration_para.runs[0] if duration_para.runs else None
             if duration_style:
-                duration_style.font.size = Pt(10)
+                duration_style.font.size = _PT_10
                 duration_style.font.italic = True
-                duration_style.font.color.rgb = RGBColor(128, 128, 128)
+                duration_style.font.color.rgb = _GRAY
             
             # Description
             description = exp.get('description', '')
             if isinstance(description, list):
-                for item in description:
-                    doc.add_paragraph(item, style='List Bullet')
+                _add_bullets(doc, description)
             else:
                 doc.add_paragraph(description)
             
@@ -161,8 +211,7 @@ def export_resume_to_docx(
     
     # ========== EDUCATION ==========
     if resume_content.get('education'):
-        doc.add_heading('EDUCATION', level=1)
-        _style_heading(doc.paragraphs[-1])
+        _style_heading(doc.add_heading('EDUCATION', level=1))
         
         education = resume_content['education']
         if not isinstance(education, list):
@@ -175,7 +224,7 @@ def export_resume_to_docx(
                 f"{edu.get('degree', 'Degree')}"
             )
             degree_run.bold = True
-            degree_run.font.size = Pt(11)
+            degree_run.font.size = _PT_11
             
             if edu.get('field'):
                 field_run = degree_para.add_run(f" in {edu['field']}")
@@ -185,29 +234,27 @@ def export_resume_to_docx(
             school_para = doc.add_paragraph(edu.get('school', 'University'))
             school_style = school_para.runs[0] if school_para.runs else None
             if school_style:
-                school_style.font.size = Pt(10)
+                school_style.font.size = _PT_10
             
             # Year
             if edu.get('year'):
                 year_para = doc.add_paragraph(f"Graduated: {edu['year']}")
                 year_style = year_para.runs[0] if year_para.runs else None
                 if year_style:
-                    year_style.font.size = Pt(9)
+                    year_style.font.size = _PT_9
                     year_style.font.italic = True
             
             doc.add_paragraph()
     
     # ========== ACHIEVEMENTS ==========
     if resume_content.get('achievements'):
-        doc.add_heading('ACHIEVEMENTS', level=1)
-        _style_heading(doc.paragraphs[-1])
+        _style_heading(doc.add_heading('ACHIEVEMENTS', level=1))
         
         achievements = resume_content['achievements']
         if not isinstance(achievements, list):
             achievements = [achievements]
         
-        for achievement in achievements:
-            doc.add_paragraph(achievement, style='List Bullet')
+        _add_bullets(doc, achievements)
         
         doc.add_paragraph()
     
@@ -217,29 +264,43 @@ def export_resume_to_docx(
     footer_run = footer_para.add_run(
         f"Generated on {datetime.now().strftime('%B %d, %Y')}"
     )
-    footer_run.font.size = Pt(8)
+    footer_run.font.size = _PT_8
     footer_run.font.italic = True
-    footer_run.font.color.rgb = RGBColor(128, 128, 128)
+    footer_run.font.color.rgb = _GRAY
     
-    # Save to bytes
-    doc_bytes = BytesIO()
-    doc.save(doc_bytes)
-    doc_bytes.seek(0)
-    
-    # Optionally save to file
-    if output_path:
-        with open(output_path, 'wb') as f:
-            f.write(doc_bytes.getvalue())
+    doc.save(out)
+
+
+def _add_bullets(doc, items) -> None:
+    """
+    Append 'List Bullet' paragraphs for items in one splice of the body XML.
     
-    return doc_bytes.getvalue()
+    Builds the <w:p> elements directly rather than through add_paragraph,
+    which resolves the style and wraps a Paragraph proxy for every item.
+    """
+    style_id = doc.styles['List Bullet'].style_id
+    
+    paragraphs = []
+    for item in items:
+        p = OxmlElement('w:p')
+        p.get_or_add_pPr().style = style_id
+        p.add_r().text = str(item)
+        paragraphs.append(p)
+    
+    # Body content goes before the trailing section properties
+    body = doc.element.body
+    sect_pr = body.sectPr
+    index = body.index(sect_pr) if sect_pr is not None else len(body)
+    body[index:index] = paragraphs
 
 
 def _style_heading(paragraph):
     """Style a heading paragraph"""
     for run in paragraph.runs:
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(0, 51, 102)  # Dark blue
-        run.font.size = Pt(12)
+        font = run.font
+        font.bold = True
+        font.color.rgb = _DARK_BLUE
+        font.size = _PT_12
 
 
 # ============================================================================
@@ -280,7 +341,7 @@ def export_resume_to_pdf(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=18,
-        textColor=RGBColor(0, 51, 102),  # Dark blue
+        textColor=_DARK_BLUE,
         spaceAfter=6,
         alignment=1,  # Center
         fontName='Helvetica-Bold'
@@ -290,12 +351,12 @@ def export_resume_to_pdf(
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=12,
-        textColor=RGBColor(0, 51, 102),
+        textColor=_DARK_BLUE,
         spaceAfter=8,
         spaceBefore=8,
         fontName='Helvetica-Bold',
         borderBottom=2,
-        borderColor=RGBColor(0, 51, 102)
+        borderColor=_DARK_BLUE
     )
     
     contact_style = ParagraphStyle(
@@ -303,7 +364,7 @@ def export_resume_to_pdf(
         parent=styles['Normal'],
         fontSize=9,
         alignment=1,  # Center
-        textColor=RGBColor(64, 64, 64),
+        textColor=_DARK_GRAY,
         spaceAfter=4
     )
     
@@ -393,7 +454,7 @@ def export_resume_to_pdf(
                 duration_style = ParagraphStyle(
                     'Duration',
                     parent=normal_style,
-                    textColor=RGBColor(128, 128, 128),
+                    textColor=_GRAY,
                     fontSize=9
                 )
                 story.append(Paragraph(exp['duration'], duration_style))
@@ -430,7 +491,7 @@ def export_resume_to_pdf(
                     'Year',
                     parent=normal_style,
                     fontSize=9,
-                    textColor=RGBColor(128, 128, 128)
+                    textColor=_GRAY
                 )
                 story.append(Paragraph(f"Graduated: {edu['year']}", year_style))
             
@@ -454,7 +515,7 @@ def export_resume_to_pdf(
         'Footer',
         parent=normal_style,
         fontSize=8,
-        textColor=RGBColor(128, 128, 128),
+        textColor=_GRAY,
         alignment=1
     )
     story.append(Paragraph(
@@ -652,58 +713,136 @@ def export_resume(
     
     name = resume_content.get('name', 'resume')
     
-    if export_format in ('pdf', 'all'):
-        try:
-            pdf_bytes = export_resume_to_pdf(resume_content)
-            result['formats']['pdf'] = {
-                "size_bytes": len(pdf_bytes),
-                "generated": True
-            }
-            
-            if output_dir:
-                export_dir = create_export_dir(output_dir)
-                filename = generate_filename(name, 'pdf')
-                filepath = Path(export_dir) / filename
-                with open(filepath, 'wb') as f:
-                    f.write(pdf_bytes)
-                result['formats']['pdf']['filepath'] = str(filepath)
-        except Exception as e:
-            result['formats']['pdf'] = {"error": str(e), "generated": False}
-    
-    if export_format in ('docx', 'all'):
-        try:
-            docx_bytes = export_resume_to_docx(resume_content)
-            result['formats']['docx'] = {
-                "size_bytes": len(docx_bytes),
-                "generated": True
-            }
-            
-            if output_dir:
-                export_dir = create_export_dir(output_dir)
-                filename = generate_filename(name, 'docx')
-                filepath = Path(export_dir) / filename
-                with open(filepath, 'wb') as f:
-                    f.write(docx_bytes)
-                result['formats']['docx']['filepath'] = str(filepath)
-        except Exception as e:
-            result['formats']['docx'] = {"error": str(e), "generated": False}
-    
-    if export_format in ('text', 'all'):
-        try:
-            text_content = export_resume_to_text(resume_content)
-            result['formats']['text'] = {
-                "size_bytes": len(text_content.encode('utf-8')),
-                "generated": True
+    # Create the output directory once for all formats
+    export_dir = create_export_dir(output_dir) if output_dir else None
+    
+    formats = _select_formats(export_format)
+    
+    if len(formats) > 1:
+        # Generate and write each format in its own thread; reportlab,
+        # python-docx and file I/O release the GIL for much of the work
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {
+                fmt: executor.submit(_export_format, resume_content, fmt, name, export_dir)
+                for fmt in formats
             }
-            
-            if output_dir:
-                export_dir = create_export_dir(output_dir)
-                filename = generate_filename(name, 'txt')
-                filepath = Path(export_dir) / filename
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(text_content)
-                result['formats']['text']['filepath'] = str(filepath)
-        except Exception as e:
-            result['formats']['text'] = {"error": str(e), "generated": False}
+            result['formats'] = {fmt: future.result() for fmt, future in futures.items()}
+    else:
+        for fmt in formats:
+            result['formats'][fmt] = _export_format(resume_content, fmt, name, export_dir)
     
     return result
+
+
+async def export_resume_async(
+    resume_content: Dict[str, Any],
+    export_format: str = "all",
+    output_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Export resume in multiple formats without blocking the event loop.
+    
+    Same result as export_resume, but each format is generated and written
+    concurrently on the loop's default executor, so a request waits for the
+    slowest format rather than the sum of all of them.
+    
+    Args:
+        resume_content: Dictionary with resume sections
+        export_format: 'pdf', 'docx', 'text', or 'all'
+        output_dir: Directory to save files (optional)
+    
+    Returns:
+        Dictionary with file bytes and metadata
+    """
+    timestamp = datetime.now().isoformat()
+    name = resume_content.get('name', 'resume')
+    export_dir = create_export_dir(output_dir) if output_dir else None
+    
+    formats = _select_formats(export_format)
+    infos = await asyncio.gather(*(
+        asyncio.to_thread(_export_format, resume_content, fmt, name, export_dir)
+        for fmt in formats
+    ))
+    
+    return {
+        "status": "success",
+        "formats": dict(zip(formats, infos)),
+        "timestamp": timestamp
+    }
+
+
+def _select_formats(export_format: str) -> List[str]:
+    """Map an export_format argument to the _FORMAT_EXPORTERS keys it covers."""
+    if export_format == 'all':
+        return list(_FORMAT_EXPORTERS)
+    if export_format in _FORMAT_EXPORTERS:
+        return [export_format]
+    return []
+
+
+def _export_format(
+    resume_content: Dict[str, Any],
+    fmt: str,
+    name: str,
+    export_dir: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Generate one export format and optionally write it to export_dir.
+    
+    Args:
+        resume_content: Dictionary with resume sections
+        fmt: Key of _FORMAT_EXPORTERS
+        name: Candidate name used for the filename
+        export_dir: Existing directory to save the file (optional)
+    
+    Returns:
+        Format metadata, or an error entry if generation failed
+    """
+    exporter, extension = _FORMAT_EXPORTERS[fmt]
+    
+    try:
+        writer = _FORMAT_WRITERS.get(fmt)
+        if export_dir and writer:
+            # Save straight into the file; the size is wherever writing stopped
+            filepath = Path(export_dir) / generate_filename(name, extension)
+            with open(filepath, 'wb') as f:
+                writer(resume_content, f)
+                size = f.tell()
+            return {
+                "size_bytes": size,
+                "generated": True,
+                "filepath": str(filepath)
+            }
+        
+        content = exporter(resume_content)
+        
+        # Encode text once; the bytes serve both the size and a single write
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        info = {
+            "size_bytes": len(data),
+            "generated": True
+        }
+        
+        if export_dir:
+            filename = generate_filename(name, extension)
+            filepath = Path(export_dir) / filename
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            info['filepath'] = str(filepath)
+        
+        return info
+    except Exception as e:
+        return {"error": str(e), "generated": False}
+
+
+# Exporter function and file extension for each format, in result order
+_FORMAT_EXPORTERS = {
+    "pdf": (export_resume_to_pdf, "pdf"),
+    "docx": (export_resume_to_docx, "docx"),
+    "text": (export_resume_to_text, "txt")
+}
+
+# Formats that can be saved directly into an open file, skipping the bytes copy
+_FORMAT_WRITERS = {
+    "docx": write_resume_docx
+}
@@ -8,12 +8,14 @@ Interview Generation Service
 from .question_generator import (
     initialize_llm,
     generate_questions,
+    generate_questions_with_status,
     generate_default_questions,
     generate_mock_interview_session
 )
 
 from .evaluator import (
     evaluate_answer,
+    evaluate_answers_batch,
     generate_default_evaluation,
     calculate_session_score,
     generate_interview_feedback,
@@ -25,6 +27,7 @@ from .session_store import (
     save_session,
     load_session,
     add_question,
+    add_questions_bulk,
     mark_question_asked,
     add_answer,
     get_next_question,
@@ -38,10 +41,12 @@ __all__ = [
     # Question Generation
     "initialize_llm",
     "generate_questions",
+    "generate_questions_with_status",
     "generate_default_questions",
     "generate_mock_interview_session",
     # Answer Evaluation
     "evaluate_answer",
+    "evaluate_answers_batch",
     "generate_default_evaluation",
     "calculate_session_score",
     "generate_interview_feedback",
@@ -51,6 +56,7 @@ __all__ = [
     "save_session",
     "load_session",
     "add_question",
+    "add_questions_bulk",
     "mark_question_asked",
     "add_answer",
     "get_next_question",
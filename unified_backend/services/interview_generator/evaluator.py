@@ -52,6 +52,51 @@ def evaluate_answer(
     if llm is None:
         llm = initialize_llm()
     
+    try:
+        response = llm.invoke(_evaluation_messages(question, answer, role, experience_level))
+        return _parse_evaluation(response.content, question, answer, role, experience_level)
+    except Exception as e:
+        print(f"Error evaluating answer: {e}")
+        return generate_default_evaluation(question, answer, role, experience_level)
+
+
+def evaluate_answers_batch(items: list, llm=None) -> list:
+    """
+    Evaluate several answers with one batched LLM call
+    
+    Args:
+        items: List of dicts with evaluate_answer keyword arguments
+               (question, answer, and optionally role, experience_level)
+        llm: Optional pre-initialized LLM
+    
+    Returns:
+        List of evaluation dictionaries, in the same order as items
+    """
+    
+    if llm is None:
+        llm = initialize_llm()
+    
+    calls = [
+        {"role": "Software Engineer", "experience_level": "mid", **item}
+        for item in items
+    ]
+    responses = llm.batch(
+        [_evaluation_messages(**req) for req in calls],
+        return_exceptions=True
+    )
+    
+    evaluations = []
+    for req, response in zip(calls, responses):
+        if isinstance(response, Exception):
+            print(f"Error evaluating answer: {response}")
+            evaluations.append(generate_default_evaluation(**req))
+        else:
+            evaluations.append(_parse_evaluation(response.content, **req))
+    return evaluations
+
+
+def _evaluation_messages(question: str, answer: str, role: str, experience_level: str) -> list:
+    """Build the chat messages for evaluating one answer"""
     system_message = """You are an expert technical interviewer and hiring manager.
     Evaluate the candidate's answer and provide a structured assessment.
     
@@ -77,32 +122,30 @@ def evaluate_answer(
     
     Provide a JSON evaluation with score (0-100), strengths, weaknesses, feedback, and suggestions."""
     
-    try:
-        messages = [
-            SystemMessage(content=system_message),
-            HumanMessage(content=human_prompt)
-        ]
-        
-        response = llm.invoke(messages)
-        content = response.content
-        
-        # Parse JSON from response
-        json_start = content.find('{')
-        json_end = content.rfind('}') + 1
-        
-        if json_start >= 0 and json_end > json_start:
-            json_str = content[json_start:json_end]
-            evaluation = json.loads(json_str)
-            return evaluation
-        else:
-            return generate_default_evaluation(question, answer, role, experience_level)
-            
-    except json.JSONDecodeError as e:
-        print(f"Error parsing evaluation JSON: {e}")
-        return generate_default_evaluation(question, answer, role, experience_level)
-    except Exception as e:
-        print(f"Error evaluating answer: {e}")
-        return generate_default_evaluation(question, answer, role, experience_level)
+    return [
+        SystemMessage(content=system_message),
+        HumanMessage(content=human_prompt)
+    ]
+
+
+def _parse_evaluation(
+    content: str,
+    question: str,
+    answer: str,
+    role: str,
+    experience_level: str
+) -> dict:
+    """Extract the JSON evaluation from an LLM response, falling back to defaults"""
+    json_start = content.find('{')
+    json_end = content.rfind('}') + 1
+    
+    if json_start >= 0 and json_end > json_start:
+        try:
+            return json.loads(content[json_start:json_end])
+        except json.JSONDecodeError as e:
+            print(f"Error parsing evaluation JSON: {e}")
+    
+    return generate_default_evaluation(question, answer, role, experience_level)
 
 
 def generate_default_evaluation(
@@ -113,6 +156,9 @@ def generate_default_evaluation(
 ) -> dict:
     """
     Generate default evaluation when LLM fails
+    
+    The result carries "is_fallback": True so callers can tell it apart
+    from a real LLM evaluation (e.g. to avoid caching it).
     """
     
     # Basic scoring logic
@@ -153,7 +199,8 @@ def generate_default_evaluation(
                    f"Score: {score}/100",
         "suggestions": "Consider adding specific implementation details, edge cases, "
                       "and performance considerations to strengthen your answer.",
-        "follow_up_question": "How would you optimize this solution for scalability?"
+        "follow_up_question": "How would you optimize this solution for scalability?",
+        "is_fallback": True
     }
 
 
@@ -5,7 +5,7 @@ Generates contextual interview questions based on resume, role, and skills
 
 import os
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from langchain_groq import ChatGroq
 
 try:
@@ -13,6 +13,9 @@ try:
 except ImportError:
     from langchain.schema import HumanMessage, SystemMessage
 
+# Numbered questions ("1. ...") in an LLM response
+_NUMBERED_QUESTION_RE = re.compile(r'\d+\.\s*(.+?)(?=\n\d+\.|$)', re.DOTALL)
+
 
 def initialize_llm():
     """Initialize Groq LLM for question generation"""
@@ -50,6 +53,31 @@ def generate_questions(
     Returns:
         List of interview questions
     """
+    questions, _ = generate_questions_with_status(
+        role, experience_level, skills, num_questions, resume_content, llm
+    )
+    return questions
+
+
+def generate_questions_with_status(
+    role: str,
+    experience_level: str,
+    skills: Optional[List[str]] = None,
+    num_questions: int = 30,
+    resume_content: Optional[str] = None,
+    llm=None
+) -> Tuple[List[str], bool]:
+    """
+    Generate interview questions, reporting whether the LLM produced them
+    
+    Args:
+        Same as generate_questions
+    
+    Returns:
+        Tuple of (questions, is_fallback); is_fallback is True when the LLM
+        call failed and the questions are generate_default_questions
+        templates (e.g. so callers don't cache them)
+    """
     if llm is None:
         llm = initialize_llm()
     
@@ -95,8 +123,7 @@ def generate_questions(
         questions = []
         
         # Try to find numbered questions
-        pattern = r'\d+\.\s*(.+?)(?=\n\d+\.|$)'
-        matches = re.findall(pattern, content, re.DOTALL)
+        matches = _NUMBERED_QUESTION_RE.findall(content)
         
         if matches:
             questions = [q.strip().rstrip('?') + '?' if not q.strip().endswith('?') 
@@ -107,11 +134,11 @@ def generate_questions(
             questions = [q for q in lines if len(q) > 10]
         
         # Return requested number of questions
-        return questions[:num_questions]
+        return questions[:num_questions], False
         
     except Exception as e:
         print(f"Error generating questions: {e}")
-        return generate_default_questions(role, experience_level, skills, num_questions)
+        return generate_default_questions(role, experience_level, skills, num_questions), True
 
 
 def generate_default_questions(
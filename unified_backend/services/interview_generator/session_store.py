@@ -6,7 +6,7 @@ Manages interview session persistence and retrieval
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 # Define sessions directory relative to this file
@@ -75,6 +75,28 @@ def add_question(session_id: str, question: str) -> None:
     save_session(session_id, session)
 
 
+def add_questions_bulk(session_id: str, questions: List[str]) -> Dict[str, Any]:
+    """
+    Add several questions to the session with a single read and write
+    
+    Args:
+        session_id: Session identifier
+        questions: Questions to append (duplicates are skipped)
+    
+    Returns:
+        Updated session data
+    """
+    session = load_session(session_id)
+    existing = session.setdefault("questions", [])
+    seen = set(existing)
+    for question in questions:
+        if question not in seen:
+            seen.add(question)
+            existing.append(question)
+    save_session(session_id, session)
+    return session
+
+
 def mark_question_asked(session_id: str, question: str) -> None:
     """Mark a question as asked"""
     session = load_session(session_id)
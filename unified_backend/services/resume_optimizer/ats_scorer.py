@@ -5,11 +5,24 @@ Calculates keyword match, quantified achievements, skills relevance, and overall
 
 import json
 import os
+import re
 from langchain_groq import ChatGroq
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
+# Top-weighted terms compared between resume and job description
+TOP_KEYWORDS = 20
+
+# Phrases that mark a requirement line, as one alternation so each line is
+# scanned once instead of once per phrase
+_REQUIREMENT_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in (
+        "requirements:", "qualifications:", "must have", "should have",
+        "required skills", "looking for", "ideal candidate"
+    )),
+    re.IGNORECASE,
+)
+
 
 def initialize_llm():
     """
@@ -66,6 +79,14 @@ def get_structured_json_output(llm, system_message, human_prompt):
         return None
 
 
+def _top_terms(row, k):
+    """
+    Vocabulary indices of a sparse TF-IDF row's k heaviest terms, heaviest first
+    """
+    order = np.argsort(-row.data, kind="stable")[:k]
+    return row.indices[order]
+
+
 def calculate_keyword_match_score(resume_text, job_description):
     """
     Calculate keyword match score between resume and job description using TF-IDF
@@ -79,45 +100,29 @@ def calculate_keyword_match_score(resume_text, job_description):
         vectorizer = TfidfVectorizer(stop_words='english', max_features=100)
         tfidf_matrix = vectorizer.fit_transform(texts)
         
-        # Calculate cosine similarity
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-        keyword_match_score = min(similarity[0][0] * 100, 100)
+        # Rows are L2-normalized, so cosine similarity is their dot product
+        resume_tfidf, job_tfidf = tfidf_matrix[0], tfidf_matrix[1]
+        similarity = resume_tfidf.multiply(job_tfidf).sum()
+        keyword_match_score = min(similarity * 100, 100)
         
-        # Extract top keywords from job description
-        job_tfidf = tfidf_matrix[1]
-        feature_names = vectorizer.get_feature_names_out()
+        # Compare top keywords as vocabulary indices rather than strings
+        job_top = _top_terms(job_tfidf, TOP_KEYWORDS)
+        resume_top = _top_terms(resume_tfidf, TOP_KEYWORDS)
+        in_resume = np.isin(job_top, resume_top)
         
-        job_keywords = []
-        resume_keywords = []
-        
-        # Get job description keywords
-        job_indices = job_tfidf.nonzero()[1]
-        if len(job_indices) > 0:
-            job_scores = zip(job_indices, job_tfidf.data)
-            job_scores = sorted(job_scores, key=lambda x: x[1], reverse=True)
-            job_keywords = [feature_names[i] for i, _ in job_scores[:20]]
-        
-        # Get resume keywords
-        resume_tfidf = tfidf_matrix[0]
-        resume_indices = resume_tfidf.nonzero()[1]
-        if len(resume_indices) > 0:
-            resume_scores = zip(resume_indices, resume_tfidf.data)
-            resume_scores = sorted(resume_scores, key=lambda x: x[1], reverse=True)
-            resume_keywords = [feature_names[i] for i, _ in resume_scores[:20]]
-        
-        # Find matched and missing keywords
-        matched_keywords = list(set(job_keywords) & set(resume_keywords))
-        missing_keywords = list(set(job_keywords) - set(resume_keywords))
+        feature_names = vectorizer.get_feature_names_out()
+        matched_keywords = feature_names[job_top[in_resume]].tolist()
+        missing_keywords = feature_names[job_top[~in_resume]].tolist()
         
-        match_percentage = (len(matched_keywords) / len(job_keywords) * 100) if job_keywords else 0
+        match_percentage = (len(matched_keywords) / len(job_top) * 100) if len(job_top) else 0
         
         return {
             "keyword_match_score": round(keyword_match_score, 2),
             "match_percentage": round(match_percentage, 2),
             "matched_keywords": matched_keywords[:10],
             "missing_keywords": missing_keywords[:10],
-            "total_job_keywords": len(job_keywords),
-            "resume_keywords_count": len(resume_keywords)
+            "total_job_keywords": len(job_top),
+            "resume_keywords_count": len(resume_top)
         }
         
     except Exception as e:
@@ -301,19 +306,12 @@ def extract_all_bullet_points(resume_data):
 
 def extract_job_requirements(job_description):
     """Extract key requirements from job description (simplified)"""
-    requirements = []
-    
-    # Look for common requirement indicators
-    requirement_phrases = [
-        "requirements:", "qualifications:", "must have", "should have", 
-        "required skills", "looking for", "ideal candidate"
+    # Keep lines containing a common requirement indicator
+    requirements = [
+        line for line in job_description.split('\n')
+        if _REQUIREMENT_RE.search(line)
     ]
     
-    lines = job_description.split('\n')
-    for line in lines:
-        if any(phrase in line.lower() for phrase in requirement_phrases):
-            requirements.append(line)
-    
     return requirements if requirements else [job_description]
 
 
@@ -11,7 +11,12 @@ Exports all parser functions for resume extraction and parsing:
 
 from .file_parser import extract_text_from_file, get_text_preview, get_text_summary
 from .linkedin_parser import parse_linkedin_profile, validate_linkedin_url
-from .github_parser import parse_github_profile, get_user_stats
+from .github_parser import (
+    parse_github_profile,
+    parse_github_profile_async,
+    parse_github_profiles,
+    get_user_stats
+)
 from .ollama_parser import parse_resume_with_ollama, check_ollama_available, get_available_models
 
 __all__ = [
@@ -21,6 +26,8 @@ __all__ = [
     "parse_linkedin_profile",
     "validate_linkedin_url",
     "parse_github_profile",
+    "parse_github_profile_async",
+    "parse_github_profiles",
     "get_user_stats",
     "parse_resume_with_ollama",
     "check_ollama_available",
@@ -5,18 +5,192 @@ Uses the GitHub public API to fetch user profile data and repository information
 Returns user info, biography, followers, and top repositories by star count.
 """
 
+import os
+import re
+import asyncio
+import time
+import heapq
+import random
+import functools
+import threading
+import orjson
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # Fall back to sequential requests calls
+    aiohttp = None
 
 
 # GitHub API base URL
 GITHUB_API_BASE = "https://api.github.com"
 
+# GitHub GraphQL endpoint (requires a token)
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Optional API token; enables GraphQL and the authenticated rate limit
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+
+# Request timeout in seconds
+GITHUB_API_TIMEOUT = 10
+
+# Pause before a request once fewer than this many calls remain
+RATE_LIMIT_THRESHOLD = 5
+
+# Longest pause (seconds) for the rate-limit window to reset before giving up
+RATE_LIMIT_MAX_WAIT = 60
+
+# Retries after a 403/429 rate-limit response
+RATE_LIMIT_MAX_RETRIES = 5
+
+# 1-39 alphanumerics or hyphens, no leading/trailing or consecutive hyphens
+_USERNAME_RE = re.compile(r'^(?!-)(?!.*--)[A-Za-z0-9-]{1,39}(?<!-)$')
+
+# Number of top repositories included in a profile
+TOP_REPOS_LIMIT = 3
+
+# Top repositories by stars, sorted and projected server-side
+TOP_REPOS_QUERY = """
+query($login: String!, $limit: Int!) {
+  user(login: $login) {
+    repositories(first: $limit, ownerAffiliations: OWNER, orderBy: {field: STARGAZERS, direction: DESC}) {
+      nodes {
+        name
+        url
+        description
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        updatedAt
+      }
+    }
+  }
+}
+"""
+
+# Query parameters for the repository listing
+REPOS_PARAMS = {
+    "per_page": 100,
+    "sort": "updated",
+    "direction": "desc"
+}
+
+# Seconds a cached API response stays valid
+GITHUB_CACHE_TTL = 300
+
+# Maximum number of cached API responses
+GITHUB_CACHE_MAXSIZE = 10000
+
+# Cached API responses: (function name, lowercase username, *args) -> (timestamp, etag, value)
+# Expired entries are kept so their ETag can be revalidated with If-None-Match.
+_CACHE: Dict[Tuple, Tuple[float, Optional[str], Any]] = {}
+
+# Sentinel returned by _cache_get on a miss
+_MISS = object()
+
+# Sentinel returned by the fetchers on a 304 Not Modified response
+_NOT_MODIFIED = object()
+
+
+def _cache_get(key: Tuple, ttl: float = GITHUB_CACHE_TTL) -> Tuple[Any, Optional[str]]:
+    """
+    Look up a cached API response.
+    
+    Args:
+        key (tuple): Cache key
+        ttl (float): Maximum age in seconds
+        
+    Returns:
+        tuple: (cached value or _MISS if absent or expired, stored ETag)
+    """
+    entry = _CACHE.get(key)
+    if entry is None:
+        return _MISS, None
+    timestamp, etag, value = entry
+    if time.monotonic() - timestamp >= ttl:
+        return _MISS, etag
+    return value, etag
+
+
+def _cache_set(key: Tuple, value: Any, etag: Optional[str] = None) -> None:
+    """
+    Store an API response, evicting the oldest entry when full.
+    
+    Args:
+        key (tuple): Cache key
+        value: Decoded API response
+        etag (str, optional): ETag header of the response
+    """
+    if key not in _CACHE and len(_CACHE) >= GITHUB_CACHE_MAXSIZE:
+        _CACHE.pop(next(iter(_CACHE)), None)
+    _CACHE[key] = (time.monotonic(), etag, value)
+
+
+def _cache_revalidate(key: Tuple) -> Any:
+    """
+    Refresh the timestamp of an entry after a 304 response.
+    
+    Args:
+        key (tuple): Cache key
+        
+    Returns:
+        The cached value, or _MISS if it was evicted meanwhile
+    """
+    entry = _CACHE.get(key)
+    if entry is None:
+        return _MISS
+    _CACHE[key] = (time.monotonic(), entry[1], entry[2])
+    return entry[2]
+
+
+def ttl_cache(ttl: float = GITHUB_CACHE_TTL) -> Callable:
+    """
+    Cache a per-username fetcher's result for ttl seconds.
+    
+    The key is the function name, the lowercased username and any extra
+    positional arguments. The wrapped fetcher takes an ``etag`` keyword and
+    returns ``(etag, value)``, or ``(etag, _NOT_MODIFIED)`` on a 304; the
+    wrapper returns the value alone.
+    
+    Args:
+        ttl (float): Seconds a cached value stays valid
+        
+    Returns:
+        Decorator
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(username: str, *args):
+            key = (fn.__name__, username.lower()) + args
+            value, etag = _cache_get(key, ttl)
+            if value is not _MISS:
+                return value
+            
+            etag, value = fn(username, *args, etag=etag)
+            if value is _NOT_MODIFIED:
+                value = _cache_revalidate(key)
+                if value is not _MISS:
+                    return value
+                etag, value = fn(username, *args)
+            
+            _cache_set(key, value, etag)
+            return value
+        return wrapper
+    return decorator
+
 
 def parse_github_profile(username: str) -> dict:
     """
     Parse GitHub profile information for a given username.
     
+    The user and repository endpoints are fetched concurrently when aiohttp
+    is installed and no event loop is running; otherwise they are fetched
+    one after the other with requests. Async callers should await
+    parse_github_profile_async instead.
+    
     Args:
         username (str): GitHub username
         
@@ -27,46 +201,19 @@ def parse_github_profile(username: str) -> dict:
         ValueError: If username is invalid
         requests.exceptions.RequestException: If API request fails
     """
-    if not username or not isinstance(username, str):
-        raise ValueError("GitHub username must be a non-empty string")
+    _validate_username(username)
     
-    # Validate username format (GitHub usernames are alphanumeric and hyphens)
-    if not _is_valid_github_username(username):
-        raise ValueError(
-            "Invalid GitHub username. Usernames can only contain alphanumeric characters and hyphens."
-        )
+    if aiohttp is not None and not _event_loop_running():
+        return asyncio.run(_aparse_github_profile(username))
     
     try:
         # Fetch user profile data
         user_data = _fetch_user_data(username)
         
-        # Fetch user repositories
-        repos_data = _fetch_user_repos(username)
-        
-        # Get top 3 repositories by star count
-        top_repos = _get_top_repos(repos_data, limit=3)
+        # Fetch top repositories
+        top_repos = _fetch_top_repos(username)
         
-        # Construct the response
-        profile = {
-            "status": "success",
-            "username": username,
-            "name": user_data.get("name", "N/A"),
-            "bio": user_data.get("bio", "N/A"),
-            "avatar_url": user_data.get("avatar_url", ""),
-            "profile_url": user_data.get("html_url", ""),
-            "location": user_data.get("location", "N/A"),
-            "blog": user_data.get("blog", "N/A"),
-            "email": user_data.get("email", "N/A"),
-            "followers": user_data.get("followers", 0),
-            "following": user_data.get("following", 0),
-            "public_repos": user_data.get("public_repos", 0),
-            "created_at": user_data.get("created_at", ""),
-            "updated_at": user_data.get("updated_at", ""),
-            "top_repositories": top_repos,
-            "api_response_time": "N/A"
-        }
-        
-        return profile
+        return _build_profile(username, user_data, top_repos)
         
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
@@ -76,48 +223,484 @@ def parse_github_profile(username: str) -> dict:
         raise Exception(f"Failed to fetch GitHub profile for '{username}': {str(e)}")
 
 
-def _fetch_user_data(username: str) -> dict:
+async def parse_github_profile_async(username: str) -> dict:
+    """
+    Async variant of parse_github_profile for use inside an event loop.
+    
+    Args:
+        username (str): GitHub username
+        
+    Returns:
+        dict: Profile information including name, bio, followers, and top repositories
+        
+    Raises:
+        ValueError: If username is invalid or the user does not exist
+    """
+    _validate_username(username)
+    
+    if aiohttp is None:
+        return await asyncio.to_thread(parse_github_profile, username)
+    
+    return await _aparse_github_profile(username)
+
+
+async def parse_github_profiles(usernames: List[str], concurrency: int = 32) -> List[Any]:
+    """
+    Parse several GitHub profiles concurrently over one shared session.
+    
+    Args:
+        usernames (list): GitHub usernames
+        concurrency (int): Maximum number of profiles fetched at once
+        
+    Returns:
+        list: One entry per username, in input order - the profile dict, or
+            the exception raised for that username
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    if aiohttp is None:
+        async def bound_sync(username: str) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(parse_github_profile, username)
+        
+        return await asyncio.gather(*(bound_sync(u) for u in usernames), return_exceptions=True)
+    
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=32)
+    async with _create_async_session(connector=connector) as session:
+        async def bound(username: str) -> dict:
+            _validate_username(username)
+            async with semaphore:
+                return await _aparse_github_profile(username, session=session)
+        
+        return await asyncio.gather(*(bound(u) for u in usernames), return_exceptions=True)
+
+
+def _create_async_session(**kwargs) -> "aiohttp.ClientSession":
+    """
+    Create an aiohttp session with the GitHub API headers and timeout.
+    
+    Args:
+        **kwargs: Extra ClientSession arguments (e.g. connector)
+        
+    Returns:
+        aiohttp.ClientSession: New client session
+    """
+    return aiohttp.ClientSession(
+        headers=_get_api_headers(),
+        timeout=aiohttp.ClientTimeout(total=GITHUB_API_TIMEOUT),
+        **kwargs
+    )
+
+
+async def _aparse_github_profile(username: str, session: Optional["aiohttp.ClientSession"] = None) -> dict:
+    """
+    Fetch user profile and repositories concurrently and build the profile.
+    
+    Args:
+        username (str): GitHub username (already validated)
+        session (aiohttp.ClientSession, optional): Session to reuse; a
+            short-lived one is created when omitted
+        
+    Returns:
+        dict: Profile information
+    """
+    username_key = username.lower()
+    user_key = ("_fetch_user_data", username_key)
+    
+    user_data, top_repos = _cache_get(user_key)[0], _cached_top_repos(username_key)
+    if user_data is not _MISS and top_repos is not _MISS:
+        return _build_profile(username, user_data, top_repos)
+    
+    owns_session = session is None
+    if owns_session:
+        session = _create_async_session()
+    
+    try:
+        user_url = f"{GITHUB_API_BASE}/users/{username}"
+        user_data, top_repos = await asyncio.gather(
+            _afetch_cached(user_key, lambda etag: _afetch(session, user_url, etag=etag)),
+            _afetch_top_repos(session, username)
+        )
+    except aiohttp.ClientResponseError as e:
+        if e.status == 404:
+            raise ValueError(f"GitHub user '{username}' not found")
+        raise
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise Exception(f"Failed to fetch GitHub profile for '{username}': {str(e)}")
+    finally:
+        if owns_session:
+            await session.close()
+    
+    return _build_profile(username, user_data, top_repos)
+
+
+async def _afetch(
+    session: "aiohttp.ClientSession",
+    url: str,
+    params: Optional[dict] = None,
+    etag: Optional[str] = None
+) -> Tuple[Optional[str], Any]:
+    """
+    Perform a conditional GET against the GitHub API and decode the JSON body.
+    
+    Args:
+        session (aiohttp.ClientSession): Open client session
+        url (str): Request URL
+        params (dict, optional): Query parameters
+        etag (str, optional): ETag to send as If-None-Match
+        
+    Returns:
+        tuple: (ETag, decoded JSON response or _NOT_MODIFIED)
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    response, body = await _arequest(session, "GET", url, params=params, headers=headers)
+    if response.status == 304:
+        return etag, _NOT_MODIFIED
+    return response.headers.get("ETag"), body
+
+
+async def _arequest(session: "aiohttp.ClientSession", method: str, url: str, **kwargs) -> Tuple["aiohttp.ClientResponse", Any]:
+    """
+    Send a rate-limited request, backing off on 403/429 rate-limit responses.
+    
+    Args:
+        session (aiohttp.ClientSession): Open client session
+        method (str): HTTP method
+        url (str): Request URL
+        **kwargs: Extra request arguments
+        
+    Returns:
+        tuple: (response, decoded JSON body or None for a 304)
+    """
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        await _LIMITER.acquire()
+        async with session.request(method, url, **kwargs) as response:
+            _LIMITER.update(response.headers)
+            if attempt == RATE_LIMIT_MAX_RETRIES or not _is_rate_limited(response.status, response.headers):
+                if response.status == 304:
+                    return response, None
+                response.raise_for_status()
+                return response, orjson.loads(await response.read())
+            delay = _LIMITER.backoff(attempt, response.headers.get("Retry-After"))
+        await asyncio.sleep(delay)
+
+
+async def _apost_graphql(session: "aiohttp.ClientSession", username: str, limit: int = TOP_REPOS_LIMIT) -> Tuple[None, List[dict]]:
+    """
+    Fetch the top repositories with a single GraphQL query.
+    
+    Args:
+        session (aiohttp.ClientSession): Open client session
+        username (str): GitHub username
+        limit (int): Number of top repos to return
+        
+    Returns:
+        tuple: (None, top repositories) - GraphQL responses carry no ETag
+    """
+    payload = {"query": TOP_REPOS_QUERY, "variables": {"login": username, "limit": limit}}
+    _, body = await _arequest(session, "POST", GITHUB_GRAPHQL_URL, json=payload)
+    return None, _parse_graphql_repos(username, body)
+
+
+async def _afetch_top_repos(session: "aiohttp.ClientSession", username: str) -> List[dict]:
+    """
+    Fetch top repositories via GraphQL when a token is set, else via REST.
+    
+    Args:
+        session (aiohttp.ClientSession): Open client session
+        username (str): GitHub username
+        
+    Returns:
+        list: Top repositories sorted by star count
+    """
+    username_key = username.lower()
+    if GITHUB_TOKEN:
+        return await _afetch_cached(
+            ("_fetch_top_repos_graphql", username_key),
+            lambda etag: _apost_graphql(session, username)
+        )
+    
+    repos_url = f"{GITHUB_API_BASE}/users/{username}/repos"
+    repos_data = await _afetch_cached(
+        ("_fetch_user_repos", username_key),
+        lambda etag: _afetch(session, repos_url, params=REPOS_PARAMS, etag=etag)
+    )
+    return _get_top_repos(repos_data, limit=TOP_REPOS_LIMIT)
+
+
+async def _afetch_cached(key: Tuple, fetch: Callable) -> Any:
+    """
+    Return the cached response for key, fetching and caching it on a miss.
+    
+    Args:
+        key (tuple): Cache key shared with the sync fetchers
+        fetch (callable): Takes the cached ETag (or None) and returns an
+            awaitable of (etag, value or _NOT_MODIFIED)
+        
+    Returns:
+        Decoded JSON response
+    """
+    value, etag = _cache_get(key)
+    if value is not _MISS:
+        return value
+    
+    etag, value = await fetch(etag)
+    if value is _NOT_MODIFIED:
+        value = _cache_revalidate(key)
+        if value is not _MISS:
+            return value
+        etag, value = await fetch(None)
+    
+    _cache_set(key, value, etag)
+    return value
+
+
+def _build_profile(username: str, user_data: dict, top_repos: List[dict]) -> dict:
+    """
+    Construct the profile response from API payloads.
+    
+    Args:
+        username (str): GitHub username
+        user_data (dict): Payload from the users endpoint
+        top_repos (list): Top repositories by star count
+        
+    Returns:
+        dict: Profile information
+    """
+    return {
+        "status": "success",
+        "username": username,
+        "name": user_data.get("name", "N/A"),
+        "bio": user_data.get("bio", "N/A"),
+        "avatar_url": user_data.get("avatar_url", ""),
+        "profile_url": user_data.get("html_url", ""),
+        "location": user_data.get("location", "N/A"),
+        "blog": user_data.get("blog", "N/A"),
+        "email": user_data.get("email", "N/A"),
+        "followers": user_data.get("followers", 0),
+        "following": user_data.get("following", 0),
+        "public_repos": user_data.get("public_repos", 0),
+        "created_at": user_data.get("created_at", ""),
+        "updated_at": user_data.get("updated_at", ""),
+        "top_repositories": top_repos,
+        "api_response_time": "N/A"
+    }
+
+
+def _validate_username(username: str) -> None:
+    """
+    Raise ValueError if the username is missing or malformed.
+    
+    Args:
+        username (str): GitHub username
+    """
+    if not username or not isinstance(username, str):
+        raise ValueError("GitHub username must be a non-empty string")
+    
+    # Validate username format (GitHub usernames are alphanumeric and hyphens)
+    if not _is_valid_github_username(username):
+        raise ValueError(
+            "Invalid GitHub username. Usernames can only contain alphanumeric characters and hyphens."
+        )
+
+
+def _event_loop_running() -> bool:
+    """
+    Check whether the current thread is already running an event loop.
+    
+    Returns:
+        bool: True if called from inside a running loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@ttl_cache(ttl=GITHUB_CACHE_TTL)
+def _fetch_user_data(username: str, etag: Optional[str] = None) -> Tuple[Optional[str], Any]:
     """
     Fetch user profile data from GitHub API.
     
     Args:
         username (str): GitHub username
+        etag (str, optional): ETag of the cached response
         
     Returns:
-        dict: User profile data
+        tuple: (ETag, user profile data or _NOT_MODIFIED)
     """
     url = f"{GITHUB_API_BASE}/users/{username}"
-    headers = _get_api_headers()
-    
-    response = requests.get(url, headers=headers, timeout=10)
-    response.raise_for_status()
+    headers = _get_api_headers(etag)
     
-    return response.json()
+    response = _request("GET", url, headers=headers)
+    return _conditional_result(response, etag)
 
 
-def _fetch_user_repos(username: str, per_page: int = 100) -> List[dict]:
+@ttl_cache(ttl=GITHUB_CACHE_TTL)
+def _fetch_user_repos(username: str, per_page: int = 100, etag: Optional[str] = None) -> Tuple[Optional[str], Any]:
     """
     Fetch user repositories from GitHub API.
     
     Args:
         username (str): GitHub username
         per_page (int): Number of repos per page (max 100)
+        etag (str, optional): ETag of the cached response
         
     Returns:
-        list: List of repository data
+        tuple: (ETag, list of repository data or _NOT_MODIFIED)
     """
     url = f"{GITHUB_API_BASE}/users/{username}/repos"
-    headers = _get_api_headers()
-    params = {
-        "per_page": per_page,
-        "sort": "updated",
-        "direction": "desc"
-    }
+    headers = _get_api_headers(etag)
+    params = {**REPOS_PARAMS, "per_page": per_page}
+    
+    response = _request("GET", url, headers=headers, params=params)
+    return _conditional_result(response, etag)
+
+
+@ttl_cache(ttl=GITHUB_CACHE_TTL)
+def _fetch_top_repos_graphql(username: str, limit: int = TOP_REPOS_LIMIT, etag: Optional[str] = None) -> Tuple[None, List[dict]]:
+    """
+    Fetch the top repositories with a single GraphQL query.
     
-    response = requests.get(url, headers=headers, params=params, timeout=10)
+    Sorting and field projection happen server-side, so the response holds
+    only the requested repositories instead of 100 full REST objects.
+    Requires GITHUB_TOKEN.
+    
+    Args:
+        username (str): GitHub username
+        limit (int): Number of top repos to return
+        etag (str, optional): Unused; GraphQL responses carry no ETag
+        
+    Returns:
+        tuple: (None, top repositories)
+    """
+    payload = {"query": TOP_REPOS_QUERY, "variables": {"login": username, "limit": limit}}
+    
+    response = _request("POST", GITHUB_GRAPHQL_URL, json=payload)
     response.raise_for_status()
+    return None, _parse_graphql_repos(username, orjson.loads(response.content))
+
+
+def _fetch_top_repos(username: str) -> List[dict]:
+    """
+    Fetch top repositories via GraphQL when a token is set, else via REST.
     
-    return response.json()
+    Args:
+        username (str): GitHub username
+        
+    Returns:
+        list: Top repositories sorted by star count
+    """
+    if GITHUB_TOKEN:
+        return _fetch_top_repos_graphql(username)
+    return _get_top_repos(_fetch_user_repos(username), limit=TOP_REPOS_LIMIT)
+
+
+def _cached_top_repos(username_key: str) -> Any:
+    """
+    Look up cached top repositories for a lowercased username.
+    
+    Args:
+        username_key (str): Lowercased GitHub username
+        
+    Returns:
+        list: Top repositories, or _MISS if not cached
+    """
+    if GITHUB_TOKEN:
+        return _cache_get(("_fetch_top_repos_graphql", username_key))[0]
+    repos_data = _cache_get(("_fetch_user_repos", username_key))[0]
+    if repos_data is _MISS:
+        return _MISS
+    return _get_top_repos(repos_data, limit=TOP_REPOS_LIMIT)
+
+
+def _parse_graphql_repos(username: str, payload: dict) -> List[dict]:
+    """
+    Convert a GraphQL repositories payload to the top repository format.
+    
+    Args:
+        username (str): GitHub username
+        payload (dict): Decoded GraphQL response
+        
+    Returns:
+        list: Top repositories
+        
+    Raises:
+        ValueError: If the user does not exist
+    """
+    user = (payload.get("data") or {}).get("user")
+    if user is None:
+        raise ValueError(f"GitHub user '{username}' not found")
+    
+    return [
+        {
+            "name": node.get("name", ""),
+            "url": node.get("url", ""),
+            "description": node.get("description", ""),
+            "stars": node.get("stargazerCount", 0),
+            "forks": node.get("forkCount", 0),
+            "language": (node.get("primaryLanguage") or {}).get("name", "N/A"),
+            "updated_at": node.get("updatedAt", "")
+        }
+        for node in user["repositories"]["nodes"]
+    ]
+
+
+def _request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a rate-limited request, backing off on 403/429 rate-limit responses.
+    
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+        **kwargs: Extra request arguments
+        
+    Returns:
+        requests.Response: Final response
+    """
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        _LIMITER.wait()
+        response = _SESSION.request(method, url, timeout=GITHUB_API_TIMEOUT, **kwargs)
+        _LIMITER.update(response.headers)
+        if attempt == RATE_LIMIT_MAX_RETRIES or not _is_rate_limited(response.status_code, response.headers):
+            return response
+        time.sleep(_LIMITER.backoff(attempt, response.headers.get("Retry-After")))
+
+
+def _is_rate_limited(status: int, headers) -> bool:
+    """
+    Check whether a response was rejected by the primary or secondary rate limit.
+    
+    Args:
+        status (int): HTTP status code
+        headers: Response headers
+        
+    Returns:
+        bool: True for 429, or 403 with an exhausted quota or Retry-After
+    """
+    if status == 429:
+        return True
+    return status == 403 and (headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers)
+
+
+def _conditional_result(response: requests.Response, etag: Optional[str]) -> Tuple[Optional[str], Any]:
+    """
+    Unpack a conditional GitHub API response.
+    
+    A 304 response carries no body and does not count against the rate limit.
+    
+    Args:
+        response (requests.Response): API response
+        etag (str, optional): ETag that was sent as If-None-Match
+        
+    Returns:
+        tuple: (ETag, decoded JSON response or _NOT_MODIFIED)
+    """
+    if response.status_code == 304:
+        return etag, _NOT_MODIFIED
+    response.raise_for_status()
+    return response.headers.get("ETag"), orjson.loads(response.content)
 
 
 def _get_top_repos(repos: List[dict], limit: int = 3) -> List[dict]:
@@ -131,12 +714,12 @@ def _get_top_repos(repos: List[dict], limit: int = 3) -> List[dict]:
     Returns:
         list: Top repositories sorted by star count
     """
-    # Sort by star count (descending)
-    sorted_repos = sorted(repos, key=lambda x: x.get("stargazers_count", 0), reverse=True)
+    # Select the highest star counts without sorting the whole list
+    top = heapq.nlargest(limit, repos, key=lambda x: x.get("stargazers_count", 0))
     
     # Extract relevant information for top repos
     top_repos = []
-    for repo in sorted_repos[:limit]:
+    for repo in top:
         top_repos.append({
             "name": repo.get("name", ""),
             "url": repo.get("html_url", ""),
@@ -150,18 +733,127 @@ def _get_top_repos(repos: List[dict], limit: int = 3) -> List[dict]:
     return top_repos
 
 
-def _get_api_headers() -> dict:
+def _get_api_headers(etag: Optional[str] = None) -> dict:
     """
     Get headers for GitHub API requests.
     Includes User-Agent for API compatibility.
     
+    Args:
+        etag (str, optional): ETag to send as If-None-Match
+    
     Returns:
         dict: Headers for API requests
     """
-    return {
+    headers = {
         "User-Agent": "AI-Resume-Maker-Backend",
         "Accept": "application/vnd.github.v3+json"
     }
+    if GITHUB_TOKEN:
+        headers["Authorization"] = f"bearer {GITHUB_TOKEN}"
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by the sync fetchers.
+    
+    Keep-alive connections skip the TCP/TLS handshake on subsequent requests,
+    and transient gateway errors are retried with backoff.
+    
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    session.headers.update(_get_api_headers())
+    return session
+
+
+# Shared session for GitHub API requests
+_SESSION = _create_session()
+
+
+class _RateLimiter:
+    """
+    Track GitHub's X-RateLimit headers and pace requests to stay within budget.
+    """
+    
+    def __init__(self, threshold: int = RATE_LIMIT_THRESHOLD, max_wait: float = RATE_LIMIT_MAX_WAIT):
+        self.remaining: Optional[int] = None
+        self.reset_ts = 0.0
+        self.threshold = threshold
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+    
+    def update(self, headers) -> None:
+        """
+        Record the quota reported by a response.
+        
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self.lock:
+            self.remaining = int(remaining)
+            self.reset_ts = float(reset)
+    
+    def delay(self) -> float:
+        """
+        Seconds to wait before the next request.
+        
+        Returns:
+            float: 0 while enough quota remains, else the time until reset
+            
+        Raises:
+            Exception: If the reset is further away than max_wait
+        """
+        with self.lock:
+            if self.remaining is None or self.remaining >= self.threshold:
+                return 0.0
+            wait = self.reset_ts - time.time()
+        if wait <= 0:
+            return 0.0
+        if wait > self.max_wait:
+            raise Exception(f"GitHub API rate limit exhausted; resets in {int(wait)} seconds")
+        return wait
+    
+    def wait(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire(self) -> None:
+        """Sleep until a request may be sent."""
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Delay before retrying a rate-limited request.
+        
+        Args:
+            attempt (int): Zero-based retry attempt
+            retry_after (str, optional): Retry-After header value
+            
+        Returns:
+            float: Seconds to sleep (exponential with jitter, capped at 60)
+        """
+        if retry_after and retry_after.isdigit():
+            return min(60.0, float(retry_after))
+        return min(60.0, 0.5 * 2 ** attempt) + random.random()
+
+
+# Shared rate-limit state for all GitHub API requests
+_LIMITER = _RateLimiter()
 
 
 def _is_valid_github_username(username: str) -> bool:
@@ -177,31 +869,7 @@ def _is_valid_github_username(username: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    if not username or len(username) < 1:
-        return False
-    
-    # Username must be between 1 and 39 characters
-    if len(username) > 39:
-        return False
-    
-    # Cannot start with hyphen
-    if username.startswith('-'):
-        return False
-    
-    # Cannot end with hyphen
-    if username.endswith('-'):
-        return False
-    
-    # Cannot have consecutive hyphens
-    if '--' in username:
-        return False
-    
-    # Can only contain alphanumeric and hyphens
-    import re
-    if not re.match(r'^[a-zA-Z0-9-]+$', username):
-        return False
-    
-    return True
+    return bool(username) and _USERNAME_RE.fullmatch(username) is not None
 
 
 def get_user_stats(username: str) -> dict:
@@ -5,6 +5,18 @@ Currently implements mock data structure for LinkedIn profiles.
 In the future, this can be extended with actual web scraping or LinkedIn API integration.
 """
 
+import re
+
+
+# Any URL on the LinkedIn domain
+_LINKEDIN_HOST_RE = re.compile(r'linkedin\.com', re.I)
+
+# Profile, company or job URL on the LinkedIn domain
+_LINKEDIN_RE = re.compile(r'linkedin\.com/(in|company|jobs)/', re.I)
+
+# Slug following /in/, /company/ or /jobs/
+_LINKEDIN_SLUG_RE = re.compile(r'/(?:in|company|jobs)/([^/?#]+)', re.I)
+
 
 def parse_linkedin_profile(url: str) -> dict:
     """
@@ -26,7 +38,7 @@ def parse_linkedin_profile(url: str) -> dict:
         raise ValueError("LinkedIn URL must be a string")
     
     # Validate that it's a LinkedIn URL
-    if "linkedin.com" not in url.lower():
+    if not _LINKEDIN_HOST_RE.search(url):
         raise ValueError("Invalid LinkedIn URL. Must contain 'linkedin.com'")
     
     # Extract username or profile identifier from URL
@@ -74,14 +86,12 @@ def _extract_linkedin_identifier(url: str) -> str:
         str: Extracted profile identifier
     """
     try:
-        # Remove trailing slashes
-        url = url.rstrip('/')
+        match = _LINKEDIN_SLUG_RE.search(url)
+        if match:
+            return match.group(1)
         
-        # Extract the last part of the URL (profile slug)
-        parts = url.split('/')
-        identifier = parts[-1] if parts else "unknown"
-        
-        return identifier
+        # Fall back to the last part of the URL
+        return url.rstrip('/').rsplit('/', 1)[-1] or "unknown"
     except Exception:
         return "unknown"
 
@@ -99,17 +109,5 @@ def validate_linkedin_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    url_lower = url.lower()
-    
-    # Check if it's a LinkedIn URL
-    if "linkedin.com" not in url_lower:
-        return False
-    
-    # Check for valid LinkedIn URL patterns
-    valid_patterns = [
-        "/in/",      # LinkedIn profile
-        "/company/", # LinkedIn company
-        "/jobs/",    # LinkedIn job
-    ]
-    
-    return any(pattern in url_lower for pattern in valid_patterns)
+    # LinkedIn profile, company or job URL
+    return _LINKEDIN_RE.search(url) is not None
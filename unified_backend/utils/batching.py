@@ -0,0 +1,110 @@
+# Micro-batching for Model Inference
+"""
+Groups concurrent requests into batches so a model handles many inputs per call.
+
+A MicroBatcher is created per model in the app's lifespan. Endpoints call
+`await batcher.submit(item)`; a background task collects items until
+`max_batch` is reached or `max_wait_ms` has passed since the first one,
+runs the blocking handler once in an executor, and resolves each caller's
+future with its own result.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Set
+
+
+class MicroBatcher:
+    """
+    Collect items submitted within a short window into one handler call.
+    
+    Args:
+        handler: Blocking function taking a list of items and returning a
+                 list of results in the same order
+        max_batch: Maximum number of items per handler call
+        max_wait_ms: Longest time the first item in a batch waits for others
+        executor: Executor for the handler (None = loop's default executor)
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], List[Any]],
+        max_batch: int = 8,
+        max_wait_ms: float = 15,
+        executor: Optional[Executor] = None,
+    ):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+    
+    def start(self) -> None:
+        """Start the background collector on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._collector = asyncio.create_task(self._collect())
+    
+    async def stop(self) -> None:
+        """Stop collecting and wait for batches already dispatched."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+        
+        Raises:
+            Whatever the handler raised for the batch containing the item
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Dispatch without waiting so the next batch can fill meanwhile
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _dispatch(self, batch: list) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.handler, items
+            )
+            # A short or long result list can't be matched back to callers;
+            # fail them all rather than leave some futures hanging forever
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
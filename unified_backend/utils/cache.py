@@ -0,0 +1,131 @@
+# Response Caching
+"""
+Response cache backed by fastapi-cache2.
+
+Uses Redis when REDIS_URL is configured so entries are shared across
+workers, and an in-process backend otherwise. If fastapi-cache2 is not
+installed, the `cache` decorator is a no-op and lookups always miss.
+"""
+import hashlib
+from collections import Counter
+from typing import Dict, Optional
+
+from utils.config import REDIS_URL, CACHE_PREFIX
+
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.decorator import cache
+except ImportError:  # Caching disabled
+    FastAPICache = None
+
+    def cache(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Per-process lookup counters, keyed by namespace
+_hits: Counter = Counter()
+_misses: Counter = Counter()
+
+
+def init_cache() -> str:
+    """
+    Initialize the cache backend.
+    
+    Returns:
+        Backend description for the startup log
+    """
+    if FastAPICache is None:
+        return "disabled (fastapi-cache2 not installed)"
+    
+    if REDIS_URL:
+        from redis import asyncio as aioredis
+        from fastapi_cache.backends.redis import RedisBackend
+        
+        FastAPICache.init(RedisBackend(aioredis.from_url(REDIS_URL)), prefix=CACHE_PREFIX)
+        return "redis"
+    
+    FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
+    return "in-memory"
+
+
+def body_key(*parts: str) -> str:
+    """
+    Build a cache key from request body fields.
+    
+    Args:
+        *parts: Field values that determine the response
+    
+    Returns:
+        128-bit BLAKE2b hex digest of the parts
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+async def get_cached(namespace: str, key: str) -> Optional[bytes]:
+    """
+    Look up a cached response body.
+    
+    Args:
+        namespace: Cache namespace (e.g. "ats")
+        key: Key within the namespace
+    
+    Returns:
+        Cached bytes, or None on a miss
+    """
+    if FastAPICache is None:
+        return None
+    value = await FastAPICache.get_backend().get(f"{FastAPICache.get_prefix()}:{namespace}:{key}")
+    if value is None:
+        _misses[namespace] += 1
+    else:
+        _hits[namespace] += 1
+    return value
+
+
+async def set_cached(namespace: str, key: str, value: bytes, expire: int) -> None:
+    """
+    Store a response body.
+    
+    Args:
+        namespace: Cache namespace (e.g. "ats")
+        key: Key within the namespace
+        value: Serialized response body
+        expire: Time to live in seconds
+    """
+    if FastAPICache is None:
+        return
+    await FastAPICache.get_backend().set(f"{FastAPICache.get_prefix()}:{namespace}:{key}", value, expire)
+
+
+def cache_stats(*namespaces: str) -> Dict[str, Dict[str, float]]:
+    """
+    Report lookup counters for this worker process.
+    
+    Args:
+        *namespaces: Namespaces to report (all seen so far if omitted)
+    
+    Returns:
+        {namespace: {"hits", "misses", "hit_rate"}}
+    """
+    stats = {}
+    for namespace in namespaces or sorted(_hits.keys() | _misses.keys()):
+        hits, misses = _hits[namespace], _misses[namespace]
+        lookups = hits + misses
+        stats[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+    return stats
+
+
+if FastAPICache is not None:
+    # In-process backend until the app's lifespan runs init_cache()
+    FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
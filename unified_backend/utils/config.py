@@ -11,14 +11,63 @@ DATA_DIR = BASE_DIR / "data"
 SAMPLES_DIR.mkdir(exist_ok=True)
 DATA_DIR.mkdir(exist_ok=True)
 
+# Server Configuration
+APP_ENV = os.getenv("APP_ENV", "development")  # development, production
+PORT = int(os.getenv("PORT", "8000"))
+# Worker processes. Each one loads its own Whisper models and io thread
+# pool, so the default stays at one; raise WEB_CONCURRENCY (also read by
+# gunicorn) only on hosts with memory or GPUs to spare
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Logging is kept quiet in production; per-request logging costs throughput
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING" if APP_ENV == "production" else "INFO").upper()
+
+# Thread pool for blocking work (per worker process)
+IO_POOL_WORKERS = int(os.getenv("IO_POOL_WORKERS", "64"))
+
+# Response Caching (Redis when REDIS_URL is set, otherwise in-process memory)
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_PREFIX = "tx"
+ATS_CACHE_TTL = 3600  # seconds
+QUESTIONS_CACHE_TTL = 600  # seconds
+TRANSCRIPTION_CACHE_TTL = 3600  # seconds
+AUDIO_SCORE_CACHE_TTL = 3600  # seconds
+
+# Rate limits per client address (slowapi/limits syntax)
+RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "600/minute")
+RATE_LIMIT_LLM = os.getenv("RATE_LIMIT_LLM", "30/minute")        # LLM-bound endpoints
+RATE_LIMIT_UPLOAD = os.getenv("RATE_LIMIT_UPLOAD", "300/minute")  # file uploads
+
+# Stale-while-revalidate cache for upstream-backed endpoints:
+# path -> minimum freshness in seconds. Entries are retained long after
+# going stale so they can be served when the upstream fails.
+RESPONSE_CACHE_POLICIES = {
+    "/resume/linkedin": 300,
+    "/resume/github": 300,
+}
+RESPONSE_CACHE_RETENTION = 86400  # seconds
+
+# Micro-batching of concurrent LLM calls (answer evaluation)
+EVAL_BATCH_SIZE = int(os.getenv("EVAL_BATCH_SIZE", "8"))
+EVAL_BATCH_WAIT_MS = int(os.getenv("EVAL_BATCH_WAIT_MS", "15"))
+
+# Micro-batching of concurrent Whisper transcriptions
+TRANSCRIBE_BATCH_SIZE = int(os.getenv("TRANSCRIBE_BATCH_SIZE", "8"))
+TRANSCRIBE_BATCH_WAIT_MS = int(os.getenv("TRANSCRIBE_BATCH_WAIT_MS", "20"))
+# Transcriptions admitted at once per worker; the rest wait instead of
+# piling onto the GPU
+MAX_CONCURRENT_TRANSCRIBE = int(os.getenv("MAX_CONCURRENT_TRANSCRIBE", "16"))
+
 # API Configuration
 API_TITLE = "AI Talent Platform - Unified Backend"
 API_VERSION = "2.0.0"
 API_DESCRIPTION = "Unified backend combining resume parsing, optimization, interview generation, and audio processing"
 
 # Supported file types
-ALLOWED_RESUME_EXTENSIONS = {".pdf", ".docx", ".txt"}
-ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".ogg"}
+ALLOWED_RESUME_EXTENSIONS = frozenset({".pdf", ".docx", ".txt"})
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg"})
+# Joined once for "Unsupported format" messages
+ALLOWED_AUDIO_EXTENSIONS_TEXT = ", ".join(sorted(ALLOWED_AUDIO_EXTENSIONS))
 
 # Pagination
 DEFAULT_PAGE_SIZE = 10
@@ -27,12 +76,26 @@ MAX_PAGE_SIZE = 100
 # File Upload Limits
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_AUDIO_SIZE = 50 * 1024 * 1024  # 50 MB
+MAX_RESUME_SIZE = MAX_FILE_SIZE
+# Uploads up to this size are also kept in memory and decoded from there
+SMALL_AUDIO_INLINE = 25 * 1024 * 1024  # 25 MB
 
-# CORS
-CORS_ORIGINS = ["*"]
+# CORS: explicit origins (comma-separated CORS_ORIGINS) and verbs let
+# browsers cache preflight responses for CORS_MAX_AGE seconds
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
+    if origin.strip()
+]
 CORS_ALLOW_CREDENTIALS = True
-CORS_ALLOW_METHODS = ["*"]
+CORS_ALLOW_METHODS = ["GET", "POST"]
 CORS_ALLOW_HEADERS = ["*"]
+CORS_MAX_AGE = 86400  # seconds
+
+# Response compression (brotli when installed and accepted, else gzip)
+COMPRESSION_MIN_SIZE = 1024  # bytes
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
 
 # Ollama Configuration
 OLLAMA_DEFAULT_MODEL = "mistral"
@@ -49,6 +112,19 @@ DEFAULT_DIFFICULTY = "medium"  # easy, medium, hard
 # Audio Processing
 AUDIO_SAMPLE_RATE = 16000
 AUDIO_CHUNK_DURATION = 30  # seconds
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+# Smaller model for metrics-only paths (/audio/analyze), int8-quantized on CPU
+WHISPER_FAST_MODEL = os.getenv("WHISPER_FAST_MODEL", "tiny")
+# Force a torch device for Whisper (e.g. "cpu", "cuda:1"); empty uses every
+# visible GPU, or the CPU if there are none
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "")
+# Concurrent transcription batches per GPU (one model instance per GPU)
+WHISPER_WORKERS_PER_DEVICE = int(os.getenv("WHISPER_WORKERS_PER_DEVICE", "1"))
+# Share of each GPU's memory this process may claim
+WHISPER_GPU_MEMORY_FRACTION = float(os.getenv("WHISPER_GPU_MEMORY_FRACTION", "0.9"))
+# Background sweep of stored uploads (interval 0 disables it)
+AUDIO_CLEANUP_INTERVAL = int(os.getenv("AUDIO_CLEANUP_INTERVAL", "3600"))  # seconds
+AUDIO_MAX_AGE = int(os.getenv("AUDIO_MAX_AGE", "86400"))  # seconds
 
 print(f"✅ Configuration loaded")
 print(f"   Base directory: {BASE_DIR}")
@@ -0,0 +1,35 @@
+# Shared FastAPI Dependencies
+from fastapi import Request
+
+from utils.batching import MicroBatcher
+
+
+def get_evaluation_batcher(request: Request) -> MicroBatcher:
+    """
+    Return the micro-batcher for interview answer evaluation.
+    
+    Usage:
+        async def endpoint(batcher: MicroBatcher = Depends(get_evaluation_batcher)):
+            result = await batcher.submit({"question": q, "answer": a})
+    """
+    return request.app.state.evaluation_batcher
+
+
+def get_transcription_batcher(request: Request) -> MicroBatcher:
+    """
+    Return the micro-batcher for Whisper transcription.
+    
+    Usage:
+        async def endpoint(batcher: MicroBatcher = Depends(get_transcription_batcher)):
+            result = await batcher.submit(audio_path)
+    """
+    return request.app.state.transcription_batcher
+
+
+def get_fast_transcription_batcher(request: Request) -> MicroBatcher:
+    """
+    Return the micro-batcher for the smaller int8 Whisper model.
+    
+    For endpoints that only need word-level metrics, not exact wording.
+    """
+    return request.app.state.fast_transcription_batcher
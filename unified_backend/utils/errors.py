@@ -0,0 +1,38 @@
+# Preserialized Error Responses
+"""
+Early validation failures return a body serialized once at import time
+instead of raising HTTPException, skipping exception construction and
+per-request JSON encoding.
+
+A fresh Response is built per request: middleware (CORS, compression)
+mutates response headers in place, so instances must not be shared.
+"""
+import orjson
+from fastapi.responses import Response
+
+
+def error_body(detail: str) -> bytes:
+    """
+    Serialize an error in FastAPI's {"detail": ...} shape.
+    
+    Args:
+        detail: Error message
+    
+    Returns:
+        JSON bytes
+    """
+    return orjson.dumps({"detail": detail})
+
+
+def error_response(body: bytes, status_code: int = 400) -> Response:
+    """
+    Wrap a preserialized error body in a response.
+    
+    Args:
+        body: Bytes from error_body()
+        status_code: HTTP status
+    
+    Returns:
+        JSON Response
+    """
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -0,0 +1,73 @@
+# Rate Limiting
+"""
+Per-client rate limiting backed by slowapi.
+
+Requests over the limit are rejected early with 429 and a Retry-After
+header instead of queueing on the event loop. Counters live in Redis when
+REDIS_URL is configured (shared across workers) and in process memory
+otherwise. If slowapi is not installed, `limiter.limit` is a no-op.
+
+Endpoints with their own limit need `request: Request` and
+`response: Response` parameters so slowapi can read the client address
+and attach rate limit headers:
+
+    @router.post("/rewrite")
+    @limiter.limit(RATE_LIMIT_LLM)
+    async def endpoint(request: Request, response: Response, payload: Model):
+"""
+from utils.config import REDIS_URL, RATE_LIMIT_DEFAULT
+
+try:
+    from slowapi import Limiter, _rate_limit_exceeded_handler
+    from slowapi.errors import RateLimitExceeded
+    from slowapi.middleware import SlowAPIASGIMiddleware
+    from slowapi.util import get_remote_address
+except ImportError:  # Rate limiting disabled
+    Limiter = None
+
+
+class _NoopLimiter:
+    """Stand-in when slowapi is not installed."""
+    
+    def limit(self, *args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+if Limiter is not None:
+    limiter = Limiter(
+        key_func=get_remote_address,
+        default_limits=[RATE_LIMIT_DEFAULT],
+        storage_uri=REDIS_URL or "memory://",
+        headers_enabled=True,
+    )
+else:
+    limiter = _NoopLimiter()
+
+
+def exempt(endpoint) -> None:
+    """
+    Exclude an endpoint from the default limits.
+    
+    Args:
+        endpoint: Route function or ASGI app object with __module__/__name__
+    """
+    if Limiter is not None:
+        limiter.exempt(endpoint)
+
+
+def install_rate_limiting(app) -> bool:
+    """
+    Register the limiter, its 429 handler and middleware on the app.
+    
+    Returns:
+        True if rate limiting is active, False if slowapi is not installed
+    """
+    if Limiter is None:
+        return False
+    
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.add_middleware(SlowAPIASGIMiddleware)
+    return True
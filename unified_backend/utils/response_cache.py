@@ -0,0 +1,146 @@
+# Stale-While-Revalidate Response Cache
+"""
+Middleware that caches successful responses from slow upstream-backed
+endpoints (LLM, LinkedIn/GitHub scrapers) and serves the last good response
+when the upstream fails.
+
+Each cached entry records when it was generated and when it goes stale.
+Fresh entries are returned directly (X-Cache: HIT). Stale entries are
+revalidated by calling the endpoint; if that returns a 5xx or raises, the
+stale body is served instead (X-Cache: STALE).
+
+Freshness is max(2 x response time, policy minimum), so slow endpoints
+stay cached longer. Entries are retained for RESPONSE_CACHE_RETENTION
+seconds to remain available as a fallback.
+"""
+import time
+from typing import Dict, List, Optional
+
+import orjson
+
+from utils.cache import body_key, get_cached, set_cached
+from utils.config import RESPONSE_CACHE_RETENTION
+
+_NAMESPACE = "swr"
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache responses for the paths in `policies`.
+    
+    Plain ASGI middleware: requests to other paths are passed straight
+    through without wrapping or buffering.
+    
+    Args:
+        app: ASGI app
+        policies: Path -> minimum freshness in seconds
+    """
+    
+    def __init__(self, app, policies: Dict[str, int]):
+        self.app = app
+        self.policies = policies
+    
+    async def __call__(self, scope, receive, send):
+        min_fresh = self.policies.get(scope["path"]) if scope["type"] == "http" else None
+        if min_fresh is None:
+            await self.app(scope, receive, send)
+            return
+        
+        request_body = await _read_body(receive)
+        key = body_key(
+            scope["method"],
+            scope["path"],
+            scope["query_string"].decode("latin-1"),
+            request_body.decode("latin-1"),
+        )
+        entry = await get_cached(_NAMESPACE, key)
+        meta, body = _unpack(entry) if entry is not None else (None, None)
+        
+        if meta is not None and time.time() < meta["stale_after"]:
+            await _send_cached(send, meta, body, b"HIT")
+            return
+        
+        # Run the endpoint with the already-read body, capturing its response
+        replayed = False
+        
+        async def replay_receive():
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+        
+        start: Optional[dict] = None
+        chunks: List[bytes] = []
+        
+        async def capture_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except Exception:
+            if meta is not None:
+                await _send_cached(send, meta, body, b"STALE")
+                return
+            raise
+        elapsed = time.perf_counter() - started
+        
+        status = start["status"]
+        if status >= 500 and meta is not None:
+            await _send_cached(send, meta, body, b"STALE")
+            return
+        
+        body = b"".join(chunks)
+        if status == 200:
+            now = time.time()
+            media_type = next(
+                (value for name, value in start["headers"] if name == b"content-type"),
+                b"application/json",
+            )
+            meta = {
+                "generated_at": now,
+                "stale_after": now + max(elapsed * 2, min_fresh),
+                "status": status,
+                "media_type": media_type.decode("latin-1"),
+            }
+            await set_cached(_NAMESPACE, key, _pack(meta, body), RESPONSE_CACHE_RETENTION)
+            start["headers"] = [*start["headers"], (b"x-cache", b"MISS")]
+        
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _pack(meta: dict, body: bytes) -> bytes:
+    return orjson.dumps(meta) + b"\n" + body
+
+
+def _unpack(entry: bytes):
+    header, _, body = entry.partition(b"\n")
+    return orjson.loads(header), body
+
+
+async def _send_cached(send, meta: dict, body: bytes, status: bytes) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": meta["status"],
+        "headers": [
+            (b"content-type", meta["media_type"].encode("latin-1")),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-cache", status),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})